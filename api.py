@@ -6,15 +6,41 @@ Polymarket API quickstart (read-only):
 - Fetch recent trades (Data-API /trades)
 - Compute sum of YES prices via /prices (best ask)
 
-Requires: Python 3.10+, `pip install requests` (optional: `pandas`)
+Requires: Python 3.10+, `pip install requests numpy` (optional: `pandas`)
 No auth used (read-only). Placing orders requires L2 auth (not included).
+HTTP goes through pooled per-host sessions (src/transport.py); every helper
+accepts session= to use a different one. Run from the repo root.
 """
 
 from __future__ import annotations
+import itertools
 import math
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, List, Any, Iterable, Tuple, Optional
 import requests
 
+from src.cache import TTLCache, shared_cache
+from src.conditional import ConditionalCache, default_conditional_cache
+from src.crawler import END_CURSOR, SimplifiedMarketsCrawler
+from src.deadline import Deadline, DeadlineExceeded, bounded
+from src.depth import SetFill, scan_markets
+from src.fastjson import response_json
+from src.hedging import Hedger, default_hedger
+from src.jsonstream import JsonArrayStream
+from src.incremental import IncrementalArbDetector
+from src.models import markets_from_gamma, token_fields, tokens_from_simplified
+from src.negrisk import EventSum, NegRiskIndex, event_sizes_from_gamma
+from src.orderbook import OrderBook
+from src.prefilter import Prescreen, prescreen
+from src.projection import Projection
+from src.resilience import endpoint_key
+from src.scheduler import ScannerDaemon
+from src.topk import TwoSidedTopK
+from src.transport import default_sessions
+from src.vectorized import SetEdges, TokenGroups, market_set_edges, sum_by_market, two_sided_edges
+
 try:
     import pandas as pd  # optional; script works without it
 except Exception:
@@ -33,25 +59,96 @@ def list_markets_gamma(
     cursor: Optional[str] = None,
     closed: bool = False,
     active: Optional[bool] = True,
+    order: Optional[str] = None,
+    ascending: bool = False,
+    session: Optional[requests.Session] = None,
+    conditional: bool | ConditionalCache = True,
+    projection: Optional[Projection] = None,
 ) -> Dict[str, Any]:
     """
     GET /markets from Gamma (handy for discovery/metadata).
     Use closed=false to avoid archived markets; active=True to focus on live ones.
+    order="volume24hr" (with ascending=False) returns the busiest markets first.
+    Requests are conditional (src/conditional.py): the shared cache replays the last
+    ETag/Last-Modified for the same params and a 304 returns the previously decoded
+    (shared, read-only) payload. conditional=False always downloads the full body.
+    With a `projection` (src/projection.py), each market keeps only its resident
+    fields and the description, images and events go to its side store; the
+    projected page is what the conditional cache keeps.
     """
     params: Dict[str, Any] = {"limit": limit, "closed": str(closed).lower()}
     if active is not None:
         params["active"] = str(active).lower()
+    if order:
+        params["order"] = order
+        params["ascending"] = str(ascending).lower()
     if cursor:
         params["cursor"] = cursor
-    r = requests.get(f"{GAMMA}/markets", params=params, timeout=20)
+    s = session or default_sessions().gamma
+    transform = projection.project_all if projection is not None else None
+    if conditional is not False:
+        validators = default_conditional_cache() if conditional is True else conditional
+        return validators.get_json(s, f"{GAMMA}/markets", params=params, transform=transform, timeout=20)
+    r = s.get(f"{GAMMA}/markets", params=params, timeout=20)
+    r.raise_for_status()
+    payload = response_json(r)
+    return transform(payload) if transform is not None else payload
+
+
+def list_events_gamma(
+    limit: int = 100,
+    offset: int = 0,
+    closed: bool = False,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
+    """
+    GET /events from Gamma. Each event carries its full `markets` list, which is
+    what tells how many markets a neg-risk event really has.
+    """
+    params = {"limit": limit, "offset": offset, "closed": str(closed).lower()}
+    s = session or default_sessions().gamma
+    r = s.get(f"{GAMMA}/events", params=params, timeout=20)
     r.raise_for_status()
-    return r.json()
+    data = response_json(r)
+    return data if isinstance(data, list) else (data.get("data") or [])
+
+
+def neg_risk_event_sizes(
+    page_size: int = 100,
+    max_pages: int = 50,
+    session: Optional[requests.Session] = None,
+    cache: bool | TTLCache = True,
+) -> Dict[str, int]:
+    """
+    Live-market count of every neg-risk event, keyed like src.negrisk.event_key.
+    Pages through Gamma /events until a short page (or max_pages).
+    Membership changes slowly, so the result is cached (shared "event_sizes" cache,
+    5 minutes; see src/cache.py) and polling callers do not re-download every
+    /events page each sweep. cache=False always fetches. The returned dict is
+    shared; do not mutate it.
+    """
+    def load() -> Dict[str, int]:
+        sizes: Dict[str, int] = {}
+        for page in range(max_pages):
+            events = list_events_gamma(limit=page_size, offset=page * page_size, session=session)
+            sizes.update(event_sizes_from_gamma(events))
+            if len(events) < page_size:
+                break
+        return sizes
+
+    if cache is False:
+        return load()
+    store = shared_cache("event_sizes") if cache is True else cache
+    return store.get_or_load((page_size, max_pages, session), load)
 
 
 # ------------------------------------------------------------
 # 2) CLOB simplified-markets (stable shape; includes token_ids)
 # ------------------------------------------------------------
-def list_simplified_markets(next_cursor: Optional[str] = None) -> Dict[str, Any]:
+def list_simplified_markets(
+    next_cursor: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
     """
     GET /simplified-markets from CLOB (paginated via next_cursor).
     Returns { "data": [SimplifiedMarket...], "next_cursor": "..." }
@@ -60,27 +157,94 @@ def list_simplified_markets(next_cursor: Optional[str] = None) -> Dict[str, Any]
     params: Dict[str, Any] = {}
     if next_cursor:
         params["next_cursor"] = next_cursor
-    r = requests.get(f"{CLOB}/simplified-markets", params=params, timeout=20)
+    s = session or default_sessions().clob
+    r = s.get(f"{CLOB}/simplified-markets", params=params, timeout=20)
     r.raise_for_status()
-    return r.json()
+    return response_json(r)
 
 
-def clob_simplified_pages(max_pages: int = 2) -> Iterable[Dict[str, Any]]:
+def clob_simplified_pages(
+    max_pages: int = 2,
+    session: Optional[requests.Session] = None,
+) -> Iterable[Dict[str, Any]]:
     """Yield up to max_pages pages from /simplified-markets."""
     cursor = None
     for _ in range(max_pages):
-        page = list_simplified_markets(cursor)
+        page = list_simplified_markets(cursor, session=session)
         yield page
         cursor = page.get("next_cursor")
         if not cursor:
             break
 
 
-def flatten_tokens_from_simplified(page_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+def iter_simplified_markets(
+    max_pages: Optional[int] = None,
+    next_cursor: Optional[str] = None,
+    chunk_size: int = 65536,
+    session: Optional[requests.Session] = None,
+) -> Iterable[Dict[str, Any]]:
+    """
+    Stream /simplified-markets market by market across pages.
+    Each page's "data" array is parsed incrementally as it downloads
+    (src/jsonstream.py), so the first markets are available before the page has
+    finished; its next_cursor is read once the page is consumed.
+    """
+    s = session or default_sessions().clob
+    cursor = next_cursor
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        params = {"next_cursor": cursor} if cursor else {}
+        r = s.get(f"{CLOB}/simplified-markets", params=params, timeout=20, stream=True)
+        try:
+            r.raise_for_status()
+            stream = JsonArrayStream(r.iter_content(chunk_size), key="data")
+            yield from stream
+        finally:
+            r.close()
+        pages += 1
+        cursor = stream.fields.get("next_cursor")
+        if not cursor or cursor == END_CURSOR:
+            break
+
+
+def crawl_simplified_markets(
+    checkpoint_path: str = ".simplified_markets_checkpoint.json",
+    max_pages: Optional[int] = None,
+    changed_only: bool = False,
+    session: Optional[requests.Session] = None,
+    crawler: Optional[SimplifiedMarketsCrawler] = None,
+) -> Iterable[Dict[str, Any]]:
+    """
+    Walk every /simplified-markets page, resuming from the checkpointed cursor.
+    By default every page is yielded, so the full token universe can be rebuilt.
+    With changed_only=True, only pages whose content hash differs from the one
+    recorded in the checkpoint by the previous crawl are yielded
+    (see src/crawler.py::SimplifiedMarketsCrawler).
+    Without `crawler`, one crawler per checkpoint path (and session) is kept
+    across calls, so unchanged pages are served from the pages it already
+    decoded instead of being decoded again. Pass your own crawler to control
+    its lifetime.
+    """
+    if crawler is None:
+        key = (os.path.abspath(checkpoint_path), session)
+        crawler = _crawlers.get(key)
+        if crawler is None:
+            crawler = _crawlers[key] = SimplifiedMarketsCrawler(checkpoint_path, session=session)
+    yield from crawler.crawl(max_pages=max_pages, changed_only=changed_only)
+
+
+# Crawlers reused by crawl_simplified_markets, by (checkpoint path, session).
+_crawlers: Dict[Tuple[str, Optional[requests.Session]], SimplifiedMarketsCrawler] = {}
+
+
+def flatten_tokens_from_simplified(page_json: Dict[str, Any], typed: bool = False) -> List[Any]:
     """
     Flatten a CLOB simplified-markets page -> list of tokens with market grouping.
     Output rows: {condition_id, active, closed, token_id, label}
+    typed=True returns slotted src.models.Token objects with the same fields (+ price).
     """
+    if typed:
+        return tokens_from_simplified(page_json)
     data = page_json.get("data", [])
     rows: List[Dict[str, Any]] = []
     for m in data:
@@ -104,52 +268,216 @@ def flatten_tokens_from_simplified(page_json: Dict[str, Any]) -> List[Dict[str,
 # -------------------------------------
 # 3) Order book + prices (CLOB, public)
 # -------------------------------------
-def get_book(token_id: str) -> Dict[str, Any]:
+def _hedged(hedge: bool | Hedger, url: str, fn):
+    """Run fn() directly, or through a Hedger (True = the shared default_hedger())."""
+    if not hedge:
+        return fn()
+    hedger = default_hedger() if hedge is True else hedge
+    return hedger.call(endpoint_key(url), fn)
+
+
+def get_book(
+    token_id: str,
+    session: Optional[requests.Session] = None,
+    hedge: bool | Hedger = False,
+    deadline: Optional[Deadline] = None,
+    cache: bool | TTLCache = False,
+) -> Dict[str, Any]:
     """
     GET /book for a single token_id (summary + levels).
     Returns {"error": "not_found"} if 404, rather than raising.
+    cache=True serves books from the shared "book" TTLCache (src/cache.py, 0.5s
+    by default) and lets concurrent callers for one token share a request; pass
+    a TTLCache for a different staleness tolerance. Cached books are shared: do
+    not mutate them.
+    hedge=True (or a src.hedging.Hedger) re-issues the request once it runs past
+    the recent p95 latency of /book and returns whichever copy answers first.
+    deadline (src.deadline.Deadline) caps the timeout at the time left and raises
+    DeadlineExceeded instead of starting the request once it has passed.
     """
-    r = requests.get(f"{CLOB}/book", params={"token_id": token_id}, timeout=20)
+    if cache is not False:
+        book_cache = shared_cache("book") if cache is True else cache
+        return book_cache.get_or_load(
+            token_id, lambda: get_book(token_id, session=session, hedge=hedge, deadline=deadline)
+        )
+    s = session or default_sessions().clob
+    url = f"{CLOB}/book"
+    r = _hedged(hedge, url, lambda: bounded(deadline, s.get, url, params={"token_id": token_id}))
     if r.status_code == 404:
         return {"error": "not_found", "token_id": token_id}
     r.raise_for_status()
-    return r.json()
+    return response_json(r)
 
 
-def get_best_prices(token_ids: List[str], side: str = "BUY", batch_size: int = 50) -> Dict[str, Dict[str, Any]]:
+def get_order_book(
+    token_id: str,
+    tick_size: Optional[float] = None,
+    session: Optional[requests.Session] = None,
+) -> Optional[OrderBook]:
+    """
+    GET /book and load it into a tick-indexed src.orderbook.OrderBook.
+    tick_size defaults to the snapshot's tick_size (Gamma: orderPriceMinTickSize).
+    Returns None if the book is not found.
+    """
+    book = get_book(token_id, session=session)
+    if "error" in book:
+        return None
+    return OrderBook.from_snapshot(book, tick_size=tick_size)
+
+
+def _post_prices_batch(
+    batch: List[str],
+    sides: Tuple[str, ...],
+    session: requests.Session,
+    hedge: bool | Hedger = False,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """POST one /prices batch and return {asset_id: {side: price_string}}."""
+    payload = {"params": [{"token_id": tid, "side": side} for tid in batch for side in sides]}
+    url = f"{CLOB}/prices"
+    r = _hedged(hedge, url, lambda: bounded(deadline, session.post, url, json=payload))
+    r.raise_for_status()
+    data = response_json(r) or {}
+    # API returns {asset_id: {side: price_string}}
+    return data if isinstance(data, dict) else {}
+
+
+def get_best_prices(
+    token_ids: List[str],
+    side: str | Tuple[str, ...] = "BUY",
+    batch_size: int = 50,
+    max_workers: int = 1,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    hedge: bool | Hedger = False,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Dict[str, Any]]:
     """
     POST /prices for batches of token_ids.
     side="BUY" -> best ask (what you'd pay), side="SELL" -> best bid.
     Returns mapping: { token_id: { "BUY": "0.5123" } } (string numbers).
+    side=("BUY", "SELL") asks for both sides of every token in the same batched
+    payload -> { token_id: { "BUY": ask, "SELL": bid } } for one sweep's requests
+    (batch_size counts tokens, so such payloads carry 2 * batch_size params).
+
+    max_workers > 1 posts batches concurrently with at most max_workers requests
+    in flight; results are still merged in batch order. In concurrent mode a
+    failed batch does not abort the sweep: its tokens are left out of the result
+    and (batch, exception) is appended to `errors` if a list is given.
+    With max_workers=1 batches go out one by one and the first failure raises.
+    Keep the session's pool size >= max_workers so every worker gets a warm connection.
+    hedge=True (or a src.hedging.Hedger) duplicates any batch still outstanding
+    past the recent p95 /prices latency and keeps the first answer.
+    With a deadline every request's timeout is cut to the time left; in concurrent
+    mode batches still unanswered when it passes are abandoned and recorded in
+    `errors` as DeadlineExceeded, so the call returns on time.
     """
     out: Dict[str, Dict[str, Any]] = {}
     if not token_ids:
         return out
-    for i in range(0, len(token_ids), batch_size):
-        batch = token_ids[i : i + batch_size]
-        payload = {"params": [{"token_id": tid, "side": side} for tid in batch]}
-        r = requests.post(f"{CLOB}/prices", json=payload, timeout=20)
-        r.raise_for_status()
-        data = r.json() or {}
-        # API returns {asset_id: {side: price_string}}
-        for asset_id, sides in (data.items() if isinstance(data, dict) else []):
-            out[str(asset_id)] = sides
+    s = session or default_sessions().clob
+    sides = (side,) if isinstance(side, str) else tuple(side)
+    batches = [token_ids[i : i + batch_size] for i in range(0, len(token_ids), batch_size)]
+
+    if max_workers <= 1:
+        for batch in batches:
+            for asset_id, prices in _post_prices_batch(batch, sides, s, hedge, deadline).items():
+                out.setdefault(str(asset_id), {}).update(prices)
+        return out
+
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(batches)))
+    try:
+        futures = [pool.submit(_post_prices_batch, batch, sides, s, hedge, deadline) for batch in batches]
+        for batch, fut in zip(batches, futures):
+            try:
+                data = fut.result(timeout=None if deadline is None else deadline.remaining())
+            except Exception as e:  # isolate the failed batch, keep the sweep going
+                if not fut.done():  # still running at the deadline: abandon it
+                    fut.cancel()
+                    e = DeadlineExceeded("/prices batch unanswered at the deadline")
+                if errors is not None:
+                    errors.append((batch, e))
+                continue
+            for asset_id, prices in data.items():
+                out.setdefault(str(asset_id), {}).update(prices)
+    finally:
+        # without a deadline, wait for every batch as before; with one, do not
+        # let a stuck socket hold the caller past it
+        pool.shutdown(wait=deadline is None, cancel_futures=True)
     return out
 
 
+def iter_best_prices(
+    token_ids: List[str],
+    side: str | Tuple[str, ...] = "BUY",
+    batch_size: int = 50,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    hedge: bool | Hedger = False,
+    deadline: Optional[Deadline] = None,
+) -> Iterable[Tuple[List[str], Dict[str, Dict[str, Any]]]]:
+    """
+    Like get_best_prices, but yields (batch, prices) as each /prices batch completes
+    (completion order), keeping at most max_workers batches in flight.
+    A failed batch yields (batch, {}) and is recorded in `errors` if a list is given.
+    Once the deadline passes, batches still in flight or not yet sent fail the same
+    way (DeadlineExceeded), so every batch is still yielded exactly once.
+    """
+    if not token_ids:
+        return
+    s = session or default_sessions().clob
+    sides = (side,) if isinstance(side, str) else tuple(side)
+    pending = iter([token_ids[i : i + batch_size] for i in range(0, len(token_ids), batch_size)])
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        in_flight: Dict[Any, List[str]] = {}
+
+        def refill() -> None:
+            for batch in itertools.islice(pending, max(1, max_workers) - len(in_flight)):
+                in_flight[pool.submit(_post_prices_batch, batch, sides, s, hedge, deadline)] = batch
+
+        refill()
+        while in_flight:
+            timeout = None if deadline is None else deadline.remaining()
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:  # deadline passed with every in-flight batch still unanswered
+                done = set(in_flight)
+            for fut in done:
+                batch = in_flight.pop(fut)
+                try:
+                    if not fut.done():
+                        fut.cancel()
+                        raise DeadlineExceeded("/prices batch unanswered at the deadline")
+                    data = fut.result()
+                except Exception as e:  # isolate the failed batch, keep the sweep going
+                    if errors is not None:
+                        errors.append((batch, e))
+                    data = {}
+                yield batch, {str(k): v for k, v in data.items()}
+            refill()
+    finally:
+        pool.shutdown(wait=deadline is None, cancel_futures=True)
+
+
 # ------------------------------
 # 4) Trades (Data-API, read-only)
 # ------------------------------
-def get_trades_dataapi(condition_id: Optional[str] = None, limit: int = 25) -> Dict[str, Any]:
+def get_trades_dataapi(
+    condition_id: Optional[str] = None,
+    limit: int = 25,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
     """
     GET /trades from Data-API (public). Filter with market=<conditionId>.
     """
     params: Dict[str, Any] = {"limit": limit}
     if condition_id:
         params["market"] = condition_id
-    r = requests.get(f"{DATA}/trades", params=params, timeout=20)
+    s = session or default_sessions().data
+    r = s.get(f"{DATA}/trades", params=params, timeout=20)
     r.raise_for_status()
-    return r.json()
+    return response_json(r)
 
 
 # -------------------------------------------------------------------
@@ -164,23 +492,34 @@ def _to_float(x: Any) -> float:
         return math.nan
 
 
-def sum_yes_by_market(tokens: List[Dict[str, Any]]) -> List[Tuple[str, int, float]]:
+def sum_yes_by_market(
+    tokens: List[Any],
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[Tuple[str, int, float]]:
     """
     For each condition_id (market), sum best asks across its tokens using /prices (BUY side).
+    tokens may be flattened row dicts or src.models.Token objects.
     Returns list of (condition_id, n_tokens, sum_best_ask), sorted ascending by sum.
+    /prices batches are posted concurrently (see get_best_prices); tokens from a failed
+    batch count as missing prices. A market with any missing price sums to NaN
+    (ranked last): a partial sum would understate the set cost and fake an arbitrage.
+    Batches cut off by the deadline (see get_best_prices) count as failed.
     """
     # group token_ids per market
     by_market: Dict[str, List[str]] = {}
     for t in tokens:
-        cond = t.get("condition_id")
-        tid = t.get("token_id")
-        closed = t.get("closed")
+        cond, tid, closed = token_fields(t)
         if cond and tid and not closed:
             by_market.setdefault(cond, []).append(tid)
 
     # batch query best asks
     all_token_ids = [tid for lst in by_market.values() for tid in lst]
-    price_map = get_best_prices(all_token_ids, side="BUY")  # best ask
+    price_map = get_best_prices(
+        all_token_ids, side="BUY", max_workers=max_workers, errors=errors, session=session, deadline=deadline
+    )  # best ask
 
     results: List[Tuple[str, int, float]] = []
     for cond, tids in by_market.items():
@@ -190,14 +529,274 @@ def sum_yes_by_market(tokens: List[Dict[str, Any]]) -> List[Tuple[str, int, floa
             if tid in price_map:
                 p = price_map[tid].get("BUY")
             asks.append(_to_float(p))
-        finite = [x for x in asks if isinstance(x, (int, float)) and not math.isnan(x)]
-        s = sum(finite) if finite else math.nan
+        s = math.nan if any(math.isnan(x) for x in asks) else sum(asks)
         results.append((cond, len(tids), s))
 
     results.sort(key=lambda x: (math.inf if math.isnan(x[2]) else x[2]))
     return results
 
 
+def sum_yes_by_market_vectorized(
+    tokens: List[Any] | TokenGroups,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    k: Optional[int] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[Tuple[str, int, float]]:
+    """
+    Array-backed sum_yes_by_market (same output): prices go into a float64 array,
+    per-market sums are one segmented reduction and ranking uses argsort
+    (argpartition when only the k lowest sums are wanted).
+    Pass a prebuilt TokenGroups instead of tokens to reuse the grouping across sweeps.
+    """
+    groups = tokens if isinstance(tokens, TokenGroups) else TokenGroups.from_tokens(tokens)
+    price_map = get_best_prices(
+        groups.token_ids, side="BUY", max_workers=max_workers, errors=errors, session=session, deadline=deadline
+    )  # best ask
+    return sum_by_market(groups, groups.prices_from_map(price_map, side="BUY"), k=k)
+
+
+def scan_both_sides(
+    tokens: List[Any] | TokenGroups,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+) -> List[SetEdges]:
+    """
+    Two-sided complement scan: best asks and best bids come back from the same
+    batched /prices payloads (side=("BUY", "SELL")), so one sweep reports both
+    buy-set edges (1 - sum asks) and sell-set / split edges (sum bids - 1).
+    """
+    groups = tokens if isinstance(tokens, TokenGroups) else TokenGroups.from_tokens(tokens)
+    price_map = get_best_prices(
+        groups.token_ids, side=("BUY", "SELL"), max_workers=max_workers, errors=errors, session=session
+    )
+    return two_sided_edges(groups, price_map, buy_side="BUY", sell_side="SELL")
+
+
+def stream_top_opportunities(
+    tokens: List[Any] | TokenGroups,
+    k: int = 15,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    hedge: bool | Hedger = False,
+) -> Iterable[Tuple[List[SetEdges], List[SetEdges]]]:
+    """
+    Stream the best k buy-set and sell-set opportunities while the sweep runs.
+    Two-sided /prices batches are consumed as they complete; each market is scored
+    once all of its tokens have come back and offered to a bounded heap
+    (src/topk.py). Yields (top_buy, top_sell) whenever either list changes, so the
+    first actionable results arrive before the sweep finishes; the last yield is final.
+    hedge is passed to iter_best_prices.
+    """
+    groups = tokens if isinstance(tokens, TokenGroups) else TokenGroups.from_tokens(tokens)
+    remaining = groups.sizes.copy()
+    price_map: Dict[str, Dict[str, Any]] = {}
+    top = TwoSidedTopK(k)
+    yielded = False
+    for batch, data in iter_best_prices(
+        groups.token_ids,
+        side=("BUY", "SELL"),
+        max_workers=max_workers,
+        errors=errors,
+        session=session,
+        hedge=hedge,
+    ):
+        price_map.update(data)
+        changed = False
+        for tid in batch:
+            m = groups.codes[groups.position[tid]]
+            remaining[m] -= 1
+            if remaining[m] == 0:
+                changed |= top.push(market_set_edges(groups, m, price_map))
+        if changed:
+            yielded = True
+            yield top.snapshot()
+    if not yielded:
+        yield top.snapshot()
+
+
+def sum_yes_by_event(
+    markets: Iterable[Any] | NegRiskIndex,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    k: Optional[int] = None,
+    event_sizes: Optional[Dict[str, int]] = None,
+) -> List[EventSum]:
+    """
+    Neg-risk event arbitrage: sum YES best asks across every market sharing a
+    negRiskMarketID (see src/negrisk.py) and rank events by 1 - sum (the buy-every-YES edge).
+    markets are Gamma market dicts / src.models.Market; pass a prebuilt
+    NegRiskIndex to skip regrouping on each sweep.
+    Only events whose every live (active, unclosed) market is in `markets` are
+    ranked; their sizes come from `event_sizes` or, if None, from Gamma /events
+    (neg_risk_event_sizes, cached across sweeps).
+    """
+    if isinstance(markets, NegRiskIndex):
+        index = markets
+    else:
+        index = NegRiskIndex(markets, event_sizes if event_sizes is not None else neg_risk_event_sizes())
+    price_map = get_best_prices(
+        index.yes_token_ids, side="BUY", max_workers=max_workers, errors=errors, session=session
+    )
+    return index.rank(price_map, side="BUY", k=k)
+
+
+def scan_prescreened(
+    markets: Iterable[Any],
+    min_edge: float = 0.0,
+    slack: float = 0.005,
+    max_workers: int = 8,
+    errors: Optional[List[Tuple[List[str], Exception]]] = None,
+    session: Optional[requests.Session] = None,
+    event_sizes: Optional[Dict[str, int]] = None,
+) -> Tuple[Prescreen, List[SetEdges], List[EventSum], List[EventSum]]:
+    """
+    Prune with cheap Gamma bestBid/bestAsk bounds first (src/prefilter.py), then
+    price only the survivors in one two-sided /prices sweep.
+    Returns (prescreen, standalone market edges, neg-risk events ranked by the
+    buy-every-YES edge on asks, neg-risk events ranked by the sell edge on bids);
+    events survive the prescreen on either side, so both rankings are kept.
+    Feed {m.condition_id: list(m.clob_token_ids)} of the top rows to
+    executable_arbitrage to check depth on /book for candidates only.
+    Event sums need each event's full membership: `event_sizes` as for sum_yes_by_event.
+    """
+    screen = prescreen(markets, min_edge=min_edge, slack=slack)
+    groups = TokenGroups.from_tokens([t for m in screen.markets for t in m.tokens])
+    index = NegRiskIndex(
+        [m for members in screen.events.values() for m in members],
+        event_sizes if event_sizes is not None else neg_risk_event_sizes(),
+    )
+    price_map = get_best_prices(
+        groups.token_ids + index.yes_token_ids,
+        side=("BUY", "SELL"),
+        max_workers=max_workers,
+        errors=errors,
+        session=session,
+    )
+    return (
+        screen,
+        two_sided_edges(groups, price_map),
+        index.rank(price_map, side="BUY"),
+        index.rank(price_map, side="SELL"),
+    )
+
+
+def executable_arbitrage(
+    markets: Dict[str, List[str]],
+    max_workers: int = 8,
+    threshold: float = 1.0,
+    session: Optional[requests.Session] = None,
+    hedge: bool | Hedger = False,
+) -> List[Tuple[str, SetFill]]:
+    """
+    Depth-aware check for candidate markets {condition_id: [token_id per outcome]}.
+    Fetches every /book concurrently and walks all ask ladders together
+    (src/depth.py): returns (condition_id, SetFill) with the largest size at which
+    buying the full set still costs < threshold per set, plus VWAP per leg.
+    Markets with a missing book are skipped. hedge is passed to get_book.
+    """
+    token_ids = sorted({tid for tids in markets.values() for tid in tids})
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(token_ids) or 1))) as pool:
+        books = dict(zip(token_ids, pool.map(lambda tid: get_book(tid, session=session, hedge=hedge), token_ids)))
+    by_market = {
+        cond: [books[tid] for tid in tids]
+        for cond, tids in markets.items()
+        if tids and all("error" not in books[tid] for tid in tids)
+    }
+    return scan_markets(by_market, threshold=threshold)
+
+
+def watch_sum_yes(
+    tokens: List[Any] | TokenGroups,
+    interval: float = 5.0,
+    cycles: Optional[int] = None,
+    min_edge: float = 0.0,
+    max_workers: int = 8,
+    session: Optional[requests.Session] = None,
+) -> IncrementalArbDetector:
+    """
+    Re-price tokens every `interval` seconds and print opportunity enter/exit events.
+    Only markets whose best asks moved since the previous sweep are re-evaluated
+    (see src/incremental.py). Runs `cycles` sweeps (forever if None).
+    Each sweep runs under a Deadline of `interval` seconds: batches still unanswered
+    at the end of the slot are dropped (their tokens keep their previous prices),
+    so one stuck socket cannot push the next sweep back.
+    """
+    detector = IncrementalArbDetector(tokens, side="BUY", min_edge=min_edge)
+    n = 0
+    while cycles is None or n < cycles:
+        started = time.monotonic()
+        price_map = get_best_prices(
+            detector.groups.token_ids,
+            side="BUY",
+            max_workers=max_workers,
+            errors=[],
+            session=session,
+            deadline=Deadline(interval),
+        )
+        for ev in detector.update(price_map):
+            print(f"{ev.kind.upper():5s} [{ev.condition_id}] sum_yes={ev.total:.3f} edge={ev.edge:+.3f}")
+        n += 1
+        if cycles is None or n < cycles:
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    return detector
+
+
+def run_scanner_daemon(
+    limit: int = 500,
+    duration: Optional[float] = None,
+    requests_per_second: float = 5.0,
+    min_edge: float = 0.0,
+    catalog_refresh: float = 600.0,
+    adaptive: bool = True,
+    session: Optional[requests.Session] = None,
+    projection: bool | Projection = True,
+) -> ScannerDaemon:
+    """
+    Keep the top `limit` live Gamma markets by 24h volume resident and re-price them continuously.
+    Hot markets (volume, liquidity, recent moves, near resolution) are refreshed
+    more often than dormant ones within a global `requests_per_second` budget
+    (see src/scheduler.py). With `adaptive`, each market's interval then tightens
+    while its prices move and backs off while they stay flat (src/adaptive.py).
+    The catalog is reloaded every `catalog_refresh` seconds. With `projection`
+    (src/projection.py) the pages kept for conditional reloads hold only the
+    resident fields; descriptions, images and events stay in the side store.
+    """
+    if projection is True:
+        projection = Projection()
+    projection = None if projection is False else projection
+
+    def load_catalog():
+        payload = list_markets_gamma(
+            limit=limit, closed=False, active=True, order="volume24hr", projection=projection
+        )
+        rows = payload if isinstance(payload, list) else (payload.get("data") or payload.get("markets") or [])
+        return markets_from_gamma(rows)
+
+    def on_event(ev):
+        print(f"{ev.kind.upper():5s} [{ev.condition_id}] sum_yes={ev.total:.3f} edge={ev.edge:+.3f}")
+
+    daemon = ScannerDaemon(
+        load_catalog(),
+        lambda ids: get_best_prices(ids, side="BUY", errors=[], session=session),
+        requests_per_second=requests_per_second,
+        min_edge=min_edge,
+        on_event=on_event,
+        adaptive=adaptive,
+    )
+    end = None if duration is None else time.monotonic() + duration
+    while end is None or time.monotonic() < end:
+        chunk = catalog_refresh if end is None else min(catalog_refresh, end - time.monotonic())
+        daemon.run(duration=max(0.0, chunk))
+        if end is None or time.monotonic() < end:
+            daemon.refresh_catalog(load_catalog())
+    return daemon
+
+
 # -----------------
 # 6) Demo / driver
 # -----------------
@@ -239,6 +838,8 @@ def main():
             print("Book not found (404) for token:", tid)
         else:
             print("Book top-level keys:", list(book)[:10], "| token:", tid)
+            ob = OrderBook.from_snapshot(book)
+            print("Best bid:", ob.best_bid(), "| best ask:", ob.best_ask(), "| spread:", ob.spread())
 
     # Fetch recent trades from Data-API using condition_id (market)
     if live:
@@ -248,23 +849,35 @@ def main():
         # Usually returns dict with keys such as "data" (list of trades) and paging cursors
         print("Trades payload keys:", list(trades)[:10])
 
-    # Compute sum of YES (best ask) per market and show top deviations from 1
-    print("\n=== Sum of YES prices by market (best ask via /prices) ===")
-    sums = sum_yes_by_market(live)
-    shown = 0
-    for cond, n_tok, s in sums:
-        if isinstance(s, float) and not math.isnan(s):
-            dev = s - 1.0
-            print(f"[{cond}] n={n_tok}  sum_yes={s:.3f}  dev_from_1={dev:+.3f}")
-            shown += 1
-        if shown >= 15:
-            break
+    # One streamed two-sided sweep: best asks and bids per market, reported as
+    # /prices batches complete rather than after the whole sweep
+    print("\n=== Sum of YES prices by market (best asks and bids via /prices, streamed) ===")
+    price_errors: List[Tuple[List[str], Exception]] = []
+    top_buy: List[SetEdges] = []
+    top_sell: List[SetEdges] = []
+    for top_buy, top_sell in stream_top_opportunities(live, k=15, errors=price_errors, hedge=True):
+        best = [f"BUY [{top_buy[0].condition_id[:10]}] {top_buy[0].buy_edge:+.3f}"] if top_buy else []
+        best += [f"SELL [{top_sell[0].condition_id[:10]}] {top_sell[0].sell_edge:+.3f}"] if top_sell else []
+        print("  best so far:", " | ".join(best))
+    if price_errors:
+        print(f"{len(price_errors)} /prices batch(es) failed; their tokens are treated as missing.")
+    hedges = default_hedger().stats
+    print(f"Hedged requests: {hedges['hedges_fired']} fired, {hedges['hedges_won']} won of {hedges['requests']}")
+
+    for e in top_buy:
+        print(f"[{e.condition_id}] n={e.n_tokens}  sum_yes={e.sum_ask:.3f}  dev_from_1={e.sum_ask - 1.0:+.3f}")
+    print("\nTop sell-set opportunities:")
+    for e in top_sell[:5]:
+        print(f"SELL [{e.condition_id}] sum_bid={e.sum_bid:.3f} edge={e.sell_edge:+.3f}")
 
     # Optional: pretty table with pandas if available
-    if pd is not None and sums:
+    if pd is not None and top_buy:
         print("\nTop 15 by sum_yes (ascending):")
-        df = pd.DataFrame(sums, columns=["condition_id", "n_tokens", "sum_yes"])
-        print(df.sort_values("sum_yes").head(15).to_string(index=False))
+        df = pd.DataFrame(
+            [(e.condition_id, e.n_tokens, e.sum_ask) for e in top_buy],
+            columns=["condition_id", "n_tokens", "sum_yes"],
+        )
+        print(df.to_string(index=False))
 
 
 if __name__ == "__main__":
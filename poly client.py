@@ -4,21 +4,54 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import time
 
+from api import get_best_prices
+from src.cache import DEFAULT_TTLS, TTLCache
+from src.deadline import Deadline, bounded
+from src.fastjson import response_json
+from src.history_cache import HistoryCache
+from src.incremental import IncrementalArbDetector
+from src.models import Market, markets_from_gamma, parse_list_field
+from src.negrisk import NegRiskIndex, event_sizes_from_gamma
+from src.projection import Projection
+from src.transport import HostSessions, default_sessions
+
+# Resolution (minutes) of each history interval, sent as fidelity when tailing.
+HISTORY_FIDELITY = {"1m": 1, "5m": 5, "1h": 60, "6h": 360, "1d": 1440, "1w": 10080}
+
+
 class PolymarketScanner:
-    def __init__(self):
+    def __init__(self, sessions: Optional[HostSessions] = None,
+                 history_cache: Optional[HistoryCache] = None,
+                 projection: Optional[Projection] = None):
+        """
+        Args:
+            sessions: Pooled per-host sessions (defaults to the shared pool,
+                which is rate limited per host; see src/ratelimit.py)
+            history_cache: On-disk price-history store; with one,
+                get_market_history only downloads points newer than the
+                last cached one (see src/history_cache.py)
+            projection: Ingest field projection; with one, fetched markets
+                keep only its resident fields and the description, images
+                and events are offloaded (see src/projection.py)
+        """
         self.base_url = "https://gamma-api.polymarket.com"
         self.clob_url = "https://clob.polymarket.com"
+        self.sessions = sessions or default_sessions()
+        self.history_cache = history_cache
+        self.projection = projection
+        self.event_sizes_cache = TTLCache(maxsize=8, ttl=DEFAULT_TTLS["event_sizes"])
         
-    def get_active_markets(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    def get_active_markets(self, limit: int = 100, offset: int = 0, typed: bool = False) -> List:
         """
         Fetch active markets from Polymarket
         
         Args:
             limit: Number of markets to fetch (default 100, can go higher)
             offset: Pagination offset
+            typed: Return compact src.models.Market objects instead of dicts
             
         Returns:
-            List of market dictionaries
+            List of market dictionaries (or Market objects if typed)
         """
         endpoint = f"{self.base_url}/markets"
         
@@ -31,25 +64,41 @@ class PolymarketScanner:
         }
         
         try:
-            response = requests.get(endpoint, params=params)
+            response = self.sessions.gamma.get(endpoint, params=params, timeout=20)
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
             print(f"API returned {len(data)} markets")
-            return data
+            if self.projection is not None:
+                data = self.projection.project_all(data)
+            return markets_from_gamma(data) if typed else data
         except requests.exceptions.RequestException as e:
             print(f"Error fetching markets: {e}")
             return []
     
-    def get_market_history(self, condition_id: str, interval: str = "1d") -> List[Dict]:
+    def get_market_history(self, condition_id: str, interval: str = "1d",
+                           deadline: Optional[Deadline] = None,
+                           errors: Optional[List] = None) -> List[Dict]:
         """
         Get historical price data for a market
         
+        With a history cache only the tail since the newest cached point is
+        requested and merged in. The tail request sends startTs and the
+        interval's resolution as fidelity (minutes) instead of interval, which
+        the endpoint treats as an alternative to startTs; intervals without a
+        known resolution are re-fetched in full. If a request fails, the error
+        is printed and appended to `errors`, and the cached points (possibly
+        stale) are returned.
+        
         Args:
             condition_id: The condition ID for the market
             interval: Time interval (1m, 5m, 1h, 1d)
+            deadline: Optional src.deadline.Deadline; the request timeout is
+                cut to the time left and nothing is sent once it has passed
+            errors: Optional list collecting (condition_id, exception) for
+                failed requests
             
         Returns:
-            List of historical price points
+            List of historical price points (the cached series with a cache)
         """
         endpoint = f"{self.base_url}/prices-history"
         
@@ -57,14 +106,35 @@ class PolymarketScanner:
             "market": condition_id,
             "interval": interval
         }
+        fidelity = HISTORY_FIDELITY.get(interval)
+        
+        cache = self.history_cache
+        if cache is not None and fidelity is not None:
+            since = cache.last_timestamp(condition_id, interval)
+            if since is not None:
+                params = {"market": condition_id, "startTs": int(since), "fidelity": fidelity}
         
         try:
-            response = requests.get(endpoint, params=params)
+            response = bounded(deadline, self.sessions.gamma.get, endpoint, params=params)
             response.raise_for_status()
-            return response.json()
+            data = response_json(response)
         except requests.exceptions.RequestException as e:
-            print(f"Error fetching market history: {e}")
-            return []
+            if errors is not None:
+                errors.append((condition_id, e))
+            if cache is None:
+                print(f"Error fetching market history: {e}")
+                return []
+            cached = cache.points(condition_id, interval)
+            print(f"Error fetching market history: {e}; "
+                  f"returning {len(cached)} cached points, which may be stale")
+            return cached
+        
+        points = data.get("history", []) if isinstance(data, dict) else data
+        points = points if isinstance(points, list) else []
+        if cache is None:
+            return points
+        cache.add(condition_id, interval, points)
+        return cache.points(condition_id, interval)
     
     def parse_outcomes(self, outcomes_field) -> List[str]:
         """
@@ -72,16 +142,8 @@ class PolymarketScanner:
         """
         if isinstance(outcomes_field, list):
             return outcomes_field
-        elif isinstance(outcomes_field, str):
-            try:
-                # Try to parse as JSON
-                parsed = json.loads(outcomes_field)
-                if isinstance(parsed, list):
-                    return parsed
-            except json.JSONDecodeError:
-                pass
-            return [outcomes_field]
-        return []
+        # decoded once per distinct string (see src.models.parse_list_field)
+        return list(parse_list_field(outcomes_field))
     
     def display_market_info(self, market: Dict) -> None:
         """Display formatted market information"""
@@ -156,13 +218,126 @@ class PolymarketScanner:
         
         return prices
     
-    def plot_markets_over_time(self, markets: List[Dict], num_markets: int = 5):
+    def get_event_sizes(self, limit: int = 100, max_pages: int = 50) -> Dict[str, int]:
+        """
+        Fetch the number of live markets in each neg-risk event from Gamma /events
+        
+        A complete result is cached for 5 minutes (event_sizes_cache), so
+        repeated rankings do not re-download every /events page. A fetch cut
+        short by an error is returned but not cached.
+        
+        Args:
+            limit: Events per page
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            {event key: live-market count} (see src.negrisk.event_sizes_from_gamma)
+        """
+        key = (limit, max_pages)
+        cached = self.event_sizes_cache.get(key)
+        if cached is not None:
+            return cached
+        sizes = {}
+        complete = True
+        for page in range(max_pages):
+            try:
+                response = self.sessions.gamma.get(
+                    f"{self.base_url}/events",
+                    params={"limit": limit, "offset": page * limit, "closed": "false"},
+                    timeout=20,
+                )
+                response.raise_for_status()
+                events = response_json(response)
+            except Exception as e:
+                print(f"Error fetching events: {e}")
+                complete = False
+                break
+            if not isinstance(events, list):
+                complete = False
+                break
+            sizes.update(event_sizes_from_gamma(events))
+            if len(events) < limit:
+                break
+        if complete:
+            self.event_sizes_cache.put(key, sizes)
+        return sizes
+    
+    def rank_neg_risk_events(self, markets: List, k: int = 10,
+                             event_sizes: Optional[Dict[str, int]] = None) -> List:
+        """
+        Sum YES best asks across markets of the same neg-risk event
+        
+        Uses each market's Gamma bestAsk; events are ranked by 1 - sum, the edge of
+        buying every YES. Only events whose every live market is in `markets` are
+        ranked, so pass the whole catalog rather than a top-N slice.
+        
+        Args:
+            markets: Market dictionaries or src.models.Market objects
+            k: Number of events to return
+            event_sizes: Live-market count per event (from get_event_sizes,
+                cached, if None)
+            
+        Returns:
+            List of src.negrisk.EventSum
+        """
+        models = [m if isinstance(m, Market) else Market.from_gamma(m) for m in markets]
+        if event_sizes is None:
+            event_sizes = self.get_event_sizes()
+        index = NegRiskIndex(models, event_sizes)
+        price_map = {m.tokens[0].token_id: {"BUY": m.best_ask} for m in models if m.tokens}
+        return index.rank(price_map, side="BUY", k=k)
+    
+    def watch_arbitrage(self, limit: int = 100, interval: float = 30.0,
+                        cycles: Optional[int] = None, min_edge: float = 0.01):
+        """
+        Poll CLOB best asks/bids and report complete-set gaps incrementally
+        
+        Buying every outcome is checked against the best asks and selling every
+        outcome against the best bids (both from one batched /prices sweep);
+        Gamma outcomePrices are mid/last prices and cannot show either. Only
+        markets whose prices changed since the previous poll are re-evaluated;
+        markets entering/leaving the opportunity set are printed. Each poll
+        runs under a Deadline of `interval` seconds, so a stuck /prices batch
+        is dropped instead of delaying the next poll, and polls start every
+        `interval` seconds regardless of how long each sweep took.
+        
+        Args:
+            limit: Number of markets to track (catalog fixed at the first poll)
+            interval: Seconds between poll starts
+            cycles: Number of polls (forever if None)
+            min_edge: Minimum distance of the ask/bid sum from 1 to report
+        """
+        markets = self.get_active_markets(limit=limit, typed=True)
+        if not markets:
+            return
+        tokens = [t for m in markets for t in m.tokens]
+        buy_set = IncrementalArbDetector(tokens, side="BUY", min_edge=min_edge)
+        sell_set = IncrementalArbDetector(buy_set.groups, side="SELL", min_edge=min_edge)
+        
+        n = 0
+        while True:
+            started = time.monotonic()
+            price_map = get_best_prices(buy_set.groups.token_ids, side=("BUY", "SELL"), max_workers=4,
+                                        errors=[], session=self.sessions.clob,
+                                        deadline=Deadline(interval))
+            for label, detector in (("BUY SET", buy_set), ("SELL SET", sell_set)):
+                for ev in detector.update(price_map):
+                    print(f"{ev.kind.upper()} {label} [{ev.condition_id}] "
+                          f"total={ev.total*100:.2f}% edge={ev.edge*100:.2f}%")
+            n += 1
+            if cycles is not None and n >= cycles:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    
+    def plot_markets_over_time(self, markets: List[Dict], num_markets: int = 5,
+                               budget: float = 60.0):
         """
         Plot price history for top markets
         
         Args:
             markets: List of market dictionaries
             num_markets: Number of markets to plot
+            budget: Seconds allowed for all history fetches together
         """
         try:
             import matplotlib.pyplot as plt
@@ -173,6 +348,7 @@ class PolymarketScanner:
         
         print(f"\nFetching historical data for top {num_markets} markets...")
         
+        deadline = Deadline(budget)
         fig, axes = plt.subplots(num_markets, 1, figsize=(12, 4*num_markets))
         if num_markets == 1:
             axes = [axes]
@@ -184,7 +360,7 @@ class PolymarketScanner:
                 continue
             
             print(f"Fetching data for: {market.get('question', 'Unknown')[:60]}...")
-            history = self.get_market_history(condition_id, interval="1h")
+            history = self.get_market_history(condition_id, interval="1h", deadline=deadline)
             
             if not history:
                 print(f"  No historical data available")
@@ -222,7 +398,6 @@ class PolymarketScanner:
             plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
             
             print(f"  ✓ Plotted {len(times)} data points")
-            time.sleep(0.5)  # Rate limiting
         
         plt.tight_layout()
         plt.savefig('polymarket_price_history.png', dpi=150, bbox_inches='tight')
@@ -231,8 +406,8 @@ class PolymarketScanner:
 
 
 def main():
-    # Initialize scanner
-    scanner = PolymarketScanner()
+    # Initialize scanner (price history is cached on disk between runs)
+    scanner = PolymarketScanner(history_cache=HistoryCache())
     
     # Fetch active markets
     print("Fetching active markets from Polymarket...")
@@ -262,6 +437,14 @@ def main():
                 arbitrage_gap = abs(1.0 - total_prob) * 100
                 print(f"⚠️  ARBITRAGE OPPORTUNITY? Gap: {arbitrage_gap:.2f}%")
     
+    # Neg-risk events: YES prices should sum to 1 across the whole event
+    print("\n" + "="*80)
+    print("NEG-RISK EVENTS BY BUY-EVERY-YES EDGE (1 - SUM OF ASKS)")
+    print("="*80)
+    for ev in scanner.rank_neg_risk_events(markets, k=5):
+        if ev.deviation == ev.deviation:  # skip incomplete/unpriced events (NaN)
+            print(f"[{ev.event_id[:18]}...] markets={ev.n_markets}  sum_ask={ev.total*100:.2f}%  edge={-ev.deviation*100:+.2f}%")
+    
     # Statistics
     print("\n" + "="*80)
     print("MARKET STATISTICS")
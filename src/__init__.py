@@ -1,5 +1,15 @@
 """Polymarket arbitrage exploration package."""
 
 from .polymarket_api import PolymarketAPI
+from .transport import HostSessions
+from .models import Market, Token
 
-__all__ = ['PolymarketAPI']
+__all__ = ['PolymarketAPI', 'AsyncPolymarketAPI', 'HostSessions', 'Market', 'Token']
+
+
+def __getattr__(name):
+    # aiohttp is only needed by the async client: import it on first use.
+    if name == 'AsyncPolymarketAPI':
+        from .async_api import AsyncPolymarketAPI
+        return AsyncPolymarketAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,63 @@
+"""Adaptive per-market polling intervals.
+
+Markets whose prices moved since the previous poll are polled sooner
+(multiplicative decrease); markets that stayed flat back off exponentially up
+to a ceiling. Before a market has been observed, its Gamma
+``oneHourPriceChange``/``oneDayPriceChange`` give a prior: treating the price
+as a random walk, the expected time for it to move one tick is roughly
+``(tick / hourly_move) ** 2`` hours.
+"""
+
+import math
+from typing import Optional
+
+from .models import Market
+
+
+class AdaptiveIntervals:
+    """Interval controller driven by observed price changes."""
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        speedup: float = 0.5,
+        tick: float = 0.01,
+    ):
+        """Initialize the controller.
+
+        Args:
+            min_interval: Floor for any interval (seconds).
+            max_interval: Ceiling flat markets back off to (seconds).
+            backoff: Factor applied after a poll with no change.
+            speedup: Factor applied after a poll with a change.
+            tick: Price move the prior aims to catch.
+        """
+        if backoff < 1.0 or not 0.0 < speedup <= 1.0:
+            raise ValueError(f"need backoff >= 1 and 0 < speedup <= 1: {backoff}, {speedup}")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.tick = tick
+
+    def clamp(self, interval: float) -> float:
+        """Clip ``interval`` to [min_interval, max_interval]."""
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def prior(self, market: Market) -> Optional[float]:
+        """Starting interval from Gamma price-change fields (None if unknown)."""
+        moves = [
+            abs(change) / math.sqrt(hours)
+            for change, hours in ((market.one_hour_price_change, 1.0), (market.one_day_price_change, 24.0))
+            if change is not None and math.isfinite(change)
+        ]
+        hourly_move = max(moves, default=0.0)
+        if hourly_move <= 0.0:
+            return None
+        return self.clamp(3600.0 * (self.tick / hourly_move) ** 2)
+
+    def next_interval(self, interval: float, changed: bool) -> float:
+        """Interval to use after a poll that did (or did not) see a change."""
+        return self.clamp(interval * (self.speedup if changed else self.backoff))
@@ -0,0 +1,218 @@
+"""Asynchronous Polymarket API client with concurrent pagination."""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from .fastjson import loads
+from .ratelimit import HostRateLimiter, default_limiter
+from .resilience import Resilience, default_resilience
+
+
+class AsyncPolymarketAPI:
+    """Async counterpart of :class:`PolymarketAPI`.
+
+    Offset pages of the Gamma ``/markets`` endpoint are fetched concurrently
+    by :meth:`iter_all_markets`, so a full catalog refresh costs roughly one
+    round-trip per window of ``max_concurrency`` pages instead of one per page.
+    """
+
+    BASE_URL = "https://gamma-api.polymarket.com"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        timeout: float = 20,
+        limiter: Optional[HostRateLimiter] = None,
+        max_throttle_retries: int = 2,
+        resilience: Optional[Resilience] = None,
+    ):
+        """Initialize the async Polymarket API client.
+
+        Args:
+            base_url: Optional custom base URL for the API.
+            max_concurrency: Default number of pages fetched in parallel.
+            timeout: Total timeout in seconds for a single request.
+            limiter: Per-host rate limiter (default: the process-wide one
+                shared with the synchronous clients, looked up on every
+                request).
+            max_throttle_retries: Re-sends after a 429 response.
+            resilience: Retry/circuit-breaker layer (default: the process-wide
+                one shared with the synchronous clients, looked up on every
+                request).
+        """
+        self.base_url = base_url or self.BASE_URL
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._limiter = limiter
+        self.max_throttle_retries = max_throttle_retries
+        self._resilience = resilience
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def limiter(self) -> HostRateLimiter:
+        """The given limiter, else the current process-wide one."""
+        return self._limiter if self._limiter is not None else default_limiter()
+
+    @property
+    def resilience(self) -> Resilience:
+        """The given resilience layer, else the current process-wide one."""
+        return self._resilience if self._resilience is not None else default_resilience()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating it inside the running loop."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None):
+        session = self._get_session()
+        limiter, resilience = self.limiter, self.resilience
+        body = []
+
+        async def attempt():
+            throttles = 0
+            while True:
+                wait = limiter.reserve(url)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                async with session.get(url, params=params) as response:
+                    throttled = limiter.observe(url, response.status, response.headers)
+                    if throttled is None or throttles >= self.max_throttle_retries:
+                        if response.status not in resilience.policy.retry_statuses:
+                            response.raise_for_status()
+                            body.append(await response.json(loads=loads))
+                        return response
+                throttles += 1
+
+        response = await resilience.call_async(
+            url, attempt, transient=(aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        )
+        response.raise_for_status()
+        return body[-1]
+
+    async def get_markets(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """Fetch available markets from Polymarket.
+
+        Args:
+            limit: Maximum number of markets to return (default: 100).
+            offset: Number of markets to skip (default: 0).
+
+        Returns:
+            List of market dictionaries.
+
+        Raises:
+            aiohttp.ClientError: If the API request fails.
+        """
+        url = f"{self.base_url}/markets"
+        params = {"limit": limit, "offset": offset}
+
+        return await self._get_json(url, params=params)
+
+    async def get_market(self, condition_id: str) -> Dict:
+        """Fetch a specific market by condition ID.
+
+        Args:
+            condition_id: The unique identifier for the market condition.
+
+        Returns:
+            Market dictionary with details.
+
+        Raises:
+            aiohttp.ClientError: If the API request fails.
+        """
+        url = f"{self.base_url}/markets/{condition_id}"
+
+        return await self._get_json(url)
+
+    async def iter_all_markets(
+        self,
+        page_size: int = 100,
+        max_concurrency: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over every market, fetching offset pages concurrently.
+
+        A sliding window keeps up to ``max_concurrency`` page requests in
+        flight and refills as soon as any of them completes. Markets are
+        yielded in offset order. The first page shorter than ``page_size``
+        marks the end of the catalog; requests beyond it are cancelled.
+
+        Args:
+            page_size: Number of markets requested per page.
+            max_concurrency: Pages in flight at once (default: client setting).
+            max_pages: Optional cap on the number of pages fetched.
+
+        Yields:
+            Market dictionaries.
+
+        Raises:
+            aiohttp.ClientError: If any page request fails.
+        """
+        concurrency = max(1, max_concurrency or self.max_concurrency)
+        in_flight: Dict[asyncio.Task, int] = {}
+        done_pages: Dict[int, List[Dict]] = {}
+        next_page = 0
+        next_to_yield = 0
+        last_page: Optional[int] = None if max_pages is None else max_pages - 1
+
+        try:
+            while True:
+                while len(in_flight) < concurrency and (
+                    last_page is None or next_page <= last_page
+                ):
+                    task = asyncio.ensure_future(
+                        self.get_markets(limit=page_size, offset=next_page * page_size)
+                    )
+                    in_flight[task] = next_page
+                    next_page += 1
+
+                while next_to_yield in done_pages and (
+                    last_page is None or next_to_yield <= last_page
+                ):
+                    page = done_pages.pop(next_to_yield)
+                    for market in page:
+                        yield market
+                    next_to_yield += 1
+
+                if last_page is not None and next_to_yield > last_page:
+                    return
+
+                finished, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    page_idx = in_flight.pop(task, None)
+                    if page_idx is None:
+                        continue  # already discarded as past the end
+                    page = task.result() or []
+                    done_pages[page_idx] = page
+                    if len(page) < page_size and (last_page is None or page_idx < last_page):
+                        last_page = page_idx
+                        for other, other_idx in list(in_flight.items()):
+                            if other_idx > last_page:
+                                other.cancel()
+                                del in_flight[other]
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def close(self):
+        """Close the session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
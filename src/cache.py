@@ -0,0 +1,173 @@
+"""In-process LRU + TTL cache with per-key single-flight.
+
+:class:`TTLCache` memoizes loader results for ``ttl`` seconds, bounded to
+``maxsize`` entries (least recently used evicted first). Concurrent callers
+asking for the same missing key share one in-flight load instead of each
+issuing the request; if the load fails, every waiter gets the error and
+nothing is cached.
+
+Staleness tolerance differs per endpoint (an order book goes stale in
+well under a second, market metadata in minutes), so :func:`shared_cache`
+keeps one cache per endpoint name with its TTL from :data:`DEFAULT_TTLS`.
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a cached response may be served, per endpoint.
+DEFAULT_TTLS = {
+    "market": 30.0,  # Gamma /markets/{id}
+    "book": 0.5,  # CLOB /book
+    "event_sizes": 300.0,  # neg-risk event membership counts from Gamma /events
+}
+
+
+class _Flight:
+    """One in-flight load that concurrent callers wait on."""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a TTL."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Default seconds an entry stays fresh (<= 0 disables storing,
+                leaving only single-flight).
+            clock: Monotonic time source.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Fresh cached value of ``key``, or ``default`` (does not touch stats)."""
+        with self._lock:
+            entry = self._fresh(key, self.clock())
+            return default if entry is None else entry[1]
+
+    def _fresh(self, key: Hashable, now: float) -> Optional[Tuple[float, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` for ``ttl`` seconds (default: the cache's TTL)."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self.clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T], ttl: Optional[float] = None) -> T:
+        """Return the cached value of ``key``, loading it once if missing or stale.
+
+        Args:
+            key: Cache key.
+            loader: Fetches the value; called by at most one caller per key at a time.
+            ttl: Freshness of the loaded value (default: the cache's TTL).
+
+        Returns:
+            The cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever the in-flight ``loader`` raised.
+        """
+        with self._lock:
+            entry = self._fresh(key, self.clock())
+            if entry is not None:
+                self.stats["hits"] += 1
+                return entry[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            self.put(key, flight.value, ttl)
+            return flight.value
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` if cached."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_shared: Dict[str, TTLCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(endpoint: str) -> TTLCache:
+    """Process-wide cache for ``endpoint`` (TTL from DEFAULT_TTLS), created lazily."""
+    with _shared_lock:
+        cache = _shared.get(endpoint)
+        if cache is None:
+            cache = _shared[endpoint] = TTLCache(ttl=DEFAULT_TTLS.get(endpoint, 5.0))
+        return cache
+
+
+def set_shared_cache(endpoint: str, cache: Optional[TTLCache]) -> None:
+    """Replace an endpoint's shared cache (None resets to a lazily created default)."""
+    with _shared_lock:
+        if cache is None:
+            _shared.pop(endpoint, None)
+        else:
+            _shared[endpoint] = cache
@@ -0,0 +1,142 @@
+"""Conditional GETs (ETag / Last-Modified) with the decoded body kept.
+
+:class:`ConditionalCache` remembers, per URL and query parameters, the
+validators of the last full response together with its decoded JSON. The
+next request for the same resource carries ``If-None-Match`` /
+``If-Modified-Since``; on ``304 Not Modified`` the stored object is returned
+as is, so an unchanged catalog page costs neither its body nor a JSON decode.
+Responses without validators are not stored. Returned objects are shared
+between callers and must be treated as read-only.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+
+from .fastjson import response_json
+
+
+def _key(url: str, params: Optional[Dict[str, Any]], transform: Optional[Callable] = None) -> Hashable:
+    return url, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())), transform
+
+
+class ConditionalCache:
+    """LRU of (ETag, Last-Modified, decoded body) per request."""
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of resources remembered.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[str], Optional[str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    def validators(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> Dict[str, str]:
+        """Conditional request headers for a resource (empty if nothing is stored)."""
+        with self._lock:
+            entry = self._entries.get(_key(url, params, transform))
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get_json(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """GET ``url`` conditionally and return its decoded JSON.
+
+        Args:
+            session: Session used for the request.
+            url: Resource URL.
+            params: Query parameters (part of the cache key).
+            transform: Applied to a freshly decoded body before it is stored
+                and returned (e.g. a field projection), so a 304 returns the
+                transformed object without running it again. It is part of
+                the cache key, so callers with different transforms never
+                share a stored body.
+            **kwargs: Passed to ``session.get`` (e.g. ``timeout``).
+
+        Returns:
+            The stored object on 304, otherwise the freshly decoded body.
+
+        Raises:
+            requests.HTTPError: On an error status.
+        """
+        key = _key(url, params, transform)
+        headers = self.validators(url, params, transform)
+        if headers:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **headers}
+        response = session.get(url, params=params, **kwargs)
+        with self._lock:
+            self.stats["requests"] += 1
+            entry = self._entries.get(key)
+            if response.status_code == 304 and entry is not None:
+                self.stats["not_modified"] += 1
+                self._entries.move_to_end(key)
+                return entry[2]
+        response.raise_for_status()
+        data = response_json(response)
+        if transform is not None:
+            data = transform(data)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        with self._lock:
+            if etag or last_modified:
+                self._entries[key] = (etag, last_modified, data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.pop(key, None)
+        return data
+
+    def clear(self) -> None:
+        """Forget every stored resource."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[ConditionalCache] = None
+_default_lock = threading.Lock()
+
+
+def default_conditional_cache() -> ConditionalCache:
+    """Return the process-wide shared :class:`ConditionalCache`, creating it lazily."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = ConditionalCache()
+    return _default_cache
+
+
+def set_default_conditional_cache(cache: Optional[ConditionalCache]) -> None:
+    """Replace the shared cache (None resets to a lazily created default)."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = cache
@@ -0,0 +1,141 @@
+"""Checkpointed crawler for the CLOB ``/simplified-markets`` universe."""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+
+from .fastjson import loads
+from .transport import CLOB_URL, default_sessions
+
+# CLOB signals the last page with this cursor (base64 of "-1").
+END_CURSOR = "LTE="
+
+
+class SimplifiedMarketsCrawler:
+    """Walk every ``next_cursor`` page of ``/simplified-markets`` with resume support.
+
+    Progress is persisted to a JSON checkpoint after every page: the cursor to
+    resume from, and for each cursor the content hash of its page and the
+    cursor that followed it. After a crash the crawl resumes from the saved
+    cursor. Pages whose raw body hashes to the stored value are unchanged:
+    they are served from the decoded pages kept from the previous crawl
+    instead of being decoded again (after a restart, when nothing is kept
+    yet, they are decoded once). By default every page is yielded so callers
+    always see the full universe; ``changed_only=True`` yields just the pages
+    that changed since the previous crawl.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: str,
+        session: Optional[requests.Session] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 20,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            checkpoint_path: File used to persist cursor and page hashes.
+            session: Optional session (defaults to the shared CLOB pool).
+            base_url: Optional custom CLOB base URL.
+            timeout: Per-request timeout in seconds.
+        """
+        self.checkpoint_path = checkpoint_path
+        self.session = session or default_sessions().clob
+        self.base_url = base_url or CLOB_URL
+        self.timeout = timeout
+        self.stats = {"fetched": 0, "decoded": 0, "skipped": 0}
+        self.checkpoint = self._load_checkpoint()
+        self._decoded: Dict[str, Tuple[str, Dict]] = {}  # cursor -> (hash, page)
+
+    def _load_checkpoint(self) -> Dict:
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {"cursor": "", "pages": {}}
+        data.setdefault("cursor", "")
+        data.setdefault("pages", {})
+        return data
+
+    def _save_checkpoint(self) -> None:
+        # Write-then-rename so a crash never leaves a truncated checkpoint.
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _fetch_raw(self, cursor: str) -> bytes:
+        params = {"next_cursor": cursor} if cursor else {}
+        response = self.session.get(
+            f"{self.base_url}/simplified-markets", params=params, timeout=self.timeout
+        )
+        response.raise_for_status()
+        self.stats["fetched"] += 1
+        return response.content
+
+    def _advance(self, next_cursor: Optional[str]) -> bool:
+        """Store the resume cursor; return False once the universe is exhausted."""
+        done = not next_cursor or next_cursor == END_CURSOR
+        # A finished crawl restarts from the first page next time.
+        self.checkpoint["cursor"] = "" if done else next_cursor
+        self._save_checkpoint()
+        return not done
+
+    def crawl(
+        self, max_pages: Optional[int] = None, resume: bool = True, changed_only: bool = False
+    ) -> Iterator[Dict]:
+        """Yield decoded pages, re-decoding only those whose content changed.
+
+        Args:
+            max_pages: Optional cap on pages fetched in this call.
+            resume: Continue from the checkpointed cursor (False restarts).
+            changed_only: Skip pages unchanged since they were last seen.
+
+        Yields:
+            Page dictionaries ({"data": [...], "next_cursor": ...}).
+
+        Raises:
+            requests.RequestException: If a page request fails. The checkpoint
+                still points at the failed page, so the next crawl retries it.
+        """
+        cursor = self.checkpoint["cursor"] if resume else ""
+        pages = self.checkpoint["pages"]
+        n = 0
+        while max_pages is None or n < max_pages:
+            raw = self._fetch_raw(cursor)
+            n += 1
+            digest = hashlib.sha256(raw).hexdigest()
+            known = pages.get(cursor)
+            if known is not None and known.get("hash") == digest:
+                self.stats["skipped"] += 1
+                next_cursor = known.get("next_cursor")
+                if not changed_only:
+                    yield self._page(cursor, digest, raw)
+            else:
+                page = self._page(cursor, digest, raw)
+                next_cursor = page.get("next_cursor") if isinstance(page, dict) else None
+                yield page
+                # Only record the hash once the caller has consumed the page.
+                pages[cursor] = {"hash": digest, "next_cursor": next_cursor}
+            if not self._advance(next_cursor):
+                break
+            cursor = next_cursor
+
+    def _page(self, cursor: str, digest: str, raw: bytes) -> Dict:
+        kept = self._decoded.get(cursor)
+        if kept is not None and kept[0] == digest:
+            return kept[1]
+        page = loads(raw)
+        self.stats["decoded"] += 1
+        self._decoded[cursor] = (digest, page)
+        return page
+
+    def reset(self) -> None:
+        """Forget the cursor, all page hashes and kept pages."""
+        self.checkpoint = {"cursor": "", "pages": {}}
+        self._decoded.clear()
+        self._save_checkpoint()
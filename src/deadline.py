@@ -0,0 +1,94 @@
+"""Per-cycle deadlines for HTTP work.
+
+A :class:`Deadline` is created once per scan cycle and passed down to the
+helpers that issue requests. Each request's timeout is the smaller of its
+usual timeout and the time left, work that would start after the deadline
+fails fast with :class:`DeadlineExceeded`, and while a request runs under
+:meth:`Deadline.active` the retry layer (:mod:`src.resilience`) sees the same
+deadline and will not retry past it.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when work would start (or continue) past its deadline."""
+
+
+class Deadline:
+    """Absolute point in monotonic time by which a unit of work must finish."""
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        """Start a deadline ``seconds`` from now.
+
+        Args:
+            seconds: Budget in seconds.
+            clock: Monotonic time source.
+        """
+        self.clock = clock
+        self.at = clock() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)."""
+        return max(0.0, self.at - self.clock())
+
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return self.remaining() <= 0.0
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """Timeout for a request started now: the time left, at most ``cap``.
+
+        Raises:
+            DeadlineExceeded: If the deadline has already passed.
+        """
+        left = self.remaining()
+        if left <= 0.0:
+            raise DeadlineExceeded("deadline exceeded")
+        return left if cap is None else min(cap, left)
+
+    @contextmanager
+    def active(self) -> Iterator["Deadline"]:
+        """Make this the current deadline (see :func:`current_deadline`) in this context."""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline activated by the innermost :meth:`Deadline.active`, if any."""
+    return _current.get()
+
+
+def bounded(
+    deadline: Optional[Deadline],
+    send: Callable[..., T],
+    *args,
+    timeout: float = 20,
+    **kwargs,
+) -> T:
+    """Call ``send(*args, timeout=..., **kwargs)`` within ``deadline``.
+
+    Without a deadline this is a plain call with ``timeout``. With one, the
+    timeout is cut to the time left and the deadline is active for the call,
+    so retries below it stop in time.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    if deadline is None:
+        return send(*args, timeout=timeout, **kwargs)
+    request_timeout = deadline.timeout(timeout)
+    with deadline.active():
+        return send(*args, timeout=request_timeout, **kwargs)
@@ -0,0 +1,121 @@
+"""Depth-aware complete-set arbitrage sizing.
+
+Best-ask sums overstate opportunities that vanish after a few shares. Here
+the ask ladders of every outcome are walked together: the marginal cost of
+one more complete set is the sum of each leg's price at the current fill
+depth, and the set stays profitable while that sum is below 1. Breakpoints
+of all ladders are merged once and evaluated with ``np.searchsorted``, so
+the work is vectorized across levels.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from .orderbook import ASKS, OrderBook
+
+Ladder = Tuple[np.ndarray, np.ndarray]
+
+
+class SetFill(NamedTuple):
+    """Executable size for a complete outcome set."""
+
+    size: float  # number of complete sets
+    cost: float  # total cost (asks) or proceeds (bids) for `size` sets
+    vwaps: np.ndarray  # volume-weighted price per leg
+    edge: float  # profit: size - cost for asks, cost - size for bids
+
+
+def _ladder(book: Union[OrderBook, Dict[str, Any], Ladder], side: str) -> Ladder:
+    """(prices, sizes) in priority order from an OrderBook, raw /book JSON or arrays."""
+    if isinstance(book, OrderBook):
+        return book.levels(side)
+    if isinstance(book, dict):
+        levels = book.get(side) or []
+        prices = np.array([float(lv["price"]) for lv in levels], dtype=np.float64)
+        sizes = np.array([float(lv["size"]) for lv in levels], dtype=np.float64)
+        order = np.argsort(prices if side == ASKS else -prices, kind="stable")
+        return prices[order], sizes[order]
+    prices, sizes = book
+    return np.asarray(prices, dtype=np.float64), np.asarray(sizes, dtype=np.float64)
+
+
+def _leg_cost(prices: np.ndarray, cum: np.ndarray, size: float) -> float:
+    """Cost of filling ``size`` from the top of one ladder."""
+    if size <= 0:
+        return 0.0
+    k = int(np.searchsorted(cum, size, side="left"))
+    before = cum[k - 1] if k > 0 else 0.0
+    full = float(np.dot(prices[:k], np.diff(cum[:k], prepend=0.0)))
+    return full + float(prices[k]) * (size - before)
+
+
+def executable_set(
+    books: Sequence[Union[OrderBook, Dict[str, Any], Ladder]],
+    side: str = ASKS,
+    threshold: float = 1.0,
+) -> SetFill:
+    """Largest profitable size for buying (asks) or selling (bids) a complete set.
+
+    Args:
+        books: One book per outcome: OrderBook, raw ``/book`` JSON, or a
+            (prices, sizes) pair already in priority order.
+        side: ``"asks"`` to buy the set, ``"bids"`` to sell it.
+        threshold: Set value to beat (1.0, minus fees/edge if desired).
+
+    Returns:
+        SetFill. Size is 0 when even the top of book is not profitable or a
+        leg has no liquidity.
+    """
+    ladders = [_ladder(b, side) for b in books]
+    n_legs = len(ladders)
+    empty = SetFill(0.0, 0.0, np.full(n_legs, np.nan), 0.0)
+    if n_legs == 0 or any(len(p) == 0 for p, _ in ladders):
+        return empty
+
+    cums = [np.cumsum(s) for _, s in ladders]
+    max_size = min(float(c[-1]) for c in cums)
+    ends = np.unique(np.concatenate(cums))
+    ends = ends[(ends > 0) & (ends <= max_size)]
+    if len(ends) == 0:
+        return empty
+    starts = np.concatenate(([0.0], ends[:-1]))
+
+    # Marginal price of every leg on each segment [start, end).
+    marginal = np.zeros(len(ends))
+    for (prices, _), cum in zip(ladders, cums):
+        marginal += prices[np.searchsorted(cum, starts, side="right")]
+
+    # Legs are walked best price first, so marginal set cost is monotone.
+    profitable = marginal < threshold if side == ASKS else marginal > threshold
+    n_ok = int(np.count_nonzero(profitable))
+    if n_ok == 0:
+        return empty
+    size = float(ends[n_ok - 1])
+
+    leg_costs = np.array([_leg_cost(p, c, size) for (p, _), c in zip(ladders, cums)])
+    cost = float(leg_costs.sum())
+    edge = size * threshold - cost if side == ASKS else cost - size * threshold
+    return SetFill(size, cost, leg_costs / size, edge)
+
+
+def scan_markets(
+    books_by_market: Dict[str, Sequence[Union[OrderBook, Dict[str, Any], Ladder]]],
+    side: str = ASKS,
+    threshold: float = 1.0,
+) -> List[Tuple[str, SetFill]]:
+    """Run :func:`executable_set` over many markets, best edge first.
+
+    Args:
+        books_by_market: {condition_id: [book per outcome]}.
+        side: ``"asks"`` or ``"bids"``.
+        threshold: Set value to beat.
+
+    Returns:
+        (condition_id, SetFill) for markets with a positive executable size.
+    """
+    fills = [(cond, executable_set(books, side=side, threshold=threshold)) for cond, books in books_by_market.items()]
+    fills = [(cond, f) for cond, f in fills if f.size > 0]
+    fills.sort(key=lambda cf: cf[1].edge, reverse=True)
+    return fills
+
@@ -0,0 +1,89 @@
+"""Pluggable JSON decoding: orjson, then msgspec, then the standard library.
+
+Large Gamma pages make JSON decoding a visible share of a sweep's CPU time.
+:func:`loads` uses the fastest installed backend, and :func:`response_json`
+decodes a ``requests`` response body with it, falling back to
+``response.json()`` when the body is not plain bytes (e.g. in tests) or the
+fast decoder rejects it. Both optional backends decode to the same plain
+dicts/lists/str/int/float as :mod:`json`.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+_BACKENDS: Dict[str, Callable[[Any], Any]] = {}
+
+try:
+    import orjson
+
+    _BACKENDS["orjson"] = orjson.loads
+except ImportError:  # optional
+    pass
+
+try:
+    import msgspec
+
+    def _msgspec_loads(data: Any) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:  # not a ValueError subclass
+            raise ValueError(str(e)) from e
+
+    _BACKENDS["msgspec"] = _msgspec_loads
+except ImportError:  # optional
+    pass
+
+_BACKENDS["json"] = json.loads
+
+_PREFERENCE = ("orjson", "msgspec", "json")
+
+_backend = next(name for name in _PREFERENCE if name in _BACKENDS)
+_loads = _BACKENDS[_backend]
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return [name for name in _PREFERENCE if name in _BACKENDS]
+
+
+def backend() -> str:
+    """Name of the backend :func:`loads` currently uses."""
+    return _backend
+
+
+def set_backend(name: Optional[str] = None) -> None:
+    """Select a backend by name (None picks the fastest installed one).
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global _backend, _loads
+    name = name or available_backends()[0]
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available (installed: {available_backends()})")
+    _backend, _loads = name, _BACKENDS[name]
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from ``bytes`` or ``str`` with the current backend.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    return _loads(data)
+
+
+def response_json(response: Any) -> Any:
+    """Decode a ``requests`` response body with the current backend.
+
+    Falls back to ``response.json()`` when ``response.content`` is not bytes
+    or the fast decoder rejects it (e.g. a non-UTF-8 body), so behaviour and
+    errors match ``requests`` in those cases.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)) and content and _backend != "json":
+        try:
+            return _loads(content)
+        except ValueError:
+            pass
+    return response.json()
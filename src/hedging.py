@@ -0,0 +1,167 @@
+"""Hedged requests: race a duplicate against a slow response.
+
+A :class:`Hedger` keeps a sliding window of recent latencies per endpoint.
+When a call has not finished by the window's ``percentile`` (e.g. p95), the
+same request is issued once more and whichever copy answers first wins; the
+loser is left to finish in the background and its result is discarded. Only
+idempotent reads (``/book``, ``/prices``) should be hedged.
+
+``stats`` counts ``requests``, ``hedges_fired`` and ``hedges_won`` (the
+duplicate answered first) so the percentile can be tuned: a high fired/won
+ratio means the threshold is too aggressive.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Issue a backup request once a call outlives recent tail latency."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        window: int = 256,
+        min_samples: int = 20,
+        initial_delay: Optional[float] = None,
+        min_delay: float = 0.05,
+        max_hedge_ratio: float = 0.1,
+        max_workers: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the hedger.
+
+        Args:
+            percentile: Latency quantile in (0, 1) after which a hedge fires.
+            window: Latency samples kept per endpoint.
+            min_samples: Samples needed before the percentile is trusted.
+            initial_delay: Hedge delay used until ``min_samples`` is reached
+                (None: do not hedge a cold endpoint).
+            min_delay: Lower bound on the hedge delay in seconds.
+            max_hedge_ratio: Stop hedging while hedges exceed this fraction of
+                requests, so a uniformly slow host is not hit with double load.
+            max_workers: Threads running primaries and hedges.
+            clock: Monotonic time source.
+        """
+        if not 0.0 < percentile < 1.0:
+            raise ValueError(f"percentile must be in (0, 1): {percentile}")
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_workers = max_workers
+        self.clock = clock
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "hedges_fired": 0, "hedges_won": 0}
+
+    def record(self, key: str, latency: float) -> None:
+        """Add one observed latency (seconds) for ``key``."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds to wait before hedging a call to ``key`` (None: never)."""
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            delay = samples[min(len(samples) - 1, int(self.percentile * len(samples)))]
+        return None if delay is None else max(self.min_delay, delay)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hedge")
+            return self._pool
+
+    def _timed(self, key: str, fn: Callable[[], T]) -> T:
+        started = self.clock()
+        result = fn()
+        self.record(key, self.clock() - started)
+        return result
+
+    def call(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn``, racing a duplicate if it is slower than the hedge delay.
+
+        Args:
+            key: Latency bucket, normally the endpoint (e.g. ``src.resilience.endpoint_key``).
+            fn: The idempotent request; called once or twice.
+
+        Returns:
+            The first successful result.
+
+        Raises:
+            Exception: The primary's error if every copy failed.
+        """
+        pool = self._executor()
+        with self._lock:
+            self.stats["requests"] += 1
+        primary = pool.submit(self._timed, key, fn)
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return primary.result()
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        with self._lock:
+            if self.stats["hedges_fired"] >= self.max_hedge_ratio * self.stats["requests"]:
+                hedge = None
+            else:
+                self.stats["hedges_fired"] += 1
+                hedge = pool.submit(self._timed, key, fn)
+        if hedge is None:
+            return primary.result()
+        return self._first_success(primary, hedge)
+
+    def _first_success(self, primary: Future, hedge: Future):
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in (primary, hedge):
+                if fut in done and fut.exception() is None:
+                    if fut is hedge:
+                        with self._lock:
+                            self.stats["hedges_won"] += 1
+                    return fut.result()
+        return primary.result()
+
+    def close(self) -> None:
+        """Shut down the worker threads (in-flight requests finish first)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+_default_hedger: Optional[Hedger] = None
+_default_lock = threading.Lock()
+
+
+def default_hedger() -> Hedger:
+    """Return the process-wide shared :class:`Hedger`, creating it lazily."""
+    global _default_hedger
+    if _default_hedger is None:
+        with _default_lock:
+            if _default_hedger is None:
+                _default_hedger = Hedger()
+    return _default_hedger
+
+
+def set_default_hedger(hedger: Optional[Hedger]) -> None:
+    """Replace the shared hedger (None resets to a lazily created default)."""
+    global _default_hedger
+    with _default_lock:
+        _default_hedger = hedger
@@ -0,0 +1,122 @@
+"""Persistent SQLite cache of price-history points.
+
+Price history only ever grows at the tail, so :class:`HistoryCache` keeps
+every point already fetched, keyed by (condition_id, interval, timestamp),
+and callers only request what came after :meth:`HistoryCache.last_timestamp`.
+The newest cached point is re-requested with the tail and overwritten,
+because the current bar is still moving when it is first fetched.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_PATH = ".polymarket_history.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    condition_id TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts REAL NOT NULL,
+    point TEXT NOT NULL,
+    PRIMARY KEY (condition_id, interval, ts)
+) WITHOUT ROWID
+"""
+
+
+def point_timestamp(point: Dict[str, Any]) -> Optional[float]:
+    """Unix seconds of a history point's ``t`` (epoch number or ISO-8601 string)."""
+    t = point.get("t") if isinstance(point, dict) else None
+    if isinstance(t, (int, float)):
+        return float(t)
+    if isinstance(t, str):
+        try:
+            return float(t)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(t.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+class HistoryCache:
+    """Append-mostly store of history points per (condition_id, interval)."""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file; its directory is created if needed. ``":memory:"``
+                keeps the cache in memory.
+        """
+        self.path = path
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def last_timestamp(self, condition_id: str, interval: str) -> Optional[float]:
+        """Timestamp of the newest cached point, or None if nothing is cached."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(ts) FROM history WHERE condition_id = ? AND interval = ?",
+                (condition_id, interval),
+            ).fetchone()
+        return row[0]
+
+    def points(self, condition_id: str, interval: str) -> List[Dict[str, Any]]:
+        """Every cached point, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT point FROM history WHERE condition_id = ? AND interval = ? ORDER BY ts",
+                (condition_id, interval),
+            ).fetchall()
+        return [json.loads(point) for (point,) in rows]
+
+    def add(self, condition_id: str, interval: str, points: Iterable[Dict[str, Any]]) -> int:
+        """Store points (replacing any with the same timestamp).
+
+        Points without a parseable ``t`` are skipped.
+
+        Returns:
+            Number of points written.
+        """
+        rows = []
+        for point in points:
+            ts = point_timestamp(point)
+            if ts is not None:
+                rows.append((condition_id, interval, ts, json.dumps(point)))
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO history VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+        return len(rows)
+
+    def clear(self, condition_id: Optional[str] = None) -> None:
+        """Drop cached points of one condition, or of every condition."""
+        with self._lock:
+            if condition_id is None:
+                self._conn.execute("DELETE FROM history")
+            else:
+                self._conn.execute("DELETE FROM history WHERE condition_id = ?", (condition_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,154 @@
+"""Incremental complete-set arbitrage detection on price deltas.
+
+The detector keeps each market's running price sum and only re-evaluates the
+markets whose token prices changed since the previous sweep, emitting
+enter/exit events as markets cross the arbitrage threshold.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Union
+
+import numpy as np
+
+from .vectorized import TokenGroups, segment_sums
+
+
+class ArbEvent(NamedTuple):
+    """A market entering or leaving the opportunity set."""
+
+    kind: str  # "enter" or "exit"
+    condition_id: str
+    total: float
+    edge: float
+
+
+class IncrementalArbDetector:
+    """Track per-market price sums and report threshold crossings.
+
+    For ``side="BUY"`` (best asks) a market is an opportunity when the sum of
+    its outcome prices is below ``1 - min_edge``; for ``side="SELL"`` (best
+    bids) when it is above ``1 + min_edge``. Only markets with every outcome
+    priced qualify.
+    """
+
+    def __init__(
+        self,
+        tokens: Union[TokenGroups, Iterable[Any]],
+        side: str = "BUY",
+        min_edge: float = 0.0,
+        resync_every: int = 1000,
+    ):
+        """Initialize the detector.
+
+        Args:
+            tokens: Prebuilt TokenGroups, or tokens to group by market.
+            side: "BUY" for buy-the-set (asks), "SELL" for sell-the-set (bids).
+            min_edge: Minimum distance from 1 to count as an opportunity.
+            resync_every: Recompute all sums exactly after this many updates
+                to discard accumulated floating-point drift.
+        """
+        self.groups = tokens if isinstance(tokens, TokenGroups) else TokenGroups.from_tokens(tokens)
+        self.side = side
+        self.min_edge = min_edge
+        self.resync_every = resync_every
+        n = self.groups.n_tokens
+        self.prices = np.full(n, np.nan)
+        self.sums = np.zeros(len(self.groups))
+        self.n_priced = np.zeros(len(self.groups), dtype=np.int64)
+        self.active = np.zeros(len(self.groups), dtype=bool)
+        self.updates = 0
+        self.touched = np.empty(0, dtype=np.int64)
+        self.touched_last = 0
+
+    def _price(self, value: Any) -> float:
+        if isinstance(value, dict):
+            value = value.get(self.side)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return np.nan
+
+    def _edges(self, idx: np.ndarray) -> np.ndarray:
+        sums = self.sums[idx]
+        return (1.0 - sums) if self.side == "BUY" else (sums - 1.0)
+
+    def update(self, price_map: Dict[str, Any]) -> List[ArbEvent]:
+        """Apply new prices and return events for markets that changed state.
+
+        Args:
+            price_map: {token_id: price} or a ``/prices`` response
+                ({token_id: {side: price_string}}). Unknown tokens are ignored;
+                tokens absent from the map keep their previous price.
+
+        Returns:
+            Enter/exit events for markets touched by this update.
+        """
+        position = self.groups.position
+        idx_list: List[int] = []
+        new_list: List[float] = []
+        for tid, value in price_map.items():
+            i = position.get(str(tid))
+            if i is not None:
+                idx_list.append(i)
+                new_list.append(self._price(value))
+        self.updates += 1
+        self.touched = np.empty(0, dtype=np.int64)
+        self.touched_last = 0
+        if not idx_list:
+            return []
+
+        idx = np.asarray(idx_list, dtype=np.int64)
+        new = np.asarray(new_list, dtype=np.float64)
+        old = self.prices[idx]
+        old_ok, new_ok = np.isfinite(old), np.isfinite(new)
+        changed = (old_ok != new_ok) | (old_ok & new_ok & (old != new))
+        if not changed.any():
+            return []
+        idx, new, old = idx[changed], new[changed], old[changed]
+        old_ok, new_ok = old_ok[changed], new_ok[changed]
+
+        self.prices[idx] = new
+        codes = self.groups.codes[idx]
+        np.add.at(self.sums, codes, np.where(new_ok, new, 0.0) - np.where(old_ok, old, 0.0))
+        np.add.at(self.n_priced, codes, new_ok.astype(np.int64) - old_ok.astype(np.int64))
+
+        if self.resync_every and self.updates % self.resync_every == 0:
+            self.resync()
+
+        markets = np.unique(codes)
+        self.touched = markets
+        self.touched_last = len(markets)
+        return self._evaluate(markets)
+
+    def _evaluate(self, markets: np.ndarray) -> List[ArbEvent]:
+        complete = self.n_priced[markets] == self.groups.sizes[markets]
+        edges = self._edges(markets)
+        now = complete & (edges > self.min_edge)
+        flipped = now != self.active[markets]
+        events: List[ArbEvent] = []
+        for m, is_on, edge in zip(markets[flipped], now[flipped], edges[flipped]):
+            events.append(
+                ArbEvent(
+                    "enter" if is_on else "exit",
+                    self.groups.condition_ids[m],
+                    float(self.sums[m]),
+                    float(edge),
+                )
+            )
+        self.active[markets] = now
+        return events
+
+    def resync(self) -> None:
+        """Recompute every market sum exactly from the stored prices."""
+        sums, n_priced = segment_sums(self.groups, self.prices)
+        self.sums = np.nan_to_num(sums, nan=0.0)
+        self.n_priced = n_priced
+
+    def opportunities(self) -> List[ArbEvent]:
+        """Current opportunity set, best edge first."""
+        markets = np.flatnonzero(self.active)
+        edges = self._edges(markets)
+        order = np.argsort(-edges, kind="stable")
+        return [
+            ArbEvent("enter", self.groups.condition_ids[m], float(self.sums[m]), float(e))
+            for m, e in zip(markets[order], edges[order])
+        ]
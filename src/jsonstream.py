@@ -0,0 +1,165 @@
+"""Incremental parsing of large JSON arrays from a byte stream.
+
+Catalog responses are one big array (Gamma ``/markets``) or an object with a
+``data`` array (CLOB ``/simplified-markets``). :class:`JsonArrayStream`
+consumes the body chunk by chunk, cuts out each complete array element with
+a few regex scans (no full-document parse) and decodes it with
+:func:`src.fastjson.loads`, so the first markets are usable while the rest of
+the page is still downloading and only one element is held decoded at a time.
+
+This is a splitter, not a validating parser: it assumes well-formed JSON
+and raises ``ValueError`` only on structural surprises or truncation.
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .fastjson import loads
+
+_WS = b" \t\r\n"
+# After a string's opening quote: everything up to and including the closing one.
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+
+_OPEN = frozenset(b"[{")
+_QUOTE = ord('"')
+
+
+def _value_end(buf: bytearray, pos: int) -> Optional[int]:
+    """End offset of the JSON value starting at ``buf[pos]``, None if incomplete."""
+    first = buf[pos]
+    if first == _QUOTE:
+        m = _STRING_REST.match(buf, pos + 1)
+        return m.end() if m else None
+    if first not in _OPEN:
+        m = _SCALAR_END.search(buf, pos)
+        return m.start() if m else None
+    depth = 0
+    i = pos
+    while True:
+        m = _STRUCTURAL.search(buf, i)
+        if m is None:
+            return None
+        i = m.end()
+        ch = buf[m.start()]
+        if ch == _QUOTE:
+            s = _STRING_REST.match(buf, i)
+            if s is None:
+                return None
+            i = s.end()
+        elif ch in _OPEN:
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return i
+
+
+class JsonArrayStream:
+    """Iterate the elements of a streamed JSON array.
+
+    The body may be a top-level array, or an object whose ``key`` member is
+    the array. Other top-level members of such an object (e.g.
+    ``next_cursor``) are decoded into :attr:`fields` as they are passed; a
+    member that follows the array is only available once iteration finishes.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str = "data"):
+        """Wrap a chunk iterator.
+
+        Args:
+            chunks: Body chunks, e.g. ``response.iter_content(65536)``.
+            key: Member holding the array when the body is an object.
+        """
+        self._chunks = iter(chunks)
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self._buf = bytearray()
+        self._pos = 0
+        self._eof = False
+
+    def _more(self) -> bool:
+        if self._eof:
+            return False
+        for chunk in self._chunks:
+            if chunk:
+                if self._pos > 1 << 16:  # drop consumed bytes now and then
+                    del self._buf[: self._pos]
+                    self._pos = 0
+                self._buf.extend(chunk)
+                return True
+        self._eof = True
+        return False
+
+    def _peek(self) -> Optional[int]:
+        """Next non-whitespace byte (not consumed), None at end of input."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._more():
+                return None
+
+    def _expect(self, ch: bytes) -> None:
+        got = self._peek()
+        if got != ch[0]:
+            found = "end of input" if got is None else repr(chr(got))
+            raise ValueError(f"expected {ch.decode()!r} in JSON stream, found {found}")
+        self._pos += 1
+
+    def _take(self) -> bytes:
+        """Consume and return the raw bytes of the next value."""
+        if self._peek() is None:
+            raise ValueError("truncated JSON stream")
+        while True:
+            end = _value_end(self._buf, self._pos)
+            if end is not None:
+                raw = bytes(self._buf[self._pos : end])
+                self._pos = end
+                return raw
+            if not self._more():
+                if self._buf[self._pos] not in _OPEN and self._buf[self._pos] != _QUOTE:
+                    raw = bytes(self._buf[self._pos :])  # scalar at end of input
+                    self._pos = len(self._buf)
+                    return raw
+                raise ValueError("truncated JSON stream")
+
+    def _elements(self) -> Iterator[Any]:
+        self._expect(b"[")
+        if self._peek() == ord("]"):
+            self._pos += 1
+            return
+        while True:
+            yield loads(self._take())
+            sep = self._peek()
+            self._pos += 1
+            if sep == ord("]"):
+                return
+            if sep != ord(","):
+                raise ValueError("malformed JSON array in stream")
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self._peek()
+        if first == ord("["):
+            yield from self._elements()
+            return
+        self._expect(b"{")
+        if self._peek() == ord("}"):
+            return
+        while True:
+            name = loads(self._take())
+            self._expect(b":")
+            if name == self.key and self._peek() == ord("["):
+                yield from self._elements()
+            else:
+                self.fields[name] = loads(self._take())
+            sep = self._peek()
+            self._pos += 1
+            if sep == ord("}"):
+                return
+            if sep != ord(","):
+                raise ValueError("malformed JSON object in stream")
@@ -0,0 +1,248 @@
+"""Compact market and token models decoded from Gamma and CLOB payloads.
+
+Raw Gamma markets carry ~90 keys, most of which the scanners never read.
+:class:`Market` and :class:`Token` keep only the hot-path fields in
+``__slots__`` and parse the stringified ``outcomes``, ``outcomePrices`` and
+``clobTokenIds`` fields once, at ingest.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .fastjson import loads
+from .projection import SideStore, default_side_store
+
+
+def parse_list_field(value: Any) -> Tuple:
+    """Parse a list field that may arrive as a JSON-encoded string.
+
+    Args:
+        value: A list, a JSON string such as '["Yes", "No"]', or None.
+
+    Returns:
+        Tuple of items (empty if the value is missing or malformed).
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    if isinstance(value, str):
+        return _parse_list_string(value)
+    return ()
+
+
+@lru_cache(maxsize=8192)
+def _parse_list_string(value: str) -> Tuple:
+    # Outcome labels like '["Yes", "No"]' repeat across most markets, and the
+    # same market is often re-ingested, so decoded strings are memoized.
+    try:
+        parsed = loads(value)
+    except ValueError:
+        return (value,)
+    if isinstance(parsed, list):
+        return tuple(parsed)
+    return (value,)
+
+
+def to_float(value: Any, default: float = math.nan) -> float:
+    """Convert a possibly-string numeric field to float, ``default`` if missing."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _first_event_id(events: Any) -> Optional[str]:
+    if isinstance(events, list) and events and isinstance(events[0], dict):
+        event_id = events[0].get("id")
+        return str(event_id) if event_id is not None else None
+    return None
+
+
+class Token:
+    """A single outcome token of a market."""
+
+    __slots__ = ("token_id", "condition_id", "label", "active", "closed", "price")
+
+    def __init__(
+        self,
+        token_id: Optional[str],
+        condition_id: Optional[str],
+        label: Optional[str] = None,
+        active: bool = True,
+        closed: bool = False,
+        price: float = math.nan,
+    ):
+        self.token_id = token_id
+        self.condition_id = condition_id
+        self.label = label
+        self.active = active
+        self.closed = closed
+        self.price = price
+
+    @classmethod
+    def from_simplified(cls, market: Dict[str, Any], token: Dict[str, Any]) -> "Token":
+        """Build a token from a CLOB simplified market and one of its tokens."""
+        tid = token.get("token_id")
+        return cls(
+            token_id=str(tid) if tid is not None else None,
+            condition_id=market.get("condition_id"),
+            label=token.get("name") or token.get("outcome") or token.get("title"),
+            active=bool(market.get("active")),
+            closed=bool(market.get("closed")),
+            price=to_float(token.get("price")),
+        )
+
+    def __repr__(self) -> str:
+        return f"Token(token_id={self.token_id!r}, label={self.label!r}, price={self.price!r})"
+
+
+class Market:
+    """A market reduced to the fields used for pricing and scheduling."""
+
+    __slots__ = (
+        "id",
+        "condition_id",
+        "question",
+        "slug",
+        "active",
+        "closed",
+        "outcomes",
+        "outcome_prices",
+        "clob_token_ids",
+        "best_bid",
+        "best_ask",
+        "spread",
+        "last_trade_price",
+        "neg_risk",
+        "neg_risk_market_id",
+        "event_id",
+        "tick_size",
+        "volume_24hr",
+        "liquidity",
+        "one_hour_price_change",
+        "one_day_price_change",
+        "end_date",
+        "tokens",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+        if self.tokens is None:
+            self.tokens = ()
+
+    @classmethod
+    def from_gamma(cls, data: Dict[str, Any]) -> "Market":
+        """Decode a Gamma ``/markets`` entry.
+
+        Args:
+            data: Raw Gamma market dictionary.
+
+        Returns:
+            Market with its outcome tokens built from ``clobTokenIds``.
+        """
+        condition_id = data.get("conditionId") or data.get("condition_id")
+        active = bool(data.get("active"))
+        closed = bool(data.get("closed"))
+        outcomes = parse_list_field(data.get("outcomes"))
+        prices = tuple(to_float(p) for p in parse_list_field(data.get("outcomePrices")))
+        token_ids = tuple(str(t) for t in parse_list_field(data.get("clobTokenIds")))
+        tokens = tuple(
+            Token(
+                token_id=tid,
+                condition_id=condition_id,
+                label=outcomes[i] if i < len(outcomes) else None,
+                active=active,
+                closed=closed,
+                price=prices[i] if i < len(prices) else math.nan,
+            )
+            for i, tid in enumerate(token_ids)
+        )
+        return cls(
+            id=data.get("id"),
+            condition_id=condition_id,
+            question=data.get("question"),
+            slug=data.get("slug"),
+            active=active,
+            closed=closed,
+            outcomes=outcomes,
+            outcome_prices=prices,
+            clob_token_ids=token_ids,
+            best_bid=to_float(data.get("bestBid")),
+            best_ask=to_float(data.get("bestAsk")),
+            spread=to_float(data.get("spread")),
+            last_trade_price=to_float(data.get("lastTradePrice")),
+            neg_risk=bool(data.get("negRisk")),
+            neg_risk_market_id=data.get("negRiskMarketID") or None,
+            event_id=_first_event_id(data.get("events")),
+            tick_size=to_float(data.get("orderPriceMinTickSize")),
+            volume_24hr=to_float(data.get("volume24hr"), 0.0),
+            liquidity=to_float(data.get("liquidityNum", data.get("liquidity")), 0.0),
+            one_hour_price_change=to_float(data.get("oneHourPriceChange"), 0.0),
+            one_day_price_change=to_float(data.get("oneDayPriceChange"), 0.0),
+            end_date=data.get("endDate") or data.get("end_date_iso"),
+            tokens=tokens,
+        )
+
+    @classmethod
+    def from_simplified(cls, data: Dict[str, Any]) -> "Market":
+        """Decode a CLOB ``/simplified-markets`` entry."""
+        tokens = tuple(Token.from_simplified(data, t) for t in (data.get("tokens") or []))
+        return cls(
+            condition_id=data.get("condition_id"),
+            active=bool(data.get("active")),
+            closed=bool(data.get("closed")),
+            outcomes=tuple(t.label for t in tokens),
+            outcome_prices=tuple(t.price for t in tokens),
+            clob_token_ids=tuple(t.token_id for t in tokens),
+            best_bid=math.nan,
+            best_ask=math.nan,
+            spread=math.nan,
+            last_trade_price=math.nan,
+            neg_risk=bool(data.get("neg_risk")),
+            tick_size=math.nan,
+            volume_24hr=0.0,
+            liquidity=0.0,
+            one_hour_price_change=0.0,
+            one_day_price_change=0.0,
+            tokens=tokens,
+        )
+
+    def details(self, store: Optional[SideStore] = None) -> Dict[str, Any]:
+        """Load the fields offloaded at ingest (description, images, events).
+
+        Args:
+            store: Side store the market was projected into (default: the
+                process-wide one, see :mod:`src.projection`).
+
+        Returns:
+            The offloaded fields, or an empty dict if none were stored.
+        """
+        store = store if store is not None else default_side_store()
+        return store.get(self.condition_id or self.id)
+
+    def __repr__(self) -> str:
+        return f"Market(condition_id={self.condition_id!r}, question={self.question!r})"
+
+
+def token_fields(token: Any) -> Tuple[Optional[str], Optional[str], bool]:
+    """Return (condition_id, token_id, closed) from a flattened row dict or a :class:`Token`."""
+    if isinstance(token, Token):
+        return token.condition_id, token.token_id, token.closed
+    return token.get("condition_id"), token.get("token_id"), bool(token.get("closed"))
+
+
+def markets_from_gamma(payload: Iterable[Dict[str, Any]]) -> List[Market]:
+    """Decode a list of Gamma market dictionaries."""
+    return [Market.from_gamma(m) for m in payload if isinstance(m, dict)]
+
+
+def tokens_from_simplified(page_json: Dict[str, Any]) -> List[Token]:
+    """Flatten a CLOB simplified-markets page into tokens."""
+    return [
+        Token.from_simplified(m, t)
+        for m in page_json.get("data", [])
+        for t in (m.get("tokens") or [])
+    ]
@@ -0,0 +1,173 @@
+"""Event-level arbitrage across neg-risk market groups.
+
+In a neg-risk event exactly one of the grouped markets resolves YES, so the
+YES prices across the whole event should sum to 1. The grouping is computed
+once from the catalog; every sweep is then a price gather plus a segmented
+sum over the precomputed layout.
+
+A sum is only meaningful over the event's full membership, so the index is
+given each event's expected live-market count (see
+:func:`event_sizes_from_gamma`) and ranks only events it holds completely.
+Both sides count a market as live when it is active and not closed, matching
+the ``active=True`` catalog the index is built from.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from .models import Market
+from .vectorized import TokenGroups, rank, segment_sums
+
+
+class EventSum(NamedTuple):
+    """YES-price sum of one neg-risk event."""
+
+    event_id: str
+    n_markets: int
+    n_priced: int
+    total: float
+    deviation: float  # total - 1 (NaN unless every market is priced)
+
+
+def _yes_token(market: Market) -> Optional[str]:
+    for token in market.tokens:
+        if isinstance(token.label, str) and token.label.lower() == "yes":
+            return token.token_id
+    return market.tokens[0].token_id if market.tokens else None
+
+
+def is_live(active: Any, closed: Any) -> bool:
+    """Whether a market counts toward its event's membership (active, not closed)."""
+    return bool(active) and not closed
+
+
+def event_key(market: Market) -> Optional[str]:
+    """Grouping key of a neg-risk market: its negRiskMarketID, else its event id."""
+    if not market.neg_risk:
+        return None
+    if market.neg_risk_market_id:
+        return market.neg_risk_market_id
+    return f"event:{market.event_id}" if market.event_id else None
+
+
+def event_sizes_from_gamma(events: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Open-market count per event key from Gamma ``/events`` payloads.
+
+    Args:
+        events: Gamma event dictionaries, each with its ``markets`` list.
+
+    Returns:
+        {event key: number of live markets (see :func:`is_live`)}, keyed like
+        :func:`event_key` (negRiskMarketID, else ``"event:<id>"``).
+    """
+    sizes: Dict[str, int] = {}
+    for event in events:
+        if not isinstance(event, dict) or not event.get("negRisk"):
+            continue
+        key = event.get("negRiskMarketID") or (f"event:{event['id']}" if event.get("id") is not None else None)
+        if key is None:
+            continue
+        markets = event.get("markets") or []
+        sizes[key] = sum(1 for m in markets if isinstance(m, dict) and is_live(m.get("active"), m.get("closed")))
+    return sizes
+
+
+class NegRiskIndex:
+    """Precomputed event -> YES-token layout for neg-risk markets.
+
+    Attributes:
+        groups: TokenGroups whose groups are events and tokens are YES tokens.
+        market_ids: Condition ids of each event's markets, aligned with groups.
+        event_of: {condition_id: event key} for quick reverse lookup.
+        complete: Whether each event's indexed markets match its expected
+            live-market count, aligned with groups.
+    """
+
+    def __init__(
+        self,
+        markets: Iterable[Union[Market, Dict[str, Any]]],
+        event_sizes: Optional[Dict[str, int]] = None,
+    ):
+        """Index live neg-risk markets by event.
+
+        Args:
+            markets: Market models or raw Gamma market dictionaries.
+            event_sizes: Expected live-market count per event key (see
+                :func:`event_sizes_from_gamma`). Events that are missing from
+                it, or that hold fewer markets than expected (e.g. from a top-N
+                volume slice), count as incomplete.
+        """
+        yes_by_event: Dict[str, List[str]] = {}
+        markets_by_event: Dict[str, List[str]] = {}
+        self.event_of: Dict[str, str] = {}
+        for m in markets:
+            market = m if isinstance(m, Market) else Market.from_gamma(m)
+            key = event_key(market)
+            if key is None or not is_live(market.active, market.closed):
+                continue
+            yes = _yes_token(market)
+            if not yes:
+                continue
+            yes_by_event.setdefault(key, []).append(yes)
+            markets_by_event.setdefault(key, []).append(market.condition_id)
+            self.event_of[market.condition_id] = key
+        self.groups = TokenGroups(list(yes_by_event), list(yes_by_event.values()))
+        self.market_ids = [markets_by_event[e] for e in self.groups.condition_ids]
+        sizes = event_sizes or {}
+        expected = np.array([sizes.get(e, -1) for e in self.groups.condition_ids], dtype=np.int64)
+        self.complete = expected == self.groups.sizes
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    @property
+    def yes_token_ids(self) -> List[str]:
+        """Every YES token to price, in layout order."""
+        return self.groups.token_ids
+
+    def event_sums(self, price_map: Dict[str, Dict[str, Any]], side: str = "BUY"):
+        """Per-event (sums, n_priced) arrays from a ``/prices`` response."""
+        return segment_sums(self.groups, self.groups.prices_from_map(price_map, side=side))
+
+    def rank(
+        self,
+        price_map: Dict[str, Dict[str, Any]],
+        side: str = "BUY",
+        k: Optional[int] = None,
+        allow_partial: bool = False,
+    ) -> List[EventSum]:
+        """Rank events by the edge of trading every YES leg.
+
+        Buying every YES at the asks earns ``1 - sum``; selling every YES at
+        the bids earns ``sum - 1``. Only that direction is actionable, so
+        events are ranked by it, not by ``|sum - 1|``.
+
+        Args:
+            price_map: ``/prices`` response for :attr:`yes_token_ids`.
+            side: "BUY" (best asks) or "SELL" (best bids).
+            k: Optional number of events to return.
+            allow_partial: Rank incomplete events and events with unpriced
+                markets too (their sum is only a lower bound, so this is off
+                by default).
+
+        Returns:
+            EventSum list, largest edge first; unranked events last.
+        """
+        sums, n_priced = self.event_sums(price_map, side=side)
+        sizes = self.groups.sizes
+        deviation = sums - 1.0
+        if not allow_partial:
+            deviation = np.where((n_priced == sizes) & self.complete, deviation, np.nan)
+        edge = -deviation if side == "BUY" else deviation
+        order = rank(edge, k=k, descending=True)
+        return [
+            EventSum(
+                self.groups.condition_ids[i],
+                int(sizes[i]),
+                int(n_priced[i]),
+                float(sums[i]),
+                float(deviation[i]),
+            )
+            for i in order
+        ]
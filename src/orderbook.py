@@ -0,0 +1,175 @@
+"""In-memory L2 order book built from CLOB ``/book`` snapshots.
+
+Prices live on a fixed tick grid over [0, 1], so each side is a dense size
+array indexed by tick. A sorted list of occupied ticks per side gives O(1)
+best bid/ask and O(log n) level lookup on update.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+BIDS = "bids"
+ASKS = "asks"
+
+
+class OrderBook:
+    """Tick-indexed L2 book for one outcome token."""
+
+    def __init__(self, token_id: Optional[str] = None, tick_size: float = 0.01):
+        """Initialize an empty book.
+
+        Args:
+            token_id: Token (asset) id the book belongs to.
+            tick_size: Minimum price increment (Gamma ``orderPriceMinTickSize``).
+
+        Raises:
+            ValueError: If tick_size is not in (0, 1].
+        """
+        if not 0 < tick_size <= 1:
+            raise ValueError(f"invalid tick size: {tick_size}")
+        self.token_id = token_id
+        self.tick_size = float(tick_size)
+        self.n_ticks = int(round(1.0 / self.tick_size))
+        self.bid_sizes = np.zeros(self.n_ticks + 1)
+        self.ask_sizes = np.zeros(self.n_ticks + 1)
+        self._bid_ticks: list = []  # ascending; best bid is last
+        self._ask_ticks: list = []  # ascending; best ask is first
+        self._cum: Dict[str, Optional[np.ndarray]] = {BIDS: None, ASKS: None}
+        self.timestamp: Optional[str] = None
+        self.hash: Optional[str] = None
+
+    @classmethod
+    def from_snapshot(cls, book: Dict[str, Any], tick_size: Optional[float] = None) -> "OrderBook":
+        """Build a book from a ``/book`` response.
+
+        Args:
+            book: Raw ``/book`` JSON ({"bids": [{"price", "size"}...], "asks": [...]}).
+            tick_size: Tick size override; defaults to the snapshot's ``tick_size``.
+
+        Returns:
+            Populated OrderBook.
+        """
+        tick = tick_size or float(book.get("tick_size") or 0.01)
+        ob = cls(token_id=book.get("asset_id"), tick_size=tick)
+        ob.apply_snapshot(book)
+        return ob
+
+    def _tick(self, price: float) -> int:
+        idx = int(round(price * self.n_ticks))
+        if not 0 <= idx <= self.n_ticks or abs(idx / self.n_ticks - price) > 1e-9:
+            raise ValueError(f"price {price} is not on the {self.tick_size} tick grid")
+        return idx
+
+    def _levels_to_arrays(self, levels: Iterable[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        levels = list(levels or [])
+        prices = np.fromiter((float(lv["price"]) for lv in levels), dtype=np.float64, count=len(levels))
+        sizes = np.fromiter((float(lv["size"]) for lv in levels), dtype=np.float64, count=len(levels))
+        ticks = np.rint(prices * self.n_ticks).astype(np.int64)
+        off_grid = (ticks < 0) | (ticks > self.n_ticks) | (np.abs(ticks / self.n_ticks - prices) > 1e-9)
+        if off_grid.any():
+            raise ValueError(f"prices off the {self.tick_size} tick grid: {prices[off_grid][:3].tolist()}")
+        return ticks, sizes
+
+    def apply_snapshot(self, book: Dict[str, Any]) -> None:
+        """Replace both sides with the levels of a ``/book`` snapshot."""
+        for side, sizes in ((BIDS, self.bid_sizes), (ASKS, self.ask_sizes)):
+            ticks, level_sizes = self._levels_to_arrays(book.get(side))
+            sizes[:] = 0.0
+            np.add.at(sizes, ticks, level_sizes)
+            occupied = np.flatnonzero(sizes > 0).tolist()
+            if side == BIDS:
+                self._bid_ticks = occupied
+            else:
+                self._ask_ticks = occupied
+            self._cum[side] = None
+        self.timestamp = book.get("timestamp")
+        self.hash = book.get("hash")
+
+    def update(self, side: str, price: float, size: float) -> None:
+        """Set the resting size at one price level (size 0 removes it).
+
+        Args:
+            side: "bids" or "asks".
+            price: Level price.
+            size: New total size at that level.
+        """
+        idx = self._tick(float(price))
+        sizes, ticks = (self.bid_sizes, self._bid_ticks) if side == BIDS else (self.ask_sizes, self._ask_ticks)
+        pos = bisect_left(ticks, idx)
+        present = pos < len(ticks) and ticks[pos] == idx
+        if size > 0 and not present:
+            ticks.insert(pos, idx)
+        elif size <= 0 and present:
+            del ticks[pos]
+        sizes[idx] = max(float(size), 0.0)
+        self._cum[side] = None
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """(price, size) of the best bid, or None if there are no bids."""
+        if not self._bid_ticks:
+            return None
+        idx = self._bid_ticks[-1]
+        return idx / self.n_ticks, float(self.bid_sizes[idx])
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """(price, size) of the best ask, or None if there are no asks."""
+        if not self._ask_ticks:
+            return None
+        idx = self._ask_ticks[0]
+        return idx / self.n_ticks, float(self.ask_sizes[idx])
+
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if either side is empty."""
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def levels(self, side: str, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Price levels in priority order (asks ascending, bids descending).
+
+        Args:
+            side: "bids" or "asks".
+            n: Optional number of levels from the top of the book.
+
+        Returns:
+            (prices, sizes) float64 arrays.
+        """
+        if side == BIDS:
+            ticks = np.asarray(self._bid_ticks[::-1] if n is None else self._bid_ticks[: -n - 1 : -1], dtype=np.int64)
+            sizes = self.bid_sizes[ticks]
+        else:
+            ticks = np.asarray(self._ask_ticks if n is None else self._ask_ticks[:n], dtype=np.int64)
+            sizes = self.ask_sizes[ticks]
+        return ticks / self.n_ticks, sizes
+
+    def _cumulative(self, side: str) -> np.ndarray:
+        cum = self._cum[side]
+        if cum is None:
+            # Asks accumulate upwards from 0, bids downwards from 1.
+            cum = np.cumsum(self.ask_sizes) if side == ASKS else np.cumsum(self.bid_sizes[::-1])[::-1]
+            self._cum[side] = cum
+        return cum
+
+    def depth_at(self, side: str, price: float) -> float:
+        """Cumulative size available at ``price`` or better.
+
+        For asks this is the size offered at or below ``price``; for bids the
+        size bid at or above it. The prefix sums are cached until the next update.
+        """
+        if side == ASKS:
+            idx = int(np.floor(price * self.n_ticks + 1e-9))
+            if idx < 0:
+                return 0.0
+        else:
+            idx = int(np.ceil(price * self.n_ticks - 1e-9))
+            if idx > self.n_ticks:
+                return 0.0
+        idx = min(max(idx, 0), self.n_ticks)
+        return float(self._cumulative(side)[idx])
+
+    def total_depth(self, side: str) -> float:
+        """Total resting size on one side."""
+        return float((self.bid_sizes if side == BIDS else self.ask_sizes).sum())
@@ -1,7 +1,17 @@
 """Polymarket API client for loading market data."""
 
 import requests
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Union
+
+from .cache import DEFAULT_TTLS, TTLCache
+from .conditional import ConditionalCache
+from .fastjson import response_json
+from .jsonstream import JsonArrayStream
+from .models import Market, markets_from_gamma
+from .projection import Projection
+from .ratelimit import HostRateLimiter
+from .resilience import Resilience
+from .transport import PooledAdapter
 
 
 class PolymarketAPI:
@@ -9,24 +19,67 @@ class PolymarketAPI:
     
     BASE_URL = "https://gamma-api.polymarket.com"
     
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        limiter: Optional[HostRateLimiter] = None,
+        resilience: Optional[Resilience] = None,
+        cache: Union[TTLCache, bool] = True,
+        conditional: Union[ConditionalCache, bool] = True,
+        projection: Union[Projection, bool] = False,
+    ):
         """Initialize the Polymarket API client.
         
         Args:
             base_url: Optional custom base URL for the API.
+            limiter: Per-host rate limiter (default: the process-wide one
+                shared with every other client, looked up on every request so
+                ``set_default_limiter`` applies to existing clients).
+            resilience: Retry/circuit-breaker layer (default: the process-wide
+                one, looked up on every request like ``limiter``).
+            cache: Cache for :meth:`get_market`. True gives this client its own
+                TTLCache with the "market" TTL; pass a TTLCache (e.g.
+                ``src.cache.shared_cache("market")``) to share one, or False to
+                always hit the network.
+            conditional: Validator store for conditional GETs. True gives this
+                client its own ConditionalCache: requests repeat the last
+                ETag/Last-Modified and a 304 returns the previously decoded
+                body. False always downloads and decodes the full body.
+            projection: Ingest field projection (see :mod:`src.projection`).
+                With one, market dicts keep only its resident fields and the
+                description, images and events go to its side store, loaded
+                back with ``Market.details()``. True uses the default
+                projection and the shared side store.
         """
         self.base_url = base_url or self.BASE_URL
+        if cache is True:
+            cache = TTLCache(ttl=DEFAULT_TTLS["market"])
+        self.cache: Optional[TTLCache] = None if cache is False else cache
+        if conditional is True:
+            conditional = ConditionalCache()
+        self.conditional: Optional[ConditionalCache] = None if conditional is False else conditional
+        if projection is True:
+            projection = Projection()
+        self.projection: Optional[Projection] = None if projection is False else projection
         self.session = requests.Session()
+        adapter = PooledAdapter(
+            limiter=limiter if limiter is not None else True, resilience=resilience if resilience is not None else True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
-    def get_markets(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    def get_markets(
+        self, limit: int = 100, offset: int = 0, typed: bool = False
+    ) -> Union[List[Dict], List[Market]]:
         """Fetch available markets from Polymarket.
         
         Args:
             limit: Maximum number of markets to return (default: 100).
             offset: Number of markets to skip (default: 0).
+            typed: Decode into compact :class:`Market` objects instead of dicts.
             
         Returns:
-            List of market dictionaries.
+            List of market dictionaries (or Market objects if typed).
             
         Raises:
             requests.RequestException: If the API request fails.
@@ -34,29 +87,85 @@ class PolymarketAPI:
         url = f"{self.base_url}/markets"
         params = {"limit": limit, "offset": offset}
         
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
+        transform = self.projection.project_all if self.projection is not None else None
+        data = self._get_json(url, params=params, transform=transform)
+        return markets_from_gamma(data) if typed else data
+    
+    def iter_markets_stream(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        typed: bool = False,
+        chunk_size: int = 65536,
+    ) -> Iterator[Union[Dict, Market]]:
+        """Stream one ``/markets`` page, yielding each market as its bytes arrive.
+        
+        Unlike :meth:`get_markets`, the body is not buffered and decoded as a
+        whole: markets are cut out of the byte stream one by one (see
+        :mod:`src.jsonstream`), so pricing can start on the first markets of
+        a large page while the rest is still downloading.
+        
+        Args:
+            limit: Maximum number of markets to return (default: 100).
+            offset: Number of markets to skip (default: 0).
+            typed: Decode into compact :class:`Market` objects instead of dicts.
+            chunk_size: Bytes read from the socket at a time.
+            
+        Yields:
+            Market dictionaries (or Market objects if typed).
+            
+        Raises:
+            requests.RequestException: If the API request fails.
+            ValueError: If the body is not a JSON array of markets.
+        """
+        url = f"{self.base_url}/markets"
+        params = {"limit": limit, "offset": offset}
         
-        return response.json()
+        response = self.session.get(url, params=params, stream=True)
+        try:
+            response.raise_for_status()
+            for item in JsonArrayStream(response.iter_content(chunk_size)):
+                if self.projection is not None and isinstance(item, dict):
+                    item = self.projection.project(item)
+                yield Market.from_gamma(item) if typed else item
+        finally:
+            response.close()
     
-    def get_market(self, condition_id: str) -> Dict:
+    def get_market(self, condition_id: str, typed: bool = False) -> Union[Dict, Market]:
         """Fetch a specific market by condition ID.
         
+        Responses are served from :attr:`cache` while fresh, and concurrent
+        calls for the same id share one request. The returned dict may be
+        shared with other callers; do not mutate it.
+        
         Args:
             condition_id: The unique identifier for the market condition.
+            typed: Decode into a compact :class:`Market` instead of a dict.
             
         Returns:
-            Market dictionary with details.
+            Market dictionary with details (or a Market if typed).
             
         Raises:
             requests.RequestException: If the API request fails.
         """
-        url = f"{self.base_url}/markets/{condition_id}"
-        
-        response = self.session.get(url)
+        if self.cache is None:
+            data = self._fetch_market(condition_id)
+        else:
+            data = self.cache.get_or_load(condition_id, lambda: self._fetch_market(condition_id))
+        return Market.from_gamma(data) if typed else data
+    
+    def _fetch_market(self, condition_id: str) -> Dict:
+        transform = self.projection.project if self.projection is not None else None
+        return self._get_json(f"{self.base_url}/markets/{condition_id}", transform=transform)
+    
+    def _get_json(self, url: str, params: Optional[Dict] = None, transform: Optional[Callable] = None):
+        """GET and decode ``url``, conditionally if validators are kept."""
+        if self.conditional is not None:
+            return self.conditional.get_json(self.session, url, params=params, transform=transform)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
-        
-        return response.json()
+        data = response_json(response)
+        return transform(data) if transform is not None else data
     
     def close(self):
         """Close the session."""
@@ -0,0 +1,87 @@
+"""Gamma-side pre-screening to prune CLOB ``/prices`` and ``/book`` calls.
+
+Gamma market payloads already carry ``bestBid``/``bestAsk`` for the first
+(YES) outcome. That is enough to bound the complete-set edges:
+
+* binary market: the NO book mirrors YES, so buying both costs
+  ``bestAsk + (1 - bestBid) = 1 + spread`` and selling both returns
+  ``1 - spread``. Either edge is ``-spread``.
+* neg-risk event: buying every YES costs ``sum(bestAsk)`` and selling every
+  YES returns ``sum(bestBid)`` across the event's markets.
+
+Markets whose estimated edge, widened by a per-leg staleness ``slack``,
+cannot reach ``min_edge`` are dropped before any CLOB request is made.
+Markets without usable Gamma quotes are kept, since they cannot be bounded.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Union
+
+from .models import Market
+from .negrisk import event_key
+
+
+class Prescreen(NamedTuple):
+    """Markets and events that survived pre-screening."""
+
+    markets: List[Market]  # standalone markets to price
+    events: Dict[str, List[Market]]  # neg-risk events to price as a whole
+    n_input: int
+    n_pruned: int
+
+    def token_ids(self) -> List[str]:
+        """Token ids of every surviving market (standalone and event members)."""
+        out = [t.token_id for m in self.markets for t in m.tokens]
+        out += [t.token_id for ms in self.events.values() for m in ms for t in m.tokens]
+        return out
+
+
+def _could_cross(edge_estimate: float, n_legs: int, min_edge: float, slack: float) -> bool:
+    if math.isnan(edge_estimate):
+        return True  # no quote to bound with: keep it
+    return edge_estimate + slack * n_legs > min_edge
+
+
+def prescreen(
+    markets: Iterable[Union[Market, Dict[str, Any]]],
+    min_edge: float = 0.0,
+    slack: float = 0.005,
+) -> Prescreen:
+    """Drop markets and events whose Gamma quotes rule out an arbitrage.
+
+    Args:
+        markets: Market models or raw Gamma market dictionaries.
+        min_edge: Edge (in price units per set) the CLOB check looks for.
+        slack: Allowed staleness of each Gamma quote, per leg.
+
+    Returns:
+        Prescreen with the candidates and pruning counts.
+    """
+    standalone: List[Market] = []
+    by_event: Dict[str, List[Market]] = {}
+    n_input = 0
+    for m in markets:
+        market = m if isinstance(m, Market) else Market.from_gamma(m)
+        n_input += 1
+        if market.closed or not market.tokens:
+            continue
+        key = event_key(market)
+        if key is not None:
+            by_event.setdefault(key, []).append(market)
+        elif len(market.tokens) == 2:
+            spread = market.best_ask - market.best_bid
+            if _could_cross(-spread, 2, min_edge, slack):
+                standalone.append(market)
+        else:
+            standalone.append(market)  # no mirrored-book bound for >2 outcomes
+
+    events: Dict[str, List[Market]] = {}
+    for key, members in by_event.items():
+        n = len(members)
+        buy_edge = 1.0 - math.fsum(m.best_ask for m in members)
+        sell_edge = math.fsum(m.best_bid for m in members) - 1.0
+        if _could_cross(buy_edge, n, min_edge, slack) or _could_cross(sell_edge, n, min_edge, slack):
+            events[key] = members
+
+    kept = len(standalone) + sum(len(ms) for ms in events.values())
+    return Prescreen(standalone, events, n_input, n_input - kept)
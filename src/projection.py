@@ -0,0 +1,235 @@
+"""Field projection of Gamma markets at ingest.
+
+A raw Gamma market carries ~90 keys. The bulk of its size is in a few fields
+the scanners never read on the hot path: the ``description`` text, the
+``image``/``icon`` URLs, and the ``events`` list, which repeats the full
+event (with its own description) for every market. A :class:`Projection`
+keeps only its declared resident fields in the catalog dict and writes the
+offloaded fields to a :class:`SideStore`, keyed by condition id, from which
+they are loaded on demand (:meth:`Projection.details`,
+:meth:`src.models.Market.details`). Every other field is dropped.
+
+When ``events`` is offloaded, the resident dict keeps ``{"id": ...}`` stubs
+of its events so that event grouping (``Market.event_id``) still works.
+"""
+
+import json
+import sqlite3
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .fastjson import loads
+
+# Gamma keys read by src.models.Market.from_gamma and by the dict-based
+# readers in the clients (PolymarketScanner's display, prices and stats).
+RESIDENT_FIELDS = (
+    "id",
+    "conditionId",
+    "condition_id",
+    "question",
+    "slug",
+    "active",
+    "closed",
+    "outcomes",
+    "outcomePrices",
+    "clobTokenIds",
+    "bestBid",
+    "bestAsk",
+    "spread",
+    "lastTradePrice",
+    "negRisk",
+    "negRiskMarketID",
+    "orderPriceMinTickSize",
+    "volume24hr",
+    "liquidityNum",
+    "liquidity",
+    "oneHourPriceChange",
+    "oneDayPriceChange",
+    "endDate",
+    "end_date_iso",
+    "volume",
+    "volume_24hr",
+    "category",
+    "tokens",
+)
+OFFLOADED_FIELDS = ("description", "image", "icon", "events")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS details (
+    key TEXT PRIMARY KEY,
+    blob BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def market_key(market: Dict[str, Any]) -> Optional[str]:
+    """Side-store key of a raw market: its condition id, else its Gamma id."""
+    key = market.get("conditionId") or market.get("condition_id") or market.get("id")
+    return str(key) if key is not None else None
+
+
+def _event_stubs(events: Any) -> List[Dict[str, Any]]:
+    if not isinstance(events, list):
+        return []
+    return [{"id": e.get("id")} for e in events if isinstance(e, dict)]
+
+
+class SideStore:
+    """SQLite store of offloaded market fields, compressed, loaded per key."""
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite file, or ``":memory:"`` (the default) to keep the
+                compressed rows in SQLite's memory rather than as Python
+                objects.
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Store (key, fields) pairs, replacing earlier fields of the same keys.
+
+        Returns:
+            Number of rows written.
+        """
+        rows = [
+            (key, zlib.compress(json.dumps(fields, separators=(",", ":")).encode(), 1))
+            for key, fields in items
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO details VALUES (?, ?)", rows)
+            self._conn.commit()
+        return len(rows)
+
+    def put(self, key: str, fields: Dict[str, Any]) -> None:
+        """Store the offloaded fields of one market."""
+        self.put_many([(key, fields)])
+
+    def get(self, key: Optional[str]) -> Dict[str, Any]:
+        """Offloaded fields of a market (empty if none were stored)."""
+        if key is None:
+            return {}
+        with self._lock:
+            row = self._conn.execute("SELECT blob FROM details WHERE key = ?", (key,)).fetchone()
+        return loads(zlib.decompress(row[0])) if row else {}
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM details WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM details").fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop every stored row."""
+        with self._lock:
+            self._conn.execute("DELETE FROM details")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class Projection:
+    """Ingest-time split of raw markets into resident and offloaded fields."""
+
+    def __init__(
+        self,
+        resident: Iterable[str] = RESIDENT_FIELDS,
+        offload: Iterable[str] = OFFLOADED_FIELDS,
+        store: Optional[SideStore] = None,
+    ):
+        """Declare the projection.
+
+        Args:
+            resident: Keys kept in the catalog dict.
+            offload: Keys written to the side store. A key in both lists is
+                kept resident and not offloaded.
+            store: Side store for offloaded fields (default: the process-wide
+                one, see :func:`default_side_store`).
+        """
+        self.resident = tuple(resident)
+        self.offload = tuple(k for k in offload if k not in self.resident)
+        self.store = store if store is not None else default_side_store()
+
+    def split(self, market: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Split one raw market into (resident, offloaded) dicts without storing."""
+        resident = {k: market[k] for k in self.resident if k in market}
+        offloaded = {k: market[k] for k in self.offload if k in market}
+        if "events" in offloaded:
+            resident["events"] = _event_stubs(offloaded["events"])
+        return resident, offloaded
+
+    def project_all(self, payload: Any) -> Any:
+        """Project a page of raw markets, offloading their fields in one write.
+
+        Non-dict entries are skipped. Offloaded fields of a market without a
+        condition id or id are dropped. A payload that is not a list (e.g. an
+        error object) is returned unchanged.
+
+        Returns:
+            The resident dicts, in payload order.
+        """
+        if not isinstance(payload, list):
+            return payload
+        resident, offloaded = [], []
+        for market in payload:
+            if not isinstance(market, dict):
+                continue
+            kept, rest = self.split(market)
+            key = market_key(market)
+            if rest and key is not None:
+                offloaded.append((key, rest))
+            resident.append(kept)
+        if offloaded:
+            self.store.put_many(offloaded)
+        return resident
+
+    def project(self, market: Dict[str, Any]) -> Dict[str, Any]:
+        """Project one raw market (see :meth:`project_all`)."""
+        if not isinstance(market, dict):
+            return market
+        return self.project_all([market])[0]
+
+    def details(self, key: Optional[str]) -> Dict[str, Any]:
+        """Load the offloaded fields of a market by condition id."""
+        return self.store.get(key)
+
+
+_default_store: Optional[SideStore] = None
+_default_lock = threading.Lock()
+
+
+def default_side_store() -> SideStore:
+    """Return the process-wide shared :class:`SideStore`, creating it lazily."""
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = SideStore()
+    return _default_store
+
+
+def set_default_side_store(store: Optional[SideStore]) -> None:
+    """Replace the shared store (None resets to a lazily created default)."""
+    global _default_store
+    with _default_lock:
+        _default_store = store
@@ -0,0 +1,224 @@
+"""Token-bucket rate limiting, per process and per API host.
+
+:class:`HostRateLimiter` keeps one bucket per host, shared by every client in
+the process (the pooled sessions in :mod:`src.transport`, ``PolymarketAPI``
+and the async client), so concurrent callers together stay at the host's
+allowed rate. A 429 (or a 503 carrying ``Retry-After``) pauses the host for
+the advertised time instead of letting every caller keep hammering it.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+_EPS = 1e-9  # absorbs float drift in the refill arithmetic
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``burst`` stored."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity (default: one second worth, at least 1).
+            clock: Monotonic time source (injectable for tests).
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if available right now."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens + _EPS >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` will be available (0 if already)."""
+        with self._lock:
+            self._refill(self._clock())
+            missing = tokens - self._tokens
+            return missing / self.rate if missing > _EPS else 0.0
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` now, borrowing against future refills if needed.
+
+        Returns:
+            Seconds the caller must wait before using the reservation.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < -_EPS else 0.0
+
+    def acquire(self, tokens: float = 1.0, sleep: Callable[[float], None] = time.sleep) -> None:
+        """Block until ``tokens`` are available, then take them."""
+        while not self.try_acquire(tokens):
+            sleep(self.wait_time(tokens))
+
+
+# Requests per second per host. Polymarket enforces its limits per 10-second
+# window (Gamma /markets ~125, CLOB /book and /prices ~50-200, Data-API ~200);
+# these defaults sit at or under the tightest endpoint of each host.
+DEFAULT_RATES = {
+    "gamma-api.polymarket.com": 12.0,
+    "clob.polymarket.com": 15.0,
+    "data-api.polymarket.com": 20.0,
+}
+
+# Pause applied on a 429 that carries no usable Retry-After header.
+DEFAULT_THROTTLE_PAUSE = 1.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+def _host(url_or_host: str) -> str:
+    return urlsplit(url_or_host).netloc if "://" in url_or_host else url_or_host
+
+
+class HostRateLimiter:
+    """One :class:`TokenBucket` per host plus Retry-After pauses."""
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        default_rate: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rates: Requests per second keyed by host (default: DEFAULT_RATES).
+            default_rate: Rate for hosts not listed in ``rates``.
+            clock: Monotonic time source.
+            sleep: Sleep function used by :meth:`acquire`.
+        """
+        self.rates = dict(DEFAULT_RATES if rates is None else rates)
+        self.default_rate = default_rate
+        self.clock = clock
+        self.sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "delayed": 0, "throttled": 0}
+
+    def bucket(self, url_or_host: str) -> TokenBucket:
+        """The bucket for a host (created on first use)."""
+        host = _host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rates.get(host, self.default_rate), clock=self.clock)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url_or_host: str) -> float:
+        """Reserve one request slot; return the seconds to wait before sending."""
+        host = _host(url_or_host)
+        wait = self.bucket(host).reserve()
+        with self._lock:
+            paused = self._paused_until.get(host, 0.0) - self.clock()
+            self.stats["requests"] += 1
+            wait = max(wait, paused)
+            if wait > 0:
+                self.stats["delayed"] += 1
+        return wait
+
+    def acquire(self, url_or_host: str) -> None:
+        """Block until a request to the host may be sent."""
+        wait = self.reserve(url_or_host)
+        if wait > 0:
+            self.sleep(wait)
+
+    def pause(self, url_or_host: str, seconds: float) -> None:
+        """Hold every request to the host for ``seconds`` from now."""
+        host = _host(url_or_host)
+        with self._lock:
+            until = self.clock() + seconds
+            self._paused_until[host] = max(self._paused_until.get(host, 0.0), until)
+
+    def observe(self, url_or_host: str, status: int, headers: Any) -> Optional[float]:
+        """Feed back a response; pause the host if it was throttled.
+
+        Args:
+            url_or_host: Request URL or host.
+            status: HTTP status code.
+            headers: Response headers (anything with ``.get``).
+
+        Returns:
+            The pause applied in seconds, or None if the response was not a
+            throttle (429, or 503 with ``Retry-After``).
+        """
+        retry_after = headers.get("Retry-After") if headers is not None else None
+        if status != 429 and not (status == 503 and retry_after is not None):
+            return None
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = DEFAULT_THROTTLE_PAUSE
+        self.pause(url_or_host, delay)
+        with self._lock:
+            self.stats["throttled"] += 1
+        return delay
+
+
+_default_limiter: Optional[HostRateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def default_limiter() -> HostRateLimiter:
+    """Return the process-wide shared :class:`HostRateLimiter`, creating it lazily."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_lock:
+            if _default_limiter is None:
+                _default_limiter = HostRateLimiter()
+    return _default_limiter
+
+
+def set_default_limiter(limiter: Optional[HostRateLimiter]) -> None:
+    """Replace the shared limiter (None resets to a lazily created default)."""
+    global _default_limiter
+    with _default_lock:
+        _default_limiter = limiter
@@ -0,0 +1,349 @@
+"""Retries, circuit breakers and outcome counters for HTTP calls.
+
+:class:`Resilience` wraps one request attempt at a time:
+
+* idempotent requests (GETs, plus read-only POSTs such as ``/prices``) that
+  fail with a connection error, a timeout or a retryable 5xx are retried
+  with full-jitter exponential backoff;
+* every endpoint (host plus first path segment, e.g.
+  ``clob.polymarket.com/book``) has a :class:`CircuitBreaker`. After
+  ``failure_threshold`` consecutive failures it opens and calls fail fast
+  with :class:`CircuitOpenError` until ``reset_timeout`` has passed; then one
+  probe is let through to decide whether to close it again;
+* outcomes are counted per endpoint in :attr:`Resilience.stats`;
+* under an active :class:`~src.deadline.Deadline` no retry is started whose
+  backoff would end past the deadline.
+
+The pooled transport (:mod:`src.transport`) routes every request through the
+process-wide instance, so all clients share breaker state per endpoint.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Type, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from .deadline import DeadlineExceeded, current_deadline
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# POST endpoints that only read data and can be repeated safely.
+IDEMPOTENT_POST_PATHS = frozenset({"/prices", "/books", "/midpoints", "/spreads"})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of sending a request to an endpoint whose breaker is open."""
+
+
+def endpoint_key(url: str) -> str:
+    """Breaker/stats key of a URL: host plus first path segment."""
+    parts = urlsplit(url)
+    segment = parts.path.strip("/").split("/", 1)[0]
+    return f"{parts.netloc}/{segment}"
+
+
+def is_idempotent(method: str, url: str) -> bool:
+    """Whether a request may be retried without side effects."""
+    method = method.upper()
+    if method in ("GET", "HEAD", "OPTIONS"):
+        return True
+    return method == "POST" and urlsplit(url).path.rstrip("/") in IDEMPOTENT_POST_PATHS
+
+
+def cap_timeout(
+    timeout: Union[None, float, Tuple[float, float]], limit: Optional[float]
+) -> Union[None, float, Tuple[float, float]]:
+    """Clip a ``requests`` timeout (number or (connect, read)) to ``limit``."""
+    if limit is None:
+        return timeout
+    if timeout is None:
+        return limit
+    if isinstance(timeout, tuple):
+        return tuple(limit if t is None else min(t, limit) for t in timeout)
+    if isinstance(timeout, (int, float)):
+        return min(timeout, limit)
+    return timeout
+
+
+class RetryPolicy:
+    """Full-jitter exponential backoff for idempotent requests."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 4.0,
+        attempt_timeout: Optional[float] = 10.0,
+        retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Attempts per call, including the first.
+            base_delay: Backoff scale in seconds.
+            max_delay: Cap on any single backoff.
+            attempt_timeout: Cap on each attempt's connect/read timeout, so a
+                stalled socket costs one short attempt instead of the caller's
+                full timeout (None keeps the caller's timeout).
+            retry_statuses: Response statuses treated as retryable failures.
+            rng: Random source for the jitter.
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1: {max_attempts}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+        self.retry_statuses = retry_statuses
+        self.rng = rng or random.Random()
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based): uniform in [0, cap]."""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return self.rng.uniform(0.0, cap)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            reset_timeout: Seconds an open breaker waits before a probe.
+            clock: Monotonic time source.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-open)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back a claimed half-open probe whose attempt ended without a verdict."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure; open the breaker at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = self.clock()
+
+
+class Resilience:
+    """Retry policy plus per-endpoint circuit breakers and outcome counters.
+
+    Attributes:
+        stats: {endpoint: Counter} with ``success``, ``retried``, ``failed``
+            and ``short_circuited`` counts.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the layer.
+
+        Args:
+            policy: Retry policy (default: RetryPolicy()).
+            failure_threshold: Consecutive failures that open an endpoint's breaker.
+            reset_timeout: Seconds before an open breaker lets a probe through.
+            clock: Monotonic time source for the breakers.
+            sleep: Sleep function used between retries.
+        """
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.stats: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """The breaker of ``endpoint`` (created on first use)."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock)
+                self._breakers[endpoint] = breaker
+                self.stats[endpoint] = Counter()
+            return breaker
+
+    def _count(self, endpoint: str, outcome: str) -> None:
+        with self._lock:
+            self.stats[endpoint][outcome] += 1
+
+    def _check(self, endpoint: str, breaker: CircuitBreaker) -> None:
+        if not breaker.allow():
+            self._count(endpoint, "short_circuited")
+            raise CircuitOpenError(f"circuit open for {endpoint}")
+
+    @staticmethod
+    def _last(attempt: int, attempts: int, delay: float) -> bool:
+        """Whether this attempt is the last one (out of attempts or out of time)."""
+        deadline = current_deadline()
+        return attempt >= attempts or (deadline is not None and deadline.remaining() <= delay)
+
+    def _settle(
+        self, endpoint: str, breaker: CircuitBreaker, status: Optional[int], last: bool
+    ) -> bool:
+        """Record one attempt's outcome; return True if it should be retried.
+
+        ``status`` is None when the attempt raised a transient error.
+        """
+        if status is not None and status not in self.policy.retry_statuses:
+            breaker.record_success()
+            self._count(endpoint, "success")
+            return False
+        breaker.record_failure()
+        self._count(endpoint, "failed" if last else "retried")
+        return not last
+
+    def call(
+        self,
+        url: str,
+        send: Callable[[], requests.Response],
+        idempotent: bool = True,
+    ) -> requests.Response:
+        """Run ``send`` under the endpoint's breaker, retrying if allowed.
+
+        Args:
+            url: Request URL (selects the breaker and stats entry).
+            send: Performs one attempt and returns its response.
+            idempotent: Allow retries (failures still count toward the breaker).
+
+        Returns:
+            The first non-retryable response, or the last retryable-status
+            response once attempts are exhausted.
+
+        Raises:
+            CircuitOpenError: If the endpoint's breaker is open.
+            requests.ConnectionError, requests.Timeout: From the last attempt.
+        """
+        endpoint = endpoint_key(url)
+        breaker = self.breaker(endpoint)
+        attempts = self.policy.max_attempts if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            self._check(endpoint, breaker)
+            delay = self.policy.backoff(attempt)
+            try:
+                response = send()
+            except DeadlineExceeded:
+                # The caller's budget ran out; that says nothing about the endpoint.
+                breaker.release()
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                if not self._settle(endpoint, breaker, None, self._last(attempt, attempts, delay)):
+                    raise
+            else:
+                last = self._last(attempt, attempts, delay)
+                if not self._settle(endpoint, breaker, response.status_code, last):
+                    return response
+                response.close()
+            self.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def call_async(
+        self,
+        url: str,
+        send: Callable[[], Awaitable[Any]],
+        transient: Tuple[Type[BaseException], ...],
+        idempotent: bool = True,
+    ) -> Any:
+        """Async counterpart of :meth:`call` for aiohttp-style responses.
+
+        Args:
+            url: Request URL (selects the breaker and stats entry).
+            send: Coroutine function performing one attempt; its result must
+                have a ``status`` attribute.
+            transient: Exception types counted as retryable failures (e.g.
+                ``(aiohttp.ClientConnectionError, asyncio.TimeoutError)``).
+            idempotent: Allow retries.
+
+        Returns:
+            The first non-retryable result, or the last one once attempts
+            are exhausted.
+
+        Raises:
+            CircuitOpenError: If the endpoint's breaker is open.
+        """
+        endpoint = endpoint_key(url)
+        breaker = self.breaker(endpoint)
+        attempts = self.policy.max_attempts if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            self._check(endpoint, breaker)
+            delay = self.policy.backoff(attempt)
+            try:
+                result = await send()
+            except transient:
+                if not self._settle(endpoint, breaker, None, self._last(attempt, attempts, delay)):
+                    raise
+            else:
+                if not self._settle(endpoint, breaker, result.status, self._last(attempt, attempts, delay)):
+                    return result
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+_default_resilience: Optional[Resilience] = None
+_default_lock = threading.Lock()
+
+
+def default_resilience() -> Resilience:
+    """Return the process-wide shared :class:`Resilience`, creating it lazily."""
+    global _default_resilience
+    if _default_resilience is None:
+        with _default_lock:
+            if _default_resilience is None:
+                _default_resilience = Resilience()
+    return _default_resilience
+
+
+def set_default_resilience(resilience: Optional[Resilience]) -> None:
+    """Replace the shared layer (None resets to a lazily created default)."""
+    global _default_resilience
+    with _default_lock:
+        _default_resilience = resilience
@@ -0,0 +1,309 @@
+"""Priority-scheduled re-pricing for a resident market catalog.
+
+Each market gets a priority score from its Gamma activity fields
+(``volume24hr``, ``liquidityNum``, ``oneHourPriceChange`` and time to
+``endDate``). The score maps geometrically onto a re-pricing interval, so
+hot markets are refreshed sub-second while dormant ones are polled rarely.
+:class:`ScannerDaemon` keeps the catalog in memory and spends a global
+requests-per-second budget on whichever markets are due; with an
+:class:`~src.adaptive.AdaptiveIntervals` controller the intervals then follow
+each market's observed price changes.
+"""
+
+import heapq
+import itertools
+import math
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .adaptive import AdaptiveIntervals
+from .incremental import ArbEvent, IncrementalArbDetector
+from .models import Market
+from .ratelimit import TokenBucket
+
+
+def _hours_to_end(market: Market, now: datetime) -> float:
+    if not market.end_date:
+        return math.inf
+    try:
+        end = datetime.fromisoformat(market.end_date.replace("Z", "+00:00"))
+    except ValueError:
+        return math.inf
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return max(0.0, (end - now).total_seconds() / 3600.0)
+
+
+def priority_score(market: Market, now: Optional[datetime] = None) -> float:
+    """Score in [0, 1]: higher means re-price more often.
+
+    Weighted blend of 24h volume and liquidity (log-scaled, saturating around
+    $10M), the last hour's absolute price move, and proximity of resolution.
+    """
+    now = now or datetime.now(timezone.utc)
+    volume = min(1.0, math.log10(1.0 + max(market.volume_24hr or 0.0, 0.0)) / 7.0)
+    liquidity = min(1.0, math.log10(1.0 + max(market.liquidity or 0.0, 0.0)) / 7.0)
+    move = min(1.0, abs(market.one_hour_price_change or 0.0) / 0.05)
+    hours = _hours_to_end(market, now)
+    ending = 0.0 if math.isinf(hours) else 1.0 / (1.0 + hours / 24.0)
+    return 0.35 * volume + 0.25 * liquidity + 0.25 * move + 0.15 * ending
+
+
+def interval_for(score: float, min_interval: float = 0.5, max_interval: float = 300.0) -> float:
+    """Map a [0, 1] score geometrically onto [max_interval, min_interval]."""
+    score = min(1.0, max(0.0, score))
+    return max_interval * (min_interval / max_interval) ** score
+
+
+class RepricingScheduler:
+    """Min-heap of (due time, market) with a per-market interval."""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self.intervals: Dict[str, float] = {}
+        self._due: Dict[str, float] = {}
+
+    def schedule(self, market_id: str, interval: float, due: float) -> None:
+        """(Re)schedule ``market_id`` every ``interval`` seconds, next at ``due``."""
+        self.intervals[market_id] = interval
+        self._due[market_id] = due
+        heapq.heappush(self._heap, (due, next(self._seq), market_id))
+
+    def remove(self, market_id: str) -> None:
+        """Stop scheduling a market (its heap entry is dropped lazily)."""
+        self.intervals.pop(market_id, None)
+        self._due.pop(market_id, None)
+
+    def peek(self) -> Optional[Tuple[float, str]]:
+        """(due time, market id) of the earliest entry, or None if empty."""
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)  # stale entry
+        return (self._heap[0][0], self._heap[0][2]) if self._heap else None
+
+    def next_due(self) -> Optional[float]:
+        """Earliest due time, or None if nothing is scheduled."""
+        head = self.peek()
+        return head[0] if head else None
+
+    def due_of(self, market_id: str) -> Optional[float]:
+        """Next due time of ``market_id`` (None if not scheduled or popped)."""
+        return self._due.get(market_id)
+
+    def pop_due(self, now: float, limit: int) -> List[str]:
+        """Remove and return up to ``limit`` markets due at ``now``, most overdue first."""
+        out: List[str] = []
+        while len(out) < limit:
+            head = self.peek()
+            if head is None or head[0] > now:
+                break
+            _, _, market_id = heapq.heappop(self._heap)
+            del self._due[market_id]
+            out.append(market_id)
+        return out
+
+    def reschedule(self, market_id: str, now: float) -> None:
+        """Schedule the next refresh one interval after ``now``."""
+        interval = self.intervals.get(market_id)
+        if interval is not None:
+            self.schedule(market_id, interval, now + interval)
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+
+class ScannerDaemon:
+    """Long-running re-pricing loop over a resident catalog.
+
+    Every step spends one request from the global budget on a ``/prices``
+    batch made of the most overdue markets, feeds the result to an
+    :class:`IncrementalArbDetector` and reschedules those markets.
+    """
+
+    def __init__(
+        self,
+        markets: Iterable[Market],
+        fetch_prices: Callable[[List[str]], Dict[str, Dict[str, str]]],
+        requests_per_second: float = 5.0,
+        batch_size: int = 50,
+        min_edge: float = 0.0,
+        min_interval: float = 0.5,
+        max_interval: float = 300.0,
+        on_event: Optional[Callable[[ArbEvent], None]] = None,
+        adaptive: Union[bool, AdaptiveIntervals, None] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            markets: Catalog to keep resident.
+            fetch_prices: Called with token ids, returns a ``/prices`` response
+                (e.g. ``lambda ids: api.get_best_prices(ids)``).
+            requests_per_second: Global budget for ``fetch_prices`` calls.
+            batch_size: Maximum tokens per ``fetch_prices`` call.
+            min_edge: Detector threshold.
+            min_interval: Refresh interval of the hottest markets (seconds).
+            max_interval: Refresh interval of the most dormant markets (seconds).
+            on_event: Callback for each enter/exit event.
+            adaptive: Controller that shortens or backs off each market's
+                interval after every poll. ``True`` builds one with this
+                daemon's bounds; None/False keeps the priority interval.
+            clock: Monotonic time source.
+            sleep: Sleep function (injectable for tests).
+
+        Raises:
+            ValueError: If ``adaptive`` has bounds other than
+                ``min_interval``/``max_interval``.
+        """
+        self.fetch_prices = fetch_prices
+        self.budget = TokenBucket(requests_per_second, burst=1.0, clock=clock)
+        self.batch_size = batch_size
+        self.min_edge = min_edge
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.on_event = on_event
+        if adaptive is True:
+            adaptive = AdaptiveIntervals(min_interval, max_interval)
+        elif isinstance(adaptive, AdaptiveIntervals) and (
+            adaptive.min_interval != min_interval or adaptive.max_interval != max_interval
+        ):
+            raise ValueError(
+                f"adaptive bounds ({adaptive.min_interval}, {adaptive.max_interval}) differ from the "
+                f"daemon's ({min_interval}, {max_interval})"
+            )
+        self.adaptive = adaptive or None
+        self.clock = clock
+        self.sleep = sleep
+        self.scheduler = RepricingScheduler()
+        self.catalog: Dict[str, Market] = {}
+        self.detector: Optional[IncrementalArbDetector] = None
+        self._index: Dict[str, int] = {}
+        self.stats = {"requests": 0, "markets_priced": 0, "events": 0, "errors": 0}
+        self.refresh_catalog(markets)
+
+    def refresh_catalog(self, markets: Iterable[Market]) -> List[ArbEvent]:
+        """Replace the resident catalog, keeping due times (and adapted intervals) of known markets.
+
+        Returns:
+            Exit events for opportunities whose market left the catalog (also
+            passed to ``on_event``).
+        """
+        now = self.clock()
+        utc_now = datetime.now(timezone.utc)
+        catalog = {m.condition_id: m for m in markets if m.condition_id and m.tokens and not m.closed}
+        for market_id in list(self.scheduler.intervals):
+            if market_id not in catalog:
+                self.scheduler.remove(market_id)
+        for market_id, market in catalog.items():
+            known = self.scheduler.intervals.get(market_id)
+            if self.adaptive is not None and known is not None:
+                interval = known
+            else:
+                interval = self.interval_for(market, utc_now)
+            due = self.scheduler.due_of(market_id)
+            self.scheduler.schedule(market_id, interval, now if due is None else due)
+        self.catalog = catalog
+        old = self.detector
+        self.detector = IncrementalArbDetector(
+            [t for m in catalog.values() for t in m.tokens], side="BUY", min_edge=self.min_edge
+        )
+        self._index = {cid: i for i, cid in enumerate(self.detector.groups.condition_ids)}
+        if old is None:
+            return []
+        # Carry known prices over so the new detector does not start blind; its
+        # entries repeat opportunities already reported, so only the difference
+        # between the old and new opportunity sets is emitted.
+        carried = {tid: old.prices[i] for tid, i in old.groups.position.items()}
+        self.detector.update(carried)
+        still_active = {ev.condition_id for ev in self.detector.opportunities()}
+        events = [
+            ArbEvent("exit", ev.condition_id, ev.total, ev.edge)
+            for ev in old.opportunities()
+            if ev.condition_id not in still_active
+        ]
+        self._emit(events)
+        return events
+
+    def interval_for(self, market: Market, now: Optional[datetime] = None) -> float:
+        """Starting re-pricing interval of ``market``.
+
+        The priority-score interval, shortened to the adaptive controller's
+        volatility prior when that is tighter.
+        """
+        interval = interval_for(priority_score(market, now), self.min_interval, self.max_interval)
+        prior = self.adaptive.prior(market) if self.adaptive is not None else None
+        return interval if prior is None else min(interval, prior)
+
+    def _next_batch(self, now: float) -> List[str]:
+        ids: List[str] = []
+        n_tokens = 0
+        while True:
+            head = self.scheduler.peek()
+            if head is None or head[0] > now:
+                break
+            market_id = head[1]
+            size = len(self.catalog[market_id].tokens)
+            if ids and n_tokens + size > self.batch_size:
+                break
+            ids.extend(self.scheduler.pop_due(now, 1))
+            n_tokens += size
+        return ids
+
+    def step(self) -> List[ArbEvent]:
+        """Price one batch of due markets if the budget allows."""
+        now = self.clock()
+        nxt = self.scheduler.next_due()
+        if nxt is None or nxt > now or not self.budget.try_acquire():
+            return []
+        market_ids = self._next_batch(now)
+        token_ids = [t.token_id for mid in market_ids for t in self.catalog[mid].tokens]
+        ok = True
+        try:
+            prices = self.fetch_prices(token_ids)
+        except Exception:
+            prices = {}
+            ok = False
+            self.stats["errors"] += 1
+        self.stats["requests"] += 1
+        self.stats["markets_priced"] += len(market_ids)
+        codes = [self._index[mid] for mid in market_ids]
+        seen = self.detector.n_priced[codes] > 0
+        events = self.detector.update(prices)
+        done = self.clock()
+        if self.adaptive is None or not ok:
+            for market_id in market_ids:
+                self.scheduler.reschedule(market_id, done)
+        else:
+            changed = set(self.detector.touched.tolist())
+            for market_id, code, was_seen in zip(market_ids, codes, seen):
+                interval = self.scheduler.intervals[market_id]
+                if was_seen:  # the first poll only establishes a baseline
+                    interval = self.adaptive.next_interval(interval, code in changed)
+                self.scheduler.schedule(market_id, interval, done + interval)
+        self._emit(events)
+        return events
+
+    def _emit(self, events: List[ArbEvent]) -> None:
+        self.stats["events"] += len(events)
+        if self.on_event is not None:
+            for event in events:
+                self.on_event(event)
+
+    def run(self, duration: Optional[float] = None, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Run steps until ``duration`` seconds pass or ``should_stop()`` is true."""
+        end = None if duration is None else self.clock() + duration
+        while not should_stop() and (end is None or self.clock() < end):
+            self.step()
+            now = self.clock()
+            nxt = self.scheduler.next_due()
+            wait = self.budget.wait_time()
+            if nxt is not None:
+                wait = max(wait, nxt - now)
+            else:
+                wait = max(wait, self.min_interval)
+            if end is not None:
+                wait = min(wait, max(0.0, end - now))
+            if wait > 0:
+                self.sleep(wait)
@@ -0,0 +1,78 @@
+"""Streaming top-k selection for arbitrage opportunities.
+
+A bounded min-heap keeps the ``k`` best items seen so far, so results can be
+reported while a sweep is still in progress instead of sorting every market
+once the sweep completes.
+"""
+
+import heapq
+import itertools
+import math
+from typing import Any, Generic, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """Keep the ``k`` items with the largest score."""
+
+    def __init__(self, k: int):
+        """Initialize the selector.
+
+        Args:
+            k: Number of items to keep.
+        """
+        self.k = k
+        self._heap: List[Tuple[float, int, T]] = []
+        self._seq = itertools.count()
+
+    def push(self, score: float, item: T) -> bool:
+        """Offer an item; return True if it is currently in the top k.
+
+        NaN scores are ignored. Ties keep the item that arrived first.
+        """
+        if self.k <= 0 or score is None or math.isnan(score):
+            return False
+        # Negated sequence: among equal scores the older entry ranks higher.
+        entry = (score, -next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def threshold(self) -> float:
+        """Score an item must beat to enter (−inf while not full)."""
+        return self._heap[0][0] if len(self._heap) >= self.k else -math.inf
+
+    def items(self) -> List[Tuple[float, T]]:
+        """Current top items, best first."""
+        return [(score, item) for score, _, item in sorted(self._heap, reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class TwoSidedTopK:
+    """Top-k buy-set and sell-set opportunities, fed with ``SetEdges`` rows."""
+
+    def __init__(self, k: int):
+        """Initialize both selectors.
+
+        Args:
+            k: Number of opportunities kept per direction.
+        """
+        self.buy: TopK[Any] = TopK(k)
+        self.sell: TopK[Any] = TopK(k)
+
+    def push(self, edges: Any) -> bool:
+        """Offer one market's edges; return True if either side changed."""
+        in_buy = self.buy.push(edges.buy_edge, edges)
+        in_sell = self.sell.push(edges.sell_edge, edges)
+        return in_buy or in_sell
+
+    def snapshot(self) -> Tuple[List[Any], List[Any]]:
+        """(best buy-set rows, best sell-set rows), best first."""
+        return [e for _, e in self.buy.items()], [e for _, e in self.sell.items()]
@@ -0,0 +1,297 @@
+"""Pooled HTTP transport shared by the Polymarket helpers.
+
+Each Polymarket host (Gamma, CLOB, Data-API) gets its own ``requests.Session``
+backed by a connection pool, so repeated calls reuse warm TCP/TLS connections
+instead of paying a handshake per request. Every request also passes through
+the shared per-host rate limiter (:mod:`src.ratelimit`) and the shared
+retry/circuit-breaker layer (:mod:`src.resilience`).
+"""
+
+import socket
+import threading
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .deadline import DeadlineExceeded, current_deadline
+from .ratelimit import HostRateLimiter, default_limiter
+from .resilience import Resilience, cap_timeout, default_resilience, is_idempotent
+
+GAMMA_URL = "https://gamma-api.polymarket.com"
+CLOB_URL = "https://clob.polymarket.com"
+DATA_URL = "https://data-api.polymarket.com"
+
+
+def _keep_alive_socket_options(idle: int, interval: int, count: int):
+    """Socket options enabling TCP keep-alive probes where the OS supports them."""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTP adapter with a tunable connection pool, TCP keep-alive and rate limiting.
+
+    With a limiter, each send first waits for the host's token bucket. A
+    throttled response (429, or 503 with ``Retry-After``) pauses the host for
+    the advertised time and the request is re-sent, up to
+    ``max_throttle_retries`` times; the server did not process it, so this is
+    safe for any method.
+
+    With a :class:`~src.resilience.Resilience` layer, each attempt's timeout is
+    capped at the policy's ``attempt_timeout``, idempotent requests that fail
+    with a connection error, timeout or 5xx are retried with jittered backoff,
+    and requests to an endpoint whose circuit is open fail fast with
+    :class:`~src.resilience.CircuitOpenError`. Under an active
+    :class:`~src.deadline.Deadline` every attempt's timeout is also cut to the
+    time left, and a timeout that ends at the deadline raises
+    :class:`~src.deadline.DeadlineExceeded` without counting against the
+    endpoint's breaker.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        keep_alive_idle: int = 60,
+        keep_alive_interval: int = 15,
+        keep_alive_count: int = 4,
+        limiter: Union[HostRateLimiter, bool, None] = None,
+        max_throttle_retries: int = 2,
+        resilience: Union[Resilience, bool, None] = None,
+        **kwargs,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            pool_size: Maximum number of connections kept open per host.
+            keep_alive: Enable TCP keep-alive on pooled sockets.
+            keep_alive_idle: Seconds a connection idles before the first probe.
+            keep_alive_interval: Seconds between keep-alive probes.
+            keep_alive_count: Failed probes before the connection is dropped.
+            limiter: Per-host rate limiter consulted before every send. True
+                follows the process-wide one, looked up on every send so that
+                ``set_default_limiter`` also applies to existing sessions.
+                None or False disables rate limiting.
+            max_throttle_retries: Re-sends after a throttled response.
+            resilience: Retry/circuit-breaker layer. True follows the
+                process-wide one, looked up on every send like ``limiter``.
+                None or False sends each request once.
+        """
+        self.keep_alive = keep_alive
+        self._limiter = None if limiter is False else limiter
+        self.max_throttle_retries = max_throttle_retries
+        self._resilience = None if resilience is False else resilience
+        self._socket_options = (
+            _keep_alive_socket_options(keep_alive_idle, keep_alive_interval, keep_alive_count)
+            if keep_alive
+            else None
+        )
+        kwargs.setdefault("pool_connections", 1)
+        kwargs.setdefault("pool_maxsize", pool_size)
+        super().__init__(**kwargs)
+
+    @property
+    def limiter(self) -> Optional[HostRateLimiter]:
+        """Limiter in effect (the current process-wide one when following it)."""
+        return default_limiter() if self._limiter is True else self._limiter
+
+    @property
+    def resilience(self) -> Optional[Resilience]:
+        """Resilience layer in effect (the current process-wide one when following it)."""
+        return default_resilience() if self._resilience is True else self._resilience
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._socket_options is not None:
+            kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        resilience = self.resilience
+        if resilience is None:
+            return self._send_limited(request, **kwargs)
+        timeout = cap_timeout(kwargs.pop("timeout", None), resilience.policy.attempt_timeout)
+        deadline = current_deadline()
+
+        def attempt():
+            if deadline is None:
+                return self._send_limited(request, timeout=timeout, **kwargs)
+            budget = cap_timeout(timeout, deadline.timeout())
+            try:
+                return self._send_limited(request, timeout=budget, **kwargs)
+            except requests.Timeout as exc:
+                # Cut short by the caller's deadline, not by a slow endpoint:
+                # report it as such so the breaker and retries ignore it.
+                if deadline.expired():
+                    raise DeadlineExceeded(f"deadline exceeded: {request.url}") from exc
+                raise
+
+        return resilience.call(
+            request.url, attempt, idempotent=is_idempotent(request.method, request.url)
+        )
+
+    def _send_limited(self, request, **kwargs):
+        limiter = self.limiter
+        if limiter is None:
+            return super().send(request, **kwargs)
+        attempt = 0
+        while True:
+            limiter.acquire(request.url)
+            response = super().send(request, **kwargs)
+            throttled = limiter.observe(request.url, response.status_code, response.headers)
+            if throttled is None or attempt >= self.max_throttle_retries:
+                return response
+            attempt += 1
+            response.close()
+
+
+def make_session(
+    pool_size: int = 10,
+    keep_alive: bool = True,
+    limiter: Union[HostRateLimiter, bool, None] = None,
+    resilience: Union[Resilience, bool, None] = None,
+) -> requests.Session:
+    """Create a ``requests.Session`` with a pooled keep-alive adapter mounted.
+
+    Args:
+        pool_size: Maximum number of connections kept open per host.
+        keep_alive: Enable TCP keep-alive and persistent connections.
+        limiter: Optional per-host rate limiter for every request (True
+            follows the process-wide one; see :class:`PooledAdapter`).
+        resilience: Optional retry/circuit-breaker layer for every request
+            (True follows the process-wide one).
+
+    Returns:
+        Configured session.
+    """
+    session = requests.Session()
+    adapter = PooledAdapter(
+        pool_size=pool_size, keep_alive=keep_alive, limiter=limiter, resilience=resilience
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+class HostSessions:
+    """One pooled session per Polymarket host (Gamma, CLOB, Data-API)."""
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        pool_sizes: Optional[Dict[str, int]] = None,
+        limiter: Optional[HostRateLimiter] = None,
+        rate_limit: bool = True,
+        resilience: Optional[Resilience] = None,
+        retry: bool = True,
+    ):
+        """Initialize the per-host sessions.
+
+        Args:
+            pool_size: Default pool size for every host.
+            keep_alive: Enable TCP keep-alive and persistent connections.
+            pool_sizes: Optional per-host overrides keyed by "gamma", "clob", "data".
+            limiter: Rate limiter to use (default: the process-wide one,
+                resolved on every request so ``set_default_limiter`` applies).
+            rate_limit: Set False to send without any rate limiting.
+            resilience: Retry/circuit-breaker layer (default: the process-wide
+                one, resolved on every request so ``set_default_resilience``
+                applies).
+            retry: Set False to send every request exactly once.
+        """
+        sizes = {"gamma": pool_size, "clob": pool_size, "data": pool_size}
+        sizes.update(pool_sizes or {})
+        if rate_limit:
+            self._limiter: Union[HostRateLimiter, bool, None] = limiter if limiter is not None else True
+        else:
+            self._limiter = None
+        self._resilience: Union[Resilience, bool, None] = (
+            (resilience if resilience is not None else True) if retry else None
+        )
+        self.sessions: Dict[str, requests.Session] = {
+            name: make_session(
+                pool_size=size, keep_alive=keep_alive, limiter=self._limiter, resilience=self._resilience
+            )
+            for name, size in sizes.items()
+        }
+        self._by_netloc = {
+            urlsplit(GAMMA_URL).netloc: "gamma",
+            urlsplit(CLOB_URL).netloc: "clob",
+            urlsplit(DATA_URL).netloc: "data",
+        }
+
+    @property
+    def limiter(self) -> Optional[HostRateLimiter]:
+        """Limiter in effect for these sessions (None if rate limiting is off)."""
+        return default_limiter() if self._limiter is True else self._limiter
+
+    @property
+    def resilience(self) -> Optional[Resilience]:
+        """Resilience layer in effect for these sessions (None if retries are off)."""
+        return default_resilience() if self._resilience is True else self._resilience
+
+    @property
+    def gamma(self) -> requests.Session:
+        """Session for the Gamma API."""
+        return self.sessions["gamma"]
+
+    @property
+    def clob(self) -> requests.Session:
+        """Session for the CLOB API."""
+        return self.sessions["clob"]
+
+    @property
+    def data(self) -> requests.Session:
+        """Session for the Data-API."""
+        return self.sessions["data"]
+
+    def for_url(self, url: str) -> requests.Session:
+        """Return the session serving ``url`` (Gamma for unknown hosts)."""
+        name = self._by_netloc.get(urlsplit(url).netloc, "gamma")
+        return self.sessions[name]
+
+    def close(self):
+        """Close every session."""
+        for session in self.sessions.values():
+            session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+_default_sessions: Optional[HostSessions] = None
+_default_lock = threading.Lock()
+
+
+def default_sessions() -> HostSessions:
+    """Return the process-wide shared :class:`HostSessions`, creating it lazily."""
+    global _default_sessions
+    if _default_sessions is None:
+        with _default_lock:
+            if _default_sessions is None:
+                _default_sessions = HostSessions()
+    return _default_sessions
+
+
+def set_default_sessions(sessions: Optional[HostSessions]) -> None:
+    """Replace the shared sessions (e.g. with a different pool size).
+
+    Passing ``None`` resets to a lazily created default on next use.
+    """
+    global _default_sessions
+    with _default_lock:
+        _default_sessions = sessions
@@ -0,0 +1,215 @@
+"""Array-backed per-market price sums.
+
+Tokens are laid out contiguously by market so that per-market sums are a
+single segmented reduction (``np.add.reduceat``) over a float64 price array,
+instead of per-element Python loops.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .models import token_fields
+
+
+class TokenGroups:
+    """Tokens grouped by market, stored as contiguous segments.
+
+    Attributes:
+        condition_ids: Market id per group, in group order.
+        token_ids: Token ids ordered so each group is contiguous.
+        codes: int32 group code per token.
+        offsets: Start index of each group in ``token_ids``.
+        sizes: Number of tokens per group.
+    """
+
+    def __init__(self, condition_ids: List[str], token_lists: List[List[str]]):
+        """Build the index from parallel lists of market ids and their tokens.
+
+        Args:
+            condition_ids: Market ids, one per group.
+            token_lists: Token ids of each market (non-empty).
+        """
+        self.condition_ids = list(condition_ids)
+        self.sizes = np.fromiter((len(t) for t in token_lists), dtype=np.int64, count=len(token_lists))
+        self.offsets = np.zeros(len(token_lists), dtype=np.int64)
+        if len(token_lists) > 1:
+            np.cumsum(self.sizes[:-1], out=self.offsets[1:])
+        self.token_ids = [tid for tids in token_lists for tid in tids]
+        self.codes = np.repeat(np.arange(len(token_lists), dtype=np.int32), self.sizes)
+        self.position = {tid: i for i, tid in enumerate(self.token_ids)}
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Any]) -> "TokenGroups":
+        """Group live tokens (row dicts or :class:`Token`) by condition id."""
+        by_market: Dict[str, List[str]] = {}
+        for t in tokens:
+            cond, tid, closed = token_fields(t)
+            if cond and tid and not closed:
+                by_market.setdefault(cond, []).append(tid)
+        return cls(list(by_market), list(by_market.values()))
+
+    def __len__(self) -> int:
+        return len(self.condition_ids)
+
+    @property
+    def n_tokens(self) -> int:
+        return len(self.token_ids)
+
+    def prices_from_map(self, price_map: Dict[str, Dict[str, Any]], side: str = "BUY") -> np.ndarray:
+        """Gather prices from a ``/prices`` response into a float64 array (NaN if missing)."""
+
+        def price(tid: str) -> float:
+            sides = price_map.get(tid)
+            if not sides:
+                return np.nan
+            try:
+                return float(sides.get(side))
+            except (TypeError, ValueError):
+                return np.nan
+
+        return np.fromiter((price(tid) for tid in self.token_ids), dtype=np.float64, count=self.n_tokens)
+
+
+def segment_sums(groups: TokenGroups, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum finite prices per group.
+
+    Args:
+        groups: Token grouping.
+        prices: float64 prices aligned with ``groups.token_ids``.
+
+    Returns:
+        (sums, n_priced): per-group sums (NaN where no token is priced) and
+        the number of finite prices per group.
+    """
+    if len(groups) == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+    finite = np.isfinite(prices)
+    sums = np.add.reduceat(np.where(finite, prices, 0.0), groups.offsets)
+    n_priced = np.add.reduceat(finite.astype(np.int64), groups.offsets)
+    sums[n_priced == 0] = np.nan
+    return sums, n_priced
+
+
+def rank(values: np.ndarray, k: Optional[int] = None, descending: bool = False) -> np.ndarray:
+    """Indices of ``values`` in ranking order with NaN last.
+
+    With ``k`` set, only the best ``k`` indices are returned, selected via
+    ``argpartition`` so the full array is never sorted.
+    """
+    keys = -values if descending else values
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    n = len(keys)
+    if k is None or k >= n:
+        return np.argsort(keys, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(keys, k - 1)[:k]
+    return top[np.argsort(keys[top], kind="stable")]
+
+
+def sum_by_market(
+    groups: TokenGroups,
+    prices: np.ndarray,
+    k: Optional[int] = None,
+    descending: bool = False,
+) -> List[Tuple[str, int, float]]:
+    """Per-market sums as (condition_id, n_tokens, sum) tuples, ranked ascending.
+
+    Args:
+        groups: Token grouping.
+        prices: float64 prices aligned with ``groups.token_ids``.
+        k: Optional number of top markets to return.
+        descending: Rank largest sums first instead of smallest.
+
+    Returns:
+        Ranked list of (condition_id, n_tokens, sum); the sum is NaN unless
+        every outcome is priced (a partial sum would look like an arbitrage),
+        and NaN sums rank last.
+    """
+    sums, n_priced = segment_sums(groups, prices)
+    sums[n_priced < groups.sizes] = np.nan
+    order = rank(sums, k=k, descending=descending)
+    sizes = groups.sizes
+    return [(groups.condition_ids[i], int(sizes[i]), float(sums[i])) for i in order]
+
+
+class SetEdges(NamedTuple):
+    """Buy-set and sell-set edges of one market."""
+
+    condition_id: str
+    n_tokens: int
+    sum_ask: float
+    sum_bid: float
+    buy_edge: float  # 1 - sum of best asks (buy every outcome, redeem 1)
+    sell_edge: float  # sum of best bids - 1 (split 1 into the set, sell every outcome)
+
+
+def market_set_edges(
+    groups: TokenGroups,
+    i: int,
+    price_map: Dict[str, Dict[str, Any]],
+    buy_side: str = "BUY",
+    sell_side: str = "SELL",
+) -> SetEdges:
+    """SetEdges of a single market ``i``; used when markets complete one at a time."""
+    start, size = int(groups.offsets[i]), int(groups.sizes[i])
+    asks: List[float] = []
+    bids: List[float] = []
+    for tid in groups.token_ids[start : start + size]:
+        sides = price_map.get(tid) or {}
+        for out, key in ((asks, buy_side), (bids, sell_side)):
+            try:
+                out.append(float(sides.get(key)))
+            except (TypeError, ValueError):
+                pass
+    sum_ask = float(sum(asks)) if asks else np.nan
+    sum_bid = float(sum(bids)) if bids else np.nan
+    return SetEdges(
+        groups.condition_ids[i],
+        size,
+        sum_ask,
+        sum_bid,
+        1.0 - sum_ask if len(asks) == size else np.nan,
+        sum_bid - 1.0 if len(bids) == size else np.nan,
+    )
+
+
+def two_sided_edges(
+    groups: TokenGroups,
+    price_map: Dict[str, Dict[str, Any]],
+    buy_side: str = "BUY",
+    sell_side: str = "SELL",
+) -> List[SetEdges]:
+    """Buy-set and sell-set edges from a two-sided ``/prices`` response.
+
+    Edges are NaN for markets where any outcome lacks a price on that side.
+    Markets are ranked by their better edge, largest first.
+
+    Args:
+        groups: Token grouping.
+        price_map: {token_id: {"BUY": best_ask, "SELL": best_bid}}.
+        buy_side: Key holding the price paid to buy (best ask).
+        sell_side: Key holding the price received to sell (best bid).
+
+    Returns:
+        Ranked SetEdges list.
+    """
+    asks, n_asks = segment_sums(groups, groups.prices_from_map(price_map, side=buy_side))
+    bids, n_bids = segment_sums(groups, groups.prices_from_map(price_map, side=sell_side))
+    sizes = groups.sizes
+    buy_edge = np.where(n_asks == sizes, 1.0 - asks, np.nan)
+    sell_edge = np.where(n_bids == sizes, bids - 1.0, np.nan)
+    best = np.fmax(buy_edge, sell_edge)
+    order = rank(best, descending=True)
+    return [
+        SetEdges(
+            groups.condition_ids[i],
+            int(sizes[i]),
+            float(asks[i]),
+            float(bids[i]),
+            float(buy_edge[i]),
+            float(sell_edge[i]),
+        )
+        for i in order
+    ]
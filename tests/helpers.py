@@ -0,0 +1,67 @@
+"""Shared test fixtures: market models, a fake clock and HTTP responses."""
+
+import importlib.util
+import io
+import json
+import os
+from typing import Any, Dict, Optional
+
+import requests
+
+from src.models import Market
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def binary_market(cond, **fields):
+    """Gamma binary market ``cond`` with tokens ``<cond>-y``/``<cond>-n`` plus extra Gamma fields."""
+    return Market.from_gamma(
+        {
+            "conditionId": cond,
+            "outcomes": '["Yes", "No"]',
+            "clobTokenIds": f'["{cond}-y", "{cond}-n"]',
+            **fields,
+        }
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def http_response(status: int = 200, body: Any = None, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """Real ``requests.Response`` with ``status``, ``headers`` and a body.
+
+    ``body`` is sent as is if it is bytes, JSON-encoded otherwise, and empty
+    if None. Error statuses raise from ``raise_for_status`` like live ones.
+    """
+    if body is None:
+        content = b""
+    elif isinstance(body, bytes):
+        content = body
+    else:
+        content = json.dumps(body).encode()
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = content
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    return response
+
+
+def load_scanner_module():
+    """Import ``poly client.py`` (not importable by name because of the space)."""
+    spec = importlib.util.spec_from_file_location("poly_client", os.path.join(_ROOT, "poly client.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
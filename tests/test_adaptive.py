@@ -0,0 +1,69 @@
+"""Tests for adaptive per-market polling intervals."""
+
+import pytest
+
+from src.adaptive import AdaptiveIntervals
+from src.scheduler import ScannerDaemon
+from tests.helpers import FakeClock, binary_market
+
+
+def _market(cond, hour=None, day=None):
+    return binary_market(cond, oneHourPriceChange=hour, oneDayPriceChange=day)
+
+
+class TestAdaptiveIntervals:
+    """Test suite for AdaptiveIntervals."""
+
+    def test_speedup_and_backoff_are_clamped(self):
+        """Test changes halve the interval and flat polls double it within bounds."""
+        ctl = AdaptiveIntervals(min_interval=1.0, max_interval=60.0)
+        assert ctl.next_interval(8.0, changed=True) == 4.0
+        assert ctl.next_interval(8.0, changed=False) == 16.0
+        assert ctl.next_interval(1.5, changed=True) == 1.0
+        assert ctl.next_interval(40.0, changed=False) == 60.0
+        with pytest.raises(ValueError):
+            AdaptiveIntervals(backoff=0.5)
+
+    def test_prior_from_price_changes(self):
+        """Test bigger recent moves give shorter starting intervals."""
+        ctl = AdaptiveIntervals(min_interval=0.5, max_interval=300.0, tick=0.01)
+        assert ctl.prior(_market("quiet")) is None
+        assert ctl.prior(_market("hour", hour=-0.1)) == pytest.approx(36.0)
+        assert ctl.prior(_market("day", day=0.24)) == pytest.approx(3600.0 * (0.01 / (0.24 / 24**0.5)) ** 2)
+        assert ctl.prior(_market("flat", hour=0.001)) == 300.0
+        assert ctl.prior(_market("wild", hour=1.0)) == 0.5
+
+    def test_daemon_adapts_to_observed_changes(self):
+        """Test a moving market is polled more often than a flat one."""
+        clock = FakeClock()
+        tick = {"n": 0}
+
+        def fetch(ids):
+            out = {tid: {"BUY": "0.50"} for tid in ids}
+            if "hot-y" in out:  # toggle on every poll of the hot market
+                tick["n"] += 1
+                out["hot-y"] = {"BUY": f"{0.40 + 0.01 * (tick['n'] % 2):.2f}"}
+            return out
+
+        ctl = AdaptiveIntervals(min_interval=1.0, max_interval=64.0)
+        daemon = ScannerDaemon(
+            [_market("hot"), _market("cold")],
+            fetch,
+            requests_per_second=10.0,
+            batch_size=2,
+            min_interval=1.0,
+            max_interval=64.0,
+            adaptive=ctl,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        daemon.run(duration=200.0)
+        assert daemon.scheduler.intervals["hot"] == 1.0
+        assert daemon.scheduler.intervals["cold"] == 64.0
+
+    def test_daemon_rejects_mismatched_bounds(self):
+        """Test the controller must share the daemon's interval bounds."""
+        with pytest.raises(ValueError):
+            ScannerDaemon([_market("a")], dict, max_interval=8.0, adaptive=AdaptiveIntervals(max_interval=64.0))
+        daemon = ScannerDaemon([_market("a")], dict, min_interval=2.0, max_interval=8.0, adaptive=True)
+        assert (daemon.adaptive.min_interval, daemon.adaptive.max_interval) == (2.0, 8.0)
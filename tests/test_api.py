@@ -0,0 +1,123 @@
+"""Tests for the /prices helpers in api.py."""
+
+import math
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+import api
+from src.cache import TTLCache
+from tests.helpers import http_response
+
+
+def _prices_session(prices, fail_on=None):
+    """Mock session answering POST /prices from ``prices`` ({token_id: {side: price}}).
+
+    Any batch containing ``fail_on`` gets a 503.
+    """
+    session = MagicMock()
+
+    def post(url, json=None, timeout=None):
+        tids = [p["token_id"] for p in json["params"]]
+        if fail_on is not None and fail_on in tids:
+            return http_response(503)
+        out = {}
+        for p in json["params"]:
+            price = prices.get(p["token_id"], {}).get(p["side"])
+            if price is not None:
+                out.setdefault(p["token_id"], {})[p["side"]] = price
+        return http_response(200, out)
+
+    session.post.side_effect = post
+    return session
+
+
+class TestGetBestPrices:
+    """Test suite for get_best_prices and sum_yes_by_market."""
+
+    def test_concurrent_merge_with_injected_session(self):
+        """Test concurrent batches merge both sides through the given session."""
+        ids = [f"t{i}" for i in range(7)]
+        prices = {tid: {"BUY": f"0.{i + 1}", "SELL": f"0.0{i + 1}"} for i, tid in enumerate(ids)}
+        session = _prices_session(prices)
+        out = api.get_best_prices(ids, side=("BUY", "SELL"), batch_size=3, max_workers=4, session=session)
+        assert out == prices
+        assert session.post.call_count == 3
+        url = session.post.call_args.args[0]
+        assert url == f"{api.CLOB}/prices"
+        assert session.post.call_args.kwargs["timeout"] == 20
+
+    def test_failed_batch_is_isolated(self):
+        """Test a failing batch is recorded in concurrent mode and raises sequentially."""
+        ids = [f"t{i}" for i in range(6)]
+        prices = {tid: {"BUY": "0.5"} for tid in ids}
+        session = _prices_session(prices, fail_on="t3")
+        errors = []
+        out = api.get_best_prices(ids, batch_size=2, max_workers=3, errors=errors, session=session)
+        assert sorted(out) == ["t0", "t1", "t4", "t5"]
+        assert [batch for batch, _ in errors] == [["t2", "t3"]]
+        assert isinstance(errors[0][1], requests.HTTPError)
+        with pytest.raises(requests.HTTPError):
+            api.get_best_prices(ids, batch_size=2, max_workers=1, session=session)
+
+    def test_market_split_by_failed_batch_is_not_an_opportunity(self):
+        """Test a market whose legs span a failed batch sums to NaN, not a partial sum."""
+        tokens = [{"condition_id": f"f{i}", "token_id": f"f{i}", "closed": False} for i in range(48)]
+        tokens += [{"condition_id": "M", "token_id": f"m{i}", "closed": False} for i in range(3)]
+        prices = {t["token_id"]: {"BUY": "0.34"} for t in tokens}
+        for sums in (
+            api.sum_yes_by_market(tokens, errors=[], session=_prices_session(prices, fail_on="m2")),
+            api.sum_yes_by_market_vectorized(tokens, errors=[], session=_prices_session(prices, fail_on="m2")),
+        ):
+            by_cond = {cond: (n, s) for cond, n, s in sums}
+            assert by_cond["M"][0] == 3
+            assert math.isnan(by_cond["M"][1])
+            assert sums[-1][0] == "M"
+
+
+class TestScanPrescreened:
+    """Test suite for scan_prescreened."""
+
+    def test_events_ranked_on_both_sides(self):
+        """Test neg-risk events kept for their sell edge are ranked on bids too."""
+
+        def gamma(cond, bid, ask, event):
+            return {
+                "conditionId": cond,
+                "bestBid": bid,
+                "bestAsk": ask,
+                "negRisk": True,
+                "negRiskMarketID": event,
+                "active": True,
+                "outcomes": '["Yes", "No"]',
+                "clobTokenIds": f'["{cond}-y", "{cond}-n"]',
+            }
+
+        markets = [gamma("a1", 0.45, 0.47, "CHEAP"), gamma("a2", 0.45, 0.47, "CHEAP")]
+        markets += [gamma("b1", 0.53, 0.55, "RICH"), gamma("b2", 0.53, 0.55, "RICH")]
+        prices = {m["conditionId"] + "-y": {"BUY": str(m["bestAsk"]), "SELL": str(m["bestBid"])} for m in markets}
+        screen, edges, buy, sell = api.scan_prescreened(
+            markets, session=_prices_session(prices), event_sizes={"CHEAP": 2, "RICH": 2}
+        )
+        assert sorted(screen.events) == ["CHEAP", "RICH"]
+        assert edges == []
+        assert buy[0].event_id == "CHEAP" and buy[0].total == pytest.approx(0.94)
+        assert sell[0].event_id == "RICH" and sell[0].total == pytest.approx(1.06)
+
+
+class TestNegRiskEventSizes:
+    """Test suite for neg_risk_event_sizes."""
+
+    def test_sizes_cached_across_sweeps(self):
+        """Test repeated sweeps reuse one /events download until the TTL expires."""
+        events = [{"id": "1", "negRisk": True, "negRiskMarketID": "E1", "markets": [{"active": True}] * 2}]
+        session = MagicMock()
+        session.get.return_value = http_response(200, events)
+        cache = TTLCache(ttl=300)
+
+        for _ in range(3):
+            assert api.neg_risk_event_sizes(session=session, cache=cache) == {"E1": 2}
+        assert session.get.call_count == 1
+        api.neg_risk_event_sizes(session=session, cache=False)
+        assert session.get.call_count == 2
@@ -0,0 +1,76 @@
+"""Tests for the async Polymarket API client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.async_api import AsyncPolymarketAPI
+
+
+def _collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+
+class TestAsyncPolymarketAPI:
+    """Test suite for AsyncPolymarketAPI class."""
+
+    def test_initialization(self):
+        """Test async client initialization."""
+        api = AsyncPolymarketAPI()
+        assert api.base_url == "https://gamma-api.polymarket.com"
+        assert api.session is None
+
+        api_custom = AsyncPolymarketAPI(base_url="https://custom.api.com", max_concurrency=3)
+        assert api_custom.base_url == "https://custom.api.com"
+        assert api_custom.max_concurrency == 3
+
+    @patch('src.async_api.aiohttp.ClientSession')
+    def test_get_markets(self, mock_session_class):
+        """Test fetching markets asynchronously."""
+        mock_response = MagicMock()
+        mock_response.json = AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+        mock_ctx = MagicMock()
+        mock_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_ctx
+        mock_session.close = AsyncMock()
+        mock_session_class.return_value = mock_session
+
+        async def run():
+            async with AsyncPolymarketAPI() as api:
+                return await api.get_markets(limit=10, offset=20)
+
+        markets = asyncio.run(run())
+
+        assert markets[0]["id"] == "1"
+        call_args = mock_session.get.call_args
+        assert "markets" in call_args[0][0]
+        assert call_args[1]["params"] == {"limit": 10, "offset": 20}
+        mock_session.close.assert_awaited_once()
+
+    def test_iter_all_markets_stops_at_short_page(self):
+        """Test concurrent pagination yields in order and stops at the end."""
+        catalog = [{"id": str(i)} for i in range(25)]
+
+        async def fake_get_markets(limit, offset):
+            await asyncio.sleep(0.001 * ((offset // limit) % 3))
+            return catalog[offset:offset + limit]
+
+        api = AsyncPolymarketAPI()
+        api.get_markets = AsyncMock(side_effect=fake_get_markets)
+
+        markets = _collect(api.iter_all_markets(page_size=10, max_concurrency=4))
+
+        assert [m["id"] for m in markets] == [str(i) for i in range(25)]
+
+    def test_iter_all_markets_respects_max_pages(self):
+        """Test max_pages caps the number of requests issued."""
+        api = AsyncPolymarketAPI()
+        api.get_markets = AsyncMock(side_effect=lambda limit, offset: [{"id": offset}] * limit)
+
+        markets = _collect(api.iter_all_markets(page_size=5, max_concurrency=8, max_pages=2))
+
+        assert len(markets) == 10
+        assert api.get_markets.await_count == 2
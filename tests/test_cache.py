@@ -0,0 +1,106 @@
+"""Tests for the in-process TTL cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+import api
+from src.cache import TTLCache
+from src.polymarket_api import PolymarketAPI
+from tests.helpers import FakeClock
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_entries_expire(self):
+        """Test a value is served until its TTL passes, then reloaded."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=5.0, clock=clock)
+        loads = []
+        load = lambda: loads.append(1) or len(loads)
+        assert cache.get_or_load("k", load) == 1
+        clock.sleep(4.9)
+        assert cache.get_or_load("k", load) == 1
+        clock.sleep(0.2)
+        assert cache.get_or_load("k", load) == 2
+        assert cache.get_or_load("short", load, ttl=0.0) == 3
+        assert cache.get("short") is None
+        assert cache.stats == {"hits": 1, "misses": 3, "coalesced": 0, "evictions": 0}
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2, clock=FakeClock())
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert len(cache) == 2 and cache.stats["evictions"] == 1
+
+    def test_single_flight(self):
+        """Test concurrent misses on one key share a single load."""
+        cache = TTLCache()
+        gate = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            gate.wait(2)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_load, "k", load) for _ in range(4)]
+            time.sleep(0.05)
+            gate.set()
+            results = [f.result() for f in futures]
+        assert results == ["value"] * 4
+        assert len(calls) == 1
+        assert cache.stats["misses"] == 1 and cache.stats["coalesced"] == 3
+
+    def test_failed_load_is_not_cached(self):
+        """Test a loader error reaches the caller and the next call retries."""
+        cache = TTLCache()
+
+        def boom():
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", boom)
+        assert cache.get_or_load("k", lambda: "ok") == "ok"
+
+
+class TestCachedEndpoints:
+    """Test suite for caching in PolymarketAPI.get_market and api.get_book."""
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_get_market_is_cached_per_client(self, mock_session_class):
+        """Test repeated get_market calls reuse the response unless caching is off."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"conditionId": "abc", "question": "Q?"}
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+
+        client = PolymarketAPI()
+        assert client.get_market("abc") is client.get_market("abc")
+        assert mock_session.get.call_count == 1
+        assert client.cache.stats["hits"] == 1
+
+        PolymarketAPI(cache=False).get_market("abc")
+        PolymarketAPI(cache=False).get_market("abc")
+        assert mock_session.get.call_count == 3
+
+    def test_get_book_uses_given_cache(self):
+        """Test get_book(cache=...) serves a fresh book without a second GET."""
+        session = MagicMock()
+        session.get.return_value = Mock(status_code=200, json=Mock(return_value={"asset_id": "t1"}))
+        cache = TTLCache(ttl=1.0)
+        assert api.get_book("t1", session=session, cache=cache) == {"asset_id": "t1"}
+        assert api.get_book("t1", session=session, cache=cache) == {"asset_id": "t1"}
+        api.get_book("t1", session=session)
+        assert session.get.call_count == 2
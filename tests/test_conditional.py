@@ -0,0 +1,77 @@
+"""Tests for conditional GETs."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+
+import api
+from src.conditional import ConditionalCache
+from src.polymarket_api import PolymarketAPI
+from tests.helpers import http_response
+
+
+class TestConditionalCache:
+    """Test suite for ConditionalCache."""
+
+    def test_304_returns_stored_body_without_decoding(self):
+        """Test validators are replayed and a 304 serves the stored object."""
+        session = MagicMock()
+        session.get.side_effect = [
+            http_response(200, [{"id": "1"}], {"ETag": '"v1"', "Last-Modified": "Mon"}),
+            http_response(304),
+        ]
+        cache = ConditionalCache()
+
+        body = cache.get_json(session, "https://g/markets", params={"limit": 5})
+        assert body == [{"id": "1"}]
+        assert "headers" not in session.get.call_args.kwargs
+        assert cache.get_json(session, "https://g/markets", params={"limit": 5}) is body
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+        assert cache.stats == {"requests": 2, "not_modified": 1}
+
+    def test_keys_and_unvalidated_responses(self):
+        """Test params are part of the key and responses without validators are not stored."""
+        session = MagicMock()
+        session.get.side_effect = [http_response(200, [1], {"ETag": "a"}), http_response(200, [2]), http_response(200, [3])]
+        cache = ConditionalCache()
+        cache.get_json(session, "https://g/markets", params={"offset": 0})
+        assert cache.validators("https://g/markets", {"offset": 100}) == {}
+        cache.get_json(session, "https://g/markets", params={"offset": 100})
+        assert len(cache) == 1
+        assert cache.get_json(session, "https://g/markets", params={"offset": 0}) == [3]
+        assert len(cache) == 0
+
+    def test_error_status_raises(self):
+        """Test an error response raises instead of being served or stored."""
+        session = MagicMock()
+        session.get.return_value = http_response(503)
+        with pytest.raises(requests.HTTPError):
+            ConditionalCache().get_json(session, "https://g/markets")
+
+
+class TestConditionalEndpoints:
+    """Test suite for conditional GETs in the clients."""
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_get_markets_revalidates(self, mock_session_class):
+        """Test PolymarketAPI.get_markets returns the cached page on 304."""
+        mock_session = Mock()
+        mock_session.get.side_effect = [http_response(200, [{"id": "1"}], {"ETag": "e"}), http_response(304)]
+        mock_session_class.return_value = mock_session
+        client = PolymarketAPI()
+        page = client.get_markets(limit=1)
+        assert page == [{"id": "1"}]
+        assert client.get_markets(limit=1) is page
+        assert client.conditional.stats["not_modified"] == 1
+
+    def test_list_markets_gamma_revalidates(self):
+        """Test list_markets_gamma replays the ETag through the given cache."""
+        session = MagicMock()
+        session.get.side_effect = [http_response(200, {"data": [{"conditionId": "c"}]}, {"ETag": "e"}), http_response(304)]
+        cache = ConditionalCache()
+        payload = api.list_markets_gamma(limit=3, session=session, conditional=cache)
+        assert payload == {"data": [{"conditionId": "c"}]}
+        assert api.list_markets_gamma(limit=3, session=session, conditional=cache) is payload
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": "e"}
+        assert session.get.call_args.kwargs["timeout"] == 20
@@ -0,0 +1,114 @@
+"""Tests for the checkpointed simplified-markets crawler."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+import api
+from src.crawler import END_CURSOR, SimplifiedMarketsCrawler
+
+
+def _session_for(pages):
+    """Mock session serving {cursor: page_dict} as raw JSON bodies."""
+    session = Mock()
+
+    def get(url, params=None, timeout=None):
+        cursor = (params or {}).get("next_cursor", "")
+        response = Mock()
+        response.content = json.dumps(pages[cursor]).encode()
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+PAGES = {
+    "": {"data": [{"condition_id": "a"}], "next_cursor": "MQ=="},
+    "MQ==": {"data": [{"condition_id": "b"}], "next_cursor": "Mg=="},
+    "Mg==": {"data": [{"condition_id": "c"}], "next_cursor": END_CURSOR},
+}
+
+
+class TestSimplifiedMarketsCrawler:
+    """Test suite for SimplifiedMarketsCrawler."""
+
+    def test_full_crawl_then_skip_unchanged(self, tmp_path):
+        """Test every page is walked and unchanged pages are skipped next run."""
+        path = str(tmp_path / "ckpt.json")
+        crawler = SimplifiedMarketsCrawler(path, session=_session_for(PAGES))
+
+        pages = list(crawler.crawl())
+        assert [p["data"][0]["condition_id"] for p in pages] == ["a", "b", "c"]
+        assert json.load(open(path))["cursor"] == ""
+
+        changed = dict(PAGES)
+        changed["MQ=="] = {"data": [{"condition_id": "b2"}], "next_cursor": "Mg=="}
+        again = SimplifiedMarketsCrawler(path, session=_session_for(changed))
+        pages = list(again.crawl(changed_only=True))
+        assert [p["data"][0]["condition_id"] for p in pages] == ["b2"]
+        assert again.stats == {"fetched": 3, "decoded": 1, "skipped": 2}
+
+    def test_restart_yields_full_universe(self, tmp_path):
+        """Test a fresh process still gets every page and a rerun reuses decoded pages."""
+        path = str(tmp_path / "ckpt.json")
+        list(SimplifiedMarketsCrawler(path, session=_session_for(PAGES)).crawl())
+
+        restarted = SimplifiedMarketsCrawler(path, session=_session_for(PAGES))
+        pages = list(restarted.crawl())
+        assert [p["data"][0]["condition_id"] for p in pages] == ["a", "b", "c"]
+        assert restarted.stats == {"fetched": 3, "decoded": 3, "skipped": 3}
+
+        rerun = list(restarted.crawl())
+        assert rerun == pages
+        assert restarted.stats["decoded"] == 3
+
+    def test_resume_after_failure(self, tmp_path):
+        """Test a crawl interrupted by an error resumes at the failed page."""
+        path = str(tmp_path / "ckpt.json")
+        session = _session_for(PAGES)
+        ok_get = session.get.side_effect
+
+        def flaky(url, params=None, timeout=None):
+            if (params or {}).get("next_cursor") == "Mg==":
+                raise ConnectionError("reset")
+            return ok_get(url, params=params, timeout=timeout)
+
+        session.get.side_effect = flaky
+        crawler = SimplifiedMarketsCrawler(path, session=session)
+        with pytest.raises(ConnectionError):
+            list(crawler.crawl())
+        assert json.load(open(path))["cursor"] == "Mg=="
+
+        resumed = SimplifiedMarketsCrawler(path, session=_session_for(PAGES))
+        pages = list(resumed.crawl())
+        assert [p["data"][0]["condition_id"] for p in pages] == ["c"]
+        assert resumed.stats["fetched"] == 1
+
+    def test_max_pages_and_reset(self, tmp_path):
+        """Test max_pages bounds a run and reset clears the checkpoint."""
+        path = str(tmp_path / "ckpt.json")
+        crawler = SimplifiedMarketsCrawler(path, session=_session_for(PAGES))
+
+        assert len(list(crawler.crawl(max_pages=1))) == 1
+        assert crawler.checkpoint["cursor"] == "MQ=="
+
+        crawler.reset()
+        assert json.load(open(path)) == {"cursor": "", "pages": {}}
+
+
+class TestCrawlHelper:
+    """Test suite for api.crawl_simplified_markets."""
+
+    def test_crawler_persists_across_calls(self, tmp_path):
+        """Test repeated calls reuse one crawler, so unchanged pages are neither yielded nor re-decoded."""
+        path = str(tmp_path / "ckpt.json")
+        session = _session_for(PAGES)
+        assert len(list(api.crawl_simplified_markets(path, session=session))) == 3
+        assert list(api.crawl_simplified_markets(path, changed_only=True, session=session)) == []
+        crawler = api._crawlers[(str(tmp_path / "ckpt.json"), session)]
+        assert crawler.stats == {"fetched": 6, "decoded": 3, "skipped": 3}
+
+        own = SimplifiedMarketsCrawler(path, session=_session_for(PAGES))
+        assert len(list(api.crawl_simplified_markets(crawler=own))) == 3
+        assert own.stats["fetched"] == 3
@@ -0,0 +1,174 @@
+"""Tests for per-cycle deadlines."""
+
+import random
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+import api
+from src.deadline import Deadline, DeadlineExceeded, bounded, current_deadline
+from src.resilience import CLOSED, Resilience, RetryPolicy
+from src.transport import PooledAdapter
+from tests.helpers import FakeClock, http_response
+
+
+def _stalling_session(stall_on, release):
+    """Mock session answering POST /prices at once, except batches holding ``stall_on``."""
+    session = MagicMock()
+
+    def post(url, json=None, timeout=None):
+        tids = [p["token_id"] for p in json["params"]]
+        if stall_on in tids:
+            release.wait(5)
+        response = Mock()
+        response.json.return_value = {tid: {"BUY": "0.5"} for tid in tids}
+        return response
+
+    session.post.side_effect = post
+    return session
+
+
+class TestDeadline:
+    """Test suite for Deadline and bounded."""
+
+    def test_remaining_and_timeout(self):
+        """Test timeouts shrink with the time left and fail once it is gone."""
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        assert deadline.timeout(20) == 10.0
+        clock.sleep(7.5)
+        assert deadline.timeout(1.0) == 1.0
+        assert deadline.remaining() == 2.5
+        clock.sleep(3.0)
+        assert deadline.expired()
+        with pytest.raises(DeadlineExceeded):
+            deadline.timeout(20)
+
+    def test_bounded_activates_deadline(self):
+        """Test bounded passes the capped timeout and exposes the deadline to the call."""
+        clock = FakeClock()
+        deadline = Deadline(3.0, clock=clock)
+        seen = {}
+
+        def send(url, timeout=None):
+            seen["timeout"] = timeout
+            seen["deadline"] = current_deadline()
+            return url
+
+        assert bounded(deadline, send, "u") == "u"
+        assert seen == {"timeout": 3.0, "deadline": deadline}
+        assert current_deadline() is None
+        assert bounded(None, send, "u", timeout=7) == "u" and seen["timeout"] == 7
+
+    def test_retries_stop_at_deadline(self):
+        """Test the retry layer gives up when the next backoff would end past the deadline."""
+        clock = FakeClock()
+        layer = Resilience(
+            RetryPolicy(max_attempts=10, base_delay=0.1, max_delay=0.4, rng=random.Random(0)),
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        calls = []
+
+        def send():
+            calls.append(clock.now)
+            clock.now += 0.2
+            raise requests.Timeout("slow")
+
+        deadline = Deadline(1.0, clock=clock)
+        with deadline.active():
+            with pytest.raises(requests.Timeout):
+                layer.call("https://clob.polymarket.com/prices", send)
+        assert calls == pytest.approx([0.0, 0.2844, 0.6360], abs=1e-3)
+        assert clock.now < deadline.at
+        assert layer.stats["clob.polymarket.com/prices"] == {"retried": 2, "failed": 1}
+
+
+class TestDeadlineTransport:
+    """Test suite for deadlines in the pooled adapter."""
+
+    def test_deadline_cut_timeouts_leave_circuit_closed(self):
+        """Test timeouts caused by the deadline raise DeadlineExceeded and never trip the breaker."""
+        clock = FakeClock()
+        layer = Resilience(
+            RetryPolicy(rng=random.Random(0)), failure_threshold=2, clock=clock, sleep=clock.sleep
+        )
+        adapter = PooledAdapter(resilience=layer)
+        request = requests.Request("POST", "https://clob.polymarket.com/prices").prepare()
+        timeouts = []
+
+        def stall(*args, timeout=None, **kwargs):
+            timeouts.append(timeout)
+            clock.now += timeout
+            raise requests.ReadTimeout("read timed out")
+
+        with patch.object(HTTPAdapter, "send", side_effect=stall):
+            for _ in range(5):
+                with Deadline(0.5, clock=clock).active():
+                    with pytest.raises(DeadlineExceeded):
+                        adapter.send(request, timeout=20)
+        assert timeouts == [0.5] * 5
+        assert layer.breaker("clob.polymarket.com/prices").state == CLOSED
+        assert layer.stats["clob.polymarket.com/prices"] == {}
+
+        with patch.object(HTTPAdapter, "send", return_value=http_response(200, {})):
+            assert adapter.send(request, timeout=20).status_code == 200
+
+
+class TestDeadlineSweeps:
+    """Test suite for deadlines in the /prices helpers."""
+
+    def test_get_best_prices_abandons_stuck_batch(self):
+        """Test a stuck batch is dropped at the deadline and recorded as DeadlineExceeded."""
+        release = threading.Event()
+        ids = [f"t{i}" for i in range(6)]
+        errors = []
+        started = time.monotonic()
+        out = api.get_best_prices(
+            ids,
+            batch_size=2,
+            max_workers=3,
+            errors=errors,
+            session=_stalling_session("t3", release),
+            deadline=Deadline(0.2),
+        )
+        elapsed = time.monotonic() - started
+        release.set()
+        assert elapsed < 2.0
+        assert sorted(out) == ["t0", "t1", "t4", "t5"]
+        assert [batch for batch, _ in errors] == [["t2", "t3"]]
+        assert isinstance(errors[0][1], DeadlineExceeded)
+
+    def test_iter_best_prices_yields_every_batch(self):
+        """Test batches in flight or unsent at the deadline are still yielded, empty."""
+        release = threading.Event()
+        ids = [f"t{i}" for i in range(8)]
+        errors = []
+        batches = list(
+            api.iter_best_prices(
+                ids,
+                batch_size=2,
+                max_workers=1,
+                errors=errors,
+                session=_stalling_session("t2", release),
+                deadline=Deadline(0.2),
+            )
+        )
+        release.set()
+        assert [b for b, _ in batches] == [["t0", "t1"], ["t2", "t3"], ["t4", "t5"], ["t6", "t7"]]
+        assert [bool(data) for _, data in batches] == [True, False, False, False]
+        assert all(isinstance(e, DeadlineExceeded) for _, e in errors) and len(errors) == 3
+
+    def test_sequential_sweep_raises_once_expired(self):
+        """Test a sequential sweep does not start requests after the deadline."""
+        clock = FakeClock()
+        deadline = Deadline(1.0, clock=clock)
+        clock.sleep(2.0)
+        session = _stalling_session(None, threading.Event())
+        with pytest.raises(DeadlineExceeded):
+            api.get_best_prices(["t0"], session=session, deadline=deadline)
+        session.post.assert_not_called()
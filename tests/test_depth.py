@@ -0,0 +1,46 @@
+"""Tests for depth-aware complete-set sizing."""
+
+import numpy as np
+import pytest
+
+from src.depth import executable_set, scan_markets
+from src.orderbook import BIDS, OrderBook
+
+LEG_A = {"asks": [{"price": "0.45", "size": "10"}, {"price": "0.40", "size": "10"}]}
+LEG_B = {"asks": [{"price": "0.50", "size": "5"}, {"price": "0.58", "size": "20"}]}
+
+
+class TestDepth:
+    """Test suite for executable_set and scan_markets."""
+
+    def test_walks_ladders_until_marginal_cost_hits_one(self):
+        """Test size stops where the marginal set cost reaches 1."""
+        fill = executable_set([LEG_A, LEG_B])
+        assert fill.size == 10.0
+        assert fill.cost == pytest.approx(4.0 + 5.4)
+        assert np.allclose(fill.vwaps, [0.40, 0.54])
+        assert fill.edge == pytest.approx(0.6)
+
+    def test_accepts_orderbooks_and_threshold(self):
+        """Test OrderBook inputs and a tighter threshold."""
+        books = [OrderBook.from_snapshot(LEG_A), OrderBook.from_snapshot(LEG_B)]
+        assert executable_set(books, threshold=0.95).size == 5.0
+        assert executable_set(books, threshold=0.90).size == 0.0
+
+    def test_sell_side_and_empty_leg(self):
+        """Test selling into bids and a leg without liquidity."""
+        bids = [
+            ([0.6, 0.5], [10, 10]),
+            ([0.45, 0.3], [15, 10]),
+        ]
+        fill = executable_set(bids, side=BIDS)
+        assert fill.size == 10.0
+        assert fill.edge == pytest.approx(10 * (0.6 + 0.45) - 10)
+
+        assert executable_set([LEG_A, {"asks": []}]).size == 0.0
+
+    def test_scan_markets_ranks_by_edge(self):
+        """Test scanning keeps profitable markets, best edge first."""
+        cheap = {"asks": [{"price": "0.30", "size": "100"}]}
+        result = scan_markets({"m1": [LEG_A, LEG_B], "m2": [cheap, cheap], "m3": [LEG_B, LEG_B]})
+        assert [cond for cond, _ in result] == ["m2", "m1"]
@@ -0,0 +1,57 @@
+"""Tests for the pluggable JSON decoder."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src import fastjson
+from src.models import parse_list_field
+from tests.helpers import http_response
+
+
+@pytest.fixture
+def restore_backend():
+    name = fastjson.backend()
+    yield
+    fastjson.set_backend(name)
+
+
+class TestFastJson:
+    """Test suite for src.fastjson."""
+
+    def test_backends_decode_alike(self, restore_backend):
+        """Test every installed backend decodes bytes and str to the same objects."""
+        body = '{"a": [1, 2.5, "x", null, true], "b": {"c": "\\u00e9"}}'
+        expected = {"a": [1, 2.5, "x", None, True], "b": {"c": "é"}}
+        assert fastjson.available_backends()[-1] == "json"
+        for name in fastjson.available_backends():
+            fastjson.set_backend(name)
+            assert fastjson.backend() == name
+            assert fastjson.loads(body) == expected
+            assert fastjson.loads(body.encode()) == expected
+            with pytest.raises(ValueError):
+                fastjson.loads(b"{not json")
+
+    def test_set_backend_rejects_unknown(self, restore_backend):
+        """Test selecting a missing backend raises and None picks the fastest."""
+        with pytest.raises(ValueError):
+            fastjson.set_backend("simdjson")
+        fastjson.set_backend(None)
+        assert fastjson.backend() == fastjson.available_backends()[0]
+
+    def test_response_json_and_fallback(self):
+        """Test bodies decode from bytes, and non-bytes content defers to response.json()."""
+        assert fastjson.response_json(http_response(body=b'[{"id": "1"}]')) == [{"id": "1"}]
+        mock = Mock()
+        mock.json.return_value = {"mocked": True}
+        assert fastjson.response_json(mock) == {"mocked": True}
+        with pytest.raises(ValueError):
+            fastjson.response_json(http_response(body=b"<html>"))
+
+    def test_list_fields_are_memoized(self):
+        """Test a stringified list field is decoded once and shared as an immutable tuple."""
+        value = '["Yes", "No", "Maybe-memo"]'
+        first = parse_list_field(value)
+        assert first == ("Yes", "No", "Maybe-memo")
+        assert parse_list_field(value) is first
+        assert parse_list_field("not json") == ("not json",)
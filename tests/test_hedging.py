@@ -0,0 +1,115 @@
+"""Tests for hedged requests."""
+
+import threading
+import time
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+import api
+from src.hedging import Hedger
+
+
+def _slow_then_fast(delay=0.5):
+    """Callable whose first invocation blocks for ``delay`` seconds, later ones answer at once."""
+    calls = []
+    lock = threading.Lock()
+
+    def fn():
+        with lock:
+            calls.append(1)
+            n = len(calls)
+        if n == 1:
+            time.sleep(delay)
+            return "primary"
+        return "hedge"
+
+    return fn, calls
+
+
+class TestHedger:
+    """Test suite for Hedger."""
+
+    def test_hedge_delay_follows_percentile(self):
+        """Test the delay is the window percentile once warmed up, bounded below."""
+        hedger = Hedger(percentile=0.9, min_samples=10, min_delay=0.01)
+        assert hedger.hedge_delay("k") is None
+        for i in range(1, 11):
+            hedger.record("k", i / 10)
+        assert hedger.hedge_delay("k") == 1.0
+        for _ in range(100):
+            hedger.record("k", 0.0)
+        assert hedger.hedge_delay("k") == 0.01
+        assert Hedger(initial_delay=0.3).hedge_delay("cold") == 0.3
+
+    def test_slow_primary_is_hedged(self):
+        """Test a duplicate fires past the delay and its earlier answer wins."""
+        hedger = Hedger(initial_delay=0.02, max_hedge_ratio=1.0)
+        fn, calls = _slow_then_fast()
+        assert hedger.call("k", fn) == "hedge"
+        assert len(calls) == 2
+        assert hedger.stats == {"requests": 1, "hedges_fired": 1, "hedges_won": 1}
+        hedger.close()
+
+    def test_fast_primary_and_cold_endpoint_are_not_hedged(self):
+        """Test no duplicate is sent when the primary is on time or there is no history."""
+        hedger = Hedger(initial_delay=1.0)
+        assert hedger.call("k", lambda: "ok") == "ok"
+        fn, calls = _slow_then_fast(0.05)
+        assert Hedger().call("cold", fn) == "primary"
+        assert len(calls) == 1
+        assert hedger.stats["hedges_fired"] == 0
+        hedger.close()
+
+    def test_hedge_ratio_caps_extra_load(self):
+        """Test hedging pauses once hedges exceed max_hedge_ratio of requests."""
+        hedger = Hedger(initial_delay=0.01, max_hedge_ratio=0.5)
+        for _ in range(4):
+            fn, _ = _slow_then_fast(0.3)
+            hedger.call("k", fn)
+        assert hedger.stats["requests"] == 4
+        assert hedger.stats["hedges_fired"] == 2
+        hedger.close()
+
+    def test_failed_primary_falls_back_to_hedge(self):
+        """Test an error from one copy is ignored if the other succeeds, raised if both fail."""
+        hedger = Hedger(initial_delay=0.01, max_hedge_ratio=1.0)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.3)
+                raise RuntimeError("primary failed")
+            return "hedge"
+
+        assert hedger.call("k", flaky) == "hedge"
+
+        def broken():
+            time.sleep(0.1)
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            hedger.call("k", broken)
+        hedger.close()
+
+
+class TestHedgedEndpoints:
+    """Test suite for hedging in the api.py helpers."""
+
+    def test_get_book_hedged(self):
+        """Test get_book races a second GET /book and records latency under its endpoint."""
+        hedger = Hedger(initial_delay=0.02, max_hedge_ratio=1.0)
+        fn, calls = _slow_then_fast()
+        session = MagicMock()
+
+        def get(url, params=None, timeout=None):
+            response = Mock(status_code=200)
+            response.json.return_value = {"source": fn()}
+            return response
+
+        session.get.side_effect = get
+        assert api.get_book("t1", session=session, hedge=hedger) == {"source": "hedge"}
+        assert session.get.call_count == 2
+        assert hedger.stats["hedges_won"] == 1
+        hedger.close()
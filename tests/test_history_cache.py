@@ -0,0 +1,68 @@
+"""Tests for the on-disk price-history cache."""
+
+from unittest.mock import MagicMock, Mock
+
+import requests
+
+from src.history_cache import HistoryCache, point_timestamp
+from tests.helpers import http_response, load_scanner_module
+
+
+class TestHistoryCache:
+    """Test suite for HistoryCache."""
+
+    def test_add_points_and_reopen(self, tmp_path):
+        """Test points persist across instances, ordered and de-duplicated by timestamp."""
+        path = str(tmp_path / "cache" / "history.sqlite")
+        with HistoryCache(path) as cache:
+            assert cache.last_timestamp("c1", "1h") is None
+            cache.add("c1", "1h", [{"t": 200, "p": 0.4}, {"t": 100, "p": 0.3}, {"p": 0.9}])
+            cache.add("c1", "1h", [{"t": 200, "p": 0.45}, {"t": 300, "p": 0.5}])
+            cache.add("c1", "1d", [{"t": 100, "p": 0.1}])
+        with HistoryCache(path) as cache:
+            assert cache.points("c1", "1h") == [{"t": 100, "p": 0.3}, {"t": 200, "p": 0.45}, {"t": 300, "p": 0.5}]
+            assert cache.last_timestamp("c1", "1h") == 300.0
+            cache.clear("c1")
+            assert cache.points("c1", "1d") == []
+
+    def test_point_timestamp(self):
+        """Test epoch numbers, numeric strings and ISO-8601 strings are understood."""
+        assert point_timestamp({"t": 1700000000}) == 1700000000.0
+        assert point_timestamp({"t": "1700000000"}) == 1700000000.0
+        assert point_timestamp({"t": "2023-11-14T22:13:20Z"}) == 1700000000.0
+        assert point_timestamp({"t": "yesterday"}) is None
+        assert point_timestamp({}) is None
+
+
+class TestScannerHistory:
+    """Test suite for PolymarketScanner.get_market_history with a cache."""
+
+    def test_fetches_only_the_tail(self):
+        """Test the second call asks for points since the last cached one and merges them."""
+        module = load_scanner_module()
+        gamma = MagicMock()
+        gamma.get.side_effect = [
+            http_response(200, {"history": [{"t": 100, "p": 0.3}, {"t": 200, "p": 0.4}]}),
+            http_response(200, [{"t": 200, "p": 0.42}, {"t": 300, "p": 0.5}]),
+            requests.ConnectionError("down"),
+        ]
+        sessions = Mock(gamma=gamma)
+        scanner = module.PolymarketScanner(sessions=sessions, history_cache=HistoryCache(":memory:"))
+
+        assert len(scanner.get_market_history("c1", interval="1h")) == 2
+        assert gamma.get.call_args.kwargs["params"] == {"market": "c1", "interval": "1h"}
+        merged = scanner.get_market_history("c1", interval="1h")
+        assert gamma.get.call_args.kwargs["params"] == {"market": "c1", "startTs": 200, "fidelity": 60}
+        assert merged == [{"t": 100, "p": 0.3}, {"t": 200, "p": 0.42}, {"t": 300, "p": 0.5}]
+
+        errors = []
+        assert scanner.get_market_history("c1", interval="1h", errors=errors) == merged
+        assert errors[0][0] == "c1" and isinstance(errors[0][1], requests.ConnectionError)
+
+    def test_uncached_returns_points(self):
+        """Test without a cache the point list is returned, not the raw payload."""
+        module = load_scanner_module()
+        gamma = MagicMock()
+        gamma.get.return_value = http_response(200, {"history": [{"t": 100, "p": 0.3}]})
+        scanner = module.PolymarketScanner(sessions=Mock(gamma=gamma))
+        assert scanner.get_market_history("c1", interval="1d") == [{"t": 100, "p": 0.3}]
@@ -0,0 +1,61 @@
+"""Tests for the incremental arbitrage detector."""
+
+import pytest
+
+from src.incremental import IncrementalArbDetector
+
+
+TOKENS = [
+    {"condition_id": "a", "token_id": "a1", "closed": False},
+    {"condition_id": "a", "token_id": "a2", "closed": False},
+    {"condition_id": "b", "token_id": "b1", "closed": False},
+    {"condition_id": "b", "token_id": "b2", "closed": False},
+]
+
+
+class TestIncrementalArbDetector:
+    """Test suite for IncrementalArbDetector."""
+
+    def test_enter_and_exit_events(self):
+        """Test markets emit enter when the sum drops below 1 and exit when it recovers."""
+        detector = IncrementalArbDetector(TOKENS, min_edge=0.01)
+
+        events = detector.update({"a1": {"BUY": "0.45"}, "a2": {"BUY": "0.50"}, "b1": "0.6", "b2": "0.5"})
+        assert [(e.kind, e.condition_id) for e in events] == [("enter", "a")]
+        assert events[0].total == pytest.approx(0.95)
+        assert events[0].edge == pytest.approx(0.05)
+
+        events = detector.update({"a2": "0.56"})
+        assert [(e.kind, e.condition_id) for e in events] == [("exit", "a")]
+        assert detector.opportunities() == []
+
+    def test_only_changed_markets_touched(self):
+        """Test unchanged prices do not re-evaluate any market."""
+        detector = IncrementalArbDetector(TOKENS)
+        detector.update({"a1": "0.5", "a2": "0.5", "b1": "0.5", "b2": "0.5"})
+        assert detector.touched_last == 2
+
+        assert detector.update({"a1": "0.5", "unknown": "0.1"}) == []
+        assert detector.touched_last == 0
+
+        detector.update({"b1": "0.4"})
+        assert detector.touched_last == 1
+        assert [o.condition_id for o in detector.opportunities()] == ["b"]
+
+    def test_incomplete_market_never_qualifies(self):
+        """Test a market with a missing outcome price is not an opportunity."""
+        detector = IncrementalArbDetector(TOKENS)
+        assert detector.update({"a1": "0.2"}) == []
+        events = detector.update({"a2": "0.3"})
+        assert [e.kind for e in events] == ["enter"]
+        events = detector.update({"a2": None})
+        assert [e.kind for e in events] == ["exit"]
+
+    def test_sell_side_and_resync(self):
+        """Test the bid side flags sums above 1 and resync keeps sums exact."""
+        detector = IncrementalArbDetector(TOKENS, side="SELL", resync_every=2)
+        events = detector.update({"b1": {"SELL": "0.6"}, "b2": {"SELL": "0.5"}})
+        assert [(e.kind, e.condition_id) for e in events] == [("enter", "b")]
+        detector.update({"b2": {"SELL": "0.3"}})
+        assert detector.sums[1] == pytest.approx(0.9)
+        assert detector.opportunities() == []
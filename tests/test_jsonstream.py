@@ -0,0 +1,97 @@
+"""Tests for incremental JSON array parsing."""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+import api
+from src.jsonstream import JsonArrayStream
+from src.models import Market
+from src.polymarket_api import PolymarketAPI
+
+DOC = [
+    {"id": "1", "question": 'Will "X" win? [yes] {no}', "outcomes": '["Yes", "No"]', "nested": {"a": [1, {"b": []}]}},
+    {"id": "2", "question": "Back\\slash é漢", "volume": 12.5, "flag": True, "none": None},
+    "plain",
+    -3.25e2,
+    [],
+    {},
+]
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonArrayStream:
+    """Test suite for JsonArrayStream."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+    def test_matches_full_decode_at_any_chunking(self, size):
+        """Test elements equal json.loads output however the body is split."""
+        body = json.dumps(DOC, indent=1).encode()
+        assert list(JsonArrayStream(_chunks(body, size))) == DOC
+
+    def test_object_with_data_member(self):
+        """Test the data array is streamed and other members land in fields."""
+        body = json.dumps({"limit": 2, "data": DOC[:2], "next_cursor": "MTA="}).encode()
+        stream = JsonArrayStream(_chunks(body, 5), key="data")
+        assert list(stream) == DOC[:2]
+        assert stream.fields == {"limit": 2, "next_cursor": "MTA="}
+
+    def test_empty_and_truncated(self):
+        """Test empty arrays yield nothing and a cut-off body raises."""
+        assert list(JsonArrayStream([b" [ ] "])) == []
+        assert list(JsonArrayStream([b'{"data": []}'])) == []
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([b'[{"id": "1"}, {"id": ']))
+        with pytest.raises(ValueError):
+            list(JsonArrayStream([b'"not an array"']))
+
+    def test_yields_before_body_is_complete(self):
+        """Test the first element is produced before later chunks are read."""
+        read = []
+
+        def chunks():
+            for chunk in (b'[{"id": 1},', b' {"id": 2}', b"]"):
+                read.append(chunk)
+                yield chunk
+
+        stream = iter(JsonArrayStream(chunks()))
+        assert next(stream) == {"id": 1}
+        assert len(read) == 1
+        assert list(stream) == [{"id": 2}]
+
+
+class TestStreamingEndpoints:
+    """Test suite for the streaming client methods."""
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_iter_markets_stream(self, mock_session_class):
+        """Test PolymarketAPI streams a /markets page and closes the response."""
+        page = [{"id": "1", "conditionId": "0xa", "outcomes": '["Yes", "No"]', "clobTokenIds": '["t1", "t2"]'}]
+        response = Mock()
+        response.iter_content.return_value = _chunks(json.dumps(page).encode(), 8)
+        mock_session = Mock()
+        mock_session.get.return_value = response
+        mock_session_class.return_value = mock_session
+
+        markets = list(PolymarketAPI().iter_markets_stream(limit=1, typed=True))
+        assert isinstance(markets[0], Market) and markets[0].condition_id == "0xa"
+        assert mock_session.get.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+
+    def test_iter_simplified_markets_follows_cursor(self):
+        """Test pages are streamed in turn until the end cursor."""
+        pages = [
+            {"data": [{"condition_id": "a"}, {"condition_id": "b"}], "next_cursor": "MQ=="},
+            {"data": [{"condition_id": "c"}], "next_cursor": "LTE="},
+        ]
+        session = MagicMock()
+        session.get.side_effect = [
+            Mock(iter_content=Mock(return_value=_chunks(json.dumps(p).encode(), 16))) for p in pages
+        ]
+        markets = list(api.iter_simplified_markets(session=session))
+        assert [m["condition_id"] for m in markets] == ["a", "b", "c"]
+        assert session.get.call_args.kwargs["params"] == {"next_cursor": "MQ=="}
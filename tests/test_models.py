@@ -0,0 +1,76 @@
+"""Tests for the compact Market and Token models."""
+
+import json
+import math
+import os
+
+import pytest
+
+from src.models import Market, Token, markets_from_gamma, parse_list_field, tokens_from_simplified
+
+SNAPSHOT = os.path.join(os.path.dirname(__file__), "..", "polymarket_active_markets.json")
+
+
+class TestModels:
+    """Test suite for Market and Token decoding."""
+
+    def test_parse_list_field(self):
+        """Test stringified, native and malformed list fields."""
+        assert parse_list_field('["Yes", "No"]') == ("Yes", "No")
+        assert parse_list_field(["a"]) == ("a",)
+        assert parse_list_field("Yes") == ("Yes",)
+        assert parse_list_field(None) == ()
+
+    def test_from_gamma_snapshot(self):
+        """Test decoding the bundled Gamma snapshot."""
+        with open(SNAPSHOT) as f:
+            raw = json.load(f)
+
+        markets = markets_from_gamma(raw)
+        assert len(markets) == len(raw)
+
+        first = markets[0]
+        assert first.condition_id == raw[0]["conditionId"]
+        assert first.outcomes == tuple(json.loads(raw[0]["outcomes"]))
+        assert first.clob_token_ids == tuple(json.loads(raw[0]["clobTokenIds"]))
+        assert first.tokens[0].token_id == first.clob_token_ids[0]
+        assert first.tokens[0].label == first.outcomes[0]
+        assert first.best_ask == pytest.approx(raw[0]["bestAsk"])
+        assert first.neg_risk_market_id == raw[0]["negRiskMarketID"]
+        assert not hasattr(first, "__dict__")
+        with pytest.raises(AttributeError):
+            first.description = "not stored"
+
+    def test_from_gamma_missing_fields(self):
+        """Test defaults when optional fields are absent."""
+        market = Market.from_gamma({"condition_id": "0x1"})
+        assert market.condition_id == "0x1"
+        assert market.tokens == ()
+        assert math.isnan(market.best_bid)
+        assert market.volume_24hr == 0.0
+        assert market.neg_risk_market_id is None
+
+    def test_tokens_from_simplified(self):
+        """Test flattening a CLOB simplified-markets page."""
+        page = {
+            "data": [
+                {
+                    "condition_id": "0xc",
+                    "active": True,
+                    "closed": False,
+                    "tokens": [
+                        {"token_id": 1, "outcome": "Yes", "price": "0.3"},
+                        {"token_id": 2, "outcome": "No"},
+                    ],
+                }
+            ]
+        }
+        tokens = tokens_from_simplified(page)
+        assert [t.token_id for t in tokens] == ["1", "2"]
+        assert isinstance(tokens[0], Token)
+        assert tokens[0].price == 0.3
+        assert math.isnan(tokens[1].price)
+
+        market = Market.from_simplified(page["data"][0])
+        assert market.clob_token_ids == ("1", "2")
+        assert market.outcomes == ("Yes", "No")
@@ -0,0 +1,122 @@
+"""Tests for neg-risk event grouping and ranking."""
+
+import json
+import math
+import os
+
+import pytest
+
+from src.models import Market, markets_from_gamma
+from src.negrisk import NegRiskIndex, event_sizes_from_gamma
+
+SNAPSHOT = os.path.join(os.path.dirname(__file__), "..", "polymarket_active_markets.json")
+
+
+def _market(cond, yes, neg_risk_id="0xevent", closed=False, active=True):
+    return Market.from_gamma(
+        {
+            "conditionId": cond,
+            "negRisk": True,
+            "negRiskMarketID": neg_risk_id,
+            "active": active,
+            "closed": closed,
+            "outcomes": '["Yes", "No"]',
+            "clobTokenIds": json.dumps([yes, yes + "-no"]),
+        }
+    )
+
+
+class TestNegRiskIndex:
+    """Test suite for NegRiskIndex."""
+
+    def test_groups_snapshot_by_neg_risk_market_id(self):
+        """Test the bundled snapshot groups its neg-risk markets."""
+        with open(SNAPSHOT) as f:
+            raw = json.load(f)
+        index = NegRiskIndex(raw)
+        neg_risk = [m for m in markets_from_gamma(raw) if m.neg_risk and m.active and not m.closed]
+        assert sum(len(ids) for ids in index.market_ids) == len(neg_risk)
+        assert len(index) == len({m.neg_risk_market_id for m in neg_risk})
+        assert len(index.yes_token_ids) == len(neg_risk)
+
+    def test_rank_by_side_edge(self):
+        """Test events are summed across markets and ranked by the edge of their side."""
+        markets = [
+            _market("a1", "ya1", "E1"),
+            _market("a2", "ya2", "E1"),
+            _market("b1", "yb1", "E2"),
+            _market("b2", "yb2", "E2"),
+            _market("b3", "yb3", "E2", closed=True),
+            Market.from_gamma({"conditionId": "plain", "clobTokenIds": '["p"]'}),
+        ]
+        index = NegRiskIndex(markets, event_sizes={"E1": 2, "E2": 2})
+        assert index.market_ids == [["a1", "a2"], ["b1", "b2"]]
+        assert index.event_of["b2"] == "E2"
+
+        prices = {
+            "ya1": {"BUY": "0.40", "SELL": "0.38"},
+            "ya2": {"BUY": "0.55", "SELL": "0.52"},
+            "yb1": {"BUY": "0.7", "SELL": "0.6"},
+            "yb2": {"BUY": "0.5", "SELL": "0.45"},
+        }
+        ranked = index.rank(prices, side="BUY")
+        assert [e.event_id for e in ranked] == ["E1", "E2"]
+        assert ranked[0].deviation == pytest.approx(-0.05)
+        assert ranked[1].deviation == pytest.approx(0.2)
+        assert [e.event_id for e in index.rank(prices, side="SELL")] == ["E2", "E1"]
+
+    def test_partial_events_rank_last(self):
+        """Test an event with an unpriced market has no deviation unless allowed."""
+        index = NegRiskIndex(
+            [_market("a1", "ya1", "E1"), _market("a2", "ya2", "E1"), _market("b1", "yb1", "E2")],
+            event_sizes={"E1": 2, "E2": 1},
+        )
+        prices = {"ya1": {"BUY": "0.1"}, "yb1": {"BUY": "0.9"}}
+        ranked = index.rank(prices)
+        assert ranked[0].event_id == "E2"
+        assert math.isnan(ranked[1].deviation)
+        assert ranked[1].n_priced == 1
+
+        ranked = index.rank(prices, allow_partial=True, k=1)
+        assert [e.event_id for e in ranked] == ["E1"]
+
+    def test_incomplete_membership_is_not_ranked(self):
+        """Test an event missing some of its open markets gets no deviation."""
+        live = {"active": True}
+        events = [
+            {"id": "1", "negRisk": True, "negRiskMarketID": "E1", "markets": [live, live, {"active": True, "closed": True}]},
+            {"id": "2", "negRisk": True, "negRiskMarketID": "E2", "markets": [live, live, live]},
+            {"id": "3", "negRisk": False, "markets": [live]},
+        ]
+        sizes = event_sizes_from_gamma(events)
+        assert sizes == {"E1": 2, "E2": 3}
+
+        index = NegRiskIndex(
+            [_market("a1", "ya1", "E1"), _market("a2", "ya2", "E1"), _market("b1", "yb1", "E2"), _market("b2", "yb2", "E2")],
+            event_sizes=sizes,
+        )
+        assert index.complete.tolist() == [True, False]
+        prices = {tid: {"BUY": "0.2"} for tid in index.yes_token_ids}
+        ranked = index.rank(prices)
+        assert ranked[0].event_id == "E1"
+        assert math.isnan(ranked[1].deviation)
+
+    def test_inactive_legs_excluded_on_both_sides(self):
+        """Test an inactive, unclosed leg is neither counted in sizes nor indexed, so the event is complete."""
+        events = [
+            {
+                "id": "1",
+                "negRisk": True,
+                "negRiskMarketID": "E1",
+                "markets": [{"active": True}, {"active": True}, {"active": False, "closed": False}],
+            }
+        ]
+        sizes = event_sizes_from_gamma(events)
+        assert sizes == {"E1": 2}
+
+        index = NegRiskIndex(
+            [_market("a1", "ya1", "E1"), _market("a2", "ya2", "E1"), _market("a3", "ya3", "E1", active=False)],
+            event_sizes=sizes,
+        )
+        assert index.market_ids == [["a1", "a2"]]
+        assert index.complete.tolist() == [True]
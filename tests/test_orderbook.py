@@ -0,0 +1,69 @@
+"""Tests for the tick-indexed order book."""
+
+import pytest
+
+from src.orderbook import ASKS, BIDS, OrderBook
+
+SNAPSHOT = {
+    "asset_id": "123",
+    "tick_size": "0.01",
+    "timestamp": "1700000000000",
+    "hash": "abc",
+    "bids": [{"price": "0.48", "size": "100"}, {"price": "0.45", "size": "50"}, {"price": "0.47", "size": "20"}],
+    "asks": [{"price": "0.52", "size": "30"}, {"price": "0.50", "size": "10"}],
+}
+
+
+class TestOrderBook:
+    """Test suite for OrderBook."""
+
+    def test_from_snapshot(self):
+        """Test snapshot ingest, best levels and level ordering."""
+        book = OrderBook.from_snapshot(SNAPSHOT)
+        assert book.token_id == "123"
+        assert book.tick_size == 0.01
+        assert book.best_bid() == (0.48, 100.0)
+        assert book.best_ask() == (0.5, 10.0)
+        assert book.spread() == pytest.approx(0.02)
+
+        prices, sizes = book.levels(BIDS)
+        assert prices.tolist() == [0.48, 0.47, 0.45]
+        assert sizes.tolist() == [100.0, 20.0, 50.0]
+        prices, _ = book.levels(ASKS, n=1)
+        assert prices.tolist() == [0.5]
+
+    def test_update_levels(self):
+        """Test inserting, resizing and removing levels."""
+        book = OrderBook.from_snapshot(SNAPSHOT)
+        book.update(ASKS, 0.49, 5)
+        assert book.best_ask() == (0.49, 5.0)
+        book.update(ASKS, 0.49, 0)
+        assert book.best_ask() == (0.5, 10.0)
+        book.update(BIDS, 0.48, 0)
+        assert book.best_bid() == (0.47, 20.0)
+        book.update(BIDS, 0.47, 25)
+        assert book.best_bid() == (0.47, 25.0)
+
+        with pytest.raises(ValueError):
+            book.update(BIDS, 0.475, 1)
+
+    def test_cumulative_depth(self):
+        """Test cumulative size at or better than a price, cached across queries."""
+        book = OrderBook.from_snapshot(SNAPSHOT)
+        assert book.depth_at(ASKS, 0.51) == 10.0
+        assert book.depth_at(ASKS, 0.52) == 40.0
+        assert book.depth_at(BIDS, 0.47) == 120.0
+        assert book.depth_at(BIDS, 0.40) == 170.0
+        assert book.depth_at(BIDS, 0.49) == 0.0
+
+        book.update(ASKS, 0.51, 7)
+        assert book.depth_at(ASKS, 0.51) == 17.0
+        assert book.total_depth(ASKS) == 47.0
+
+    def test_fine_tick_and_empty_book(self):
+        """Test a 0.001 grid and an empty book."""
+        book = OrderBook("x", tick_size=0.001)
+        assert book.best_bid() is None and book.best_ask() is None
+        assert book.spread() is None
+        book.update(ASKS, 0.995, 3)
+        assert book.best_ask() == (0.995, 3.0)
@@ -68,3 +68,27 @@ class TestPolymarketAPI:
             assert api is not None
         
         mock_session.close.assert_called_once()
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_get_markets_typed(self, mock_session_class):
+        """Test fetching markets decoded into Market models."""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.json.return_value = [
+            {
+                "id": "1",
+                "conditionId": "0xabc",
+                "outcomes": '["Yes", "No"]',
+                "outcomePrices": '["0.6", "0.4"]',
+                "clobTokenIds": '["11", "22"]',
+            }
+        ]
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+        
+        api = PolymarketAPI()
+        markets = api.get_markets(limit=1, typed=True)
+        
+        assert markets[0].condition_id == "0xabc"
+        assert markets[0].clob_token_ids == ("11", "22")
+        assert [t.price for t in markets[0].tokens] == [0.6, 0.4]
@@ -0,0 +1,64 @@
+"""Tests for Gamma-side pre-screening."""
+
+import json
+import os
+
+from src.prefilter import prescreen
+
+SNAPSHOT = os.path.join(os.path.dirname(__file__), "..", "polymarket_active_markets.json")
+
+
+def _gamma(cond, bid, ask, neg_risk_id=None, closed=False):
+    return {
+        "conditionId": cond,
+        "bestBid": bid,
+        "bestAsk": ask,
+        "negRisk": neg_risk_id is not None,
+        "negRiskMarketID": neg_risk_id,
+        "closed": closed,
+        "outcomes": '["Yes", "No"]',
+        "clobTokenIds": json.dumps([cond + "-y", cond + "-n"]),
+    }
+
+
+class TestPrescreen:
+    """Test suite for prescreen."""
+
+    def test_binary_markets_pruned_by_spread(self):
+        """Test a normal spread is pruned and a crossed or unquoted book is kept."""
+        result = prescreen(
+            [
+                _gamma("wide", 0.40, 0.45),
+                _gamma("crossed", 0.52, 0.50),
+                _gamma("unquoted", None, None),
+                _gamma("done", 0.1, 0.2, closed=True),
+            ],
+            slack=0.005,
+        )
+        assert [m.condition_id for m in result.markets] == ["crossed", "unquoted"]
+        assert result.n_input == 4
+        assert result.n_pruned == 2
+        assert result.token_ids() == ["crossed-y", "crossed-n", "unquoted-y", "unquoted-n"]
+
+    def test_neg_risk_events_bounded_by_sums(self):
+        """Test events are kept only if the summed quotes can cross 1."""
+        markets = [
+            _gamma("a1", 0.38, 0.40, "E1"),
+            _gamma("a2", 0.60, 0.62, "E1"),
+            _gamma("b1", 0.43, 0.45, "E2"),
+            _gamma("b2", 0.51, 0.53, "E2"),
+        ]
+        result = prescreen(markets, min_edge=0.01, slack=0.0)
+        assert list(result.events) == ["E2"]
+        assert result.n_pruned == 2
+
+        loose = prescreen(markets, min_edge=0.01, slack=0.05)
+        assert sorted(loose.events) == ["E1", "E2"]
+
+    def test_snapshot_prunes_binary_markets(self):
+        """Test the bundled snapshot's standalone binary markets are mostly pruned."""
+        with open(SNAPSHOT) as f:
+            raw = json.load(f)
+        standalone = [m for m in raw if not m.get("negRisk")]
+        result = prescreen(standalone, min_edge=0.0, slack=0.0)
+        assert result.n_pruned > result.n_input // 2
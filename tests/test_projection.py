@@ -0,0 +1,136 @@
+"""Tests for ingest field projection."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import api
+from src.conditional import ConditionalCache
+from src.models import Market
+from src.polymarket_api import PolymarketAPI
+from src.projection import Projection, SideStore
+from tests.helpers import http_response, load_scanner_module
+
+RAW = {
+    "id": "7",
+    "conditionId": "0xabc",
+    "question": "Will it rain?",
+    "outcomes": '["Yes", "No"]',
+    "clobTokenIds": '["t1", "t2"]',
+    "bestAsk": "0.4",
+    "negRisk": True,
+    "description": "Long resolution text. " * 20,
+    "image": "https://img/x.png",
+    "icon": "https://img/x.png",
+    "events": [{"id": "42", "title": "Weather", "description": "Event text"}],
+    "volume1yr": 12345.6,
+    "umaBond": "500",
+}
+
+
+class TestProjection:
+    """Test suite for Projection and SideStore."""
+
+    def test_project_keeps_resident_and_offloads_rest(self):
+        """Test declared fields stay, offloaded ones go to the store and others are dropped."""
+        projection = Projection(store=SideStore())
+        resident = projection.project(RAW)
+
+        assert "description" not in resident and "volume1yr" not in resident
+        assert resident["question"] == "Will it rain?"
+        assert resident["events"] == [{"id": "42"}]
+        assert projection.details("0xabc") == {
+            "description": RAW["description"],
+            "image": RAW["image"],
+            "icon": RAW["icon"],
+            "events": RAW["events"],
+        }
+
+    def test_market_decodes_from_projection_and_loads_details(self):
+        """Test a Market built from the projected dict matches one built from the raw dict."""
+        store = SideStore()
+        projected = Market.from_gamma(Projection(store=store).project(RAW))
+        full = Market.from_gamma(RAW)
+
+        for name in Market.__slots__:
+            if name != "tokens":
+                assert repr(getattr(projected, name)) == repr(getattr(full, name))
+        assert projected.event_id == "42"
+        assert projected.details(store)["image"] == RAW["image"]
+        assert Market(condition_id="0xnone").details(store) == {}
+
+    def test_custom_fields_and_side_store(self):
+        """Test custom declarations, store replacement, and non-list payloads passing through."""
+        store = SideStore()
+        projection = Projection(resident=("conditionId", "description"), offload=("description", "image"), store=store)
+        resident = projection.project_all([RAW, "junk"])
+        assert resident == [{"conditionId": "0xabc", "description": RAW["description"]}]
+        assert store.get("0xabc") == {"image": RAW["image"]}
+
+        store.put("0xabc", {"image": "new"})
+        assert store.get("0xabc") == {"image": "new"}
+        assert "0xabc" in store and len(store) == 1
+        assert projection.project_all({"error": "x"}) == {"error": "x"}
+        store.clear()
+        assert len(store) == 0
+
+
+class TestProjectionEndpoints:
+    """Test suite for projection in the clients."""
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_get_markets_projects_before_caching(self, mock_session_class):
+        """Test PolymarketAPI projects pages and the conditional cache keeps the projected page."""
+        mock_session = Mock()
+        mock_session.get.side_effect = [http_response(200, [RAW], {"ETag": '"v1"'}), http_response(304)]
+        mock_session_class.return_value = mock_session
+        store = SideStore()
+
+        client = PolymarketAPI(projection=Projection(store=store))
+        first = client.get_markets(limit=1)
+        assert "description" not in first[0]
+        assert client.get_markets(limit=1) is first
+        assert store.get("0xabc")["icon"] == RAW["icon"]
+
+    def test_transform_is_part_of_conditional_key(self):
+        """Test a projected page is never served to a caller that asked for the full one."""
+        session = MagicMock()
+        session.get.side_effect = [http_response(200, [RAW], {"ETag": '"v1"'}), http_response(200, [RAW], {"ETag": '"v1"'})]
+        cache = ConditionalCache()
+        projection = Projection(store=SideStore())
+
+        projected = api.list_markets_gamma(session=session, conditional=cache, projection=projection)
+        assert "description" not in projected[0]
+        full = api.list_markets_gamma(session=session, conditional=cache)
+        assert full[0]["description"] == RAW["description"]
+        assert "headers" not in session.get.call_args.kwargs
+
+    def test_scanner_display_and_stats_on_projected_page(self, capsys):
+        """Test the scanner's display, price and stats reads see the same values with projection on."""
+        raw = dict(
+            RAW,
+            condition_id="0xabc",
+            category="Weather",
+            volume="123082232.7",
+            volume_24hr=4521.5,
+            liquidity="800.25",
+            tokens=[{"token_id": "t1", "price": 0.4, "winner": False}, {"token_id": "t2", "price": 0.6, "winner": False}],
+        )
+        module = load_scanner_module()
+
+        def scan(projection):
+            sessions = Mock()
+            sessions.gamma.get.return_value = http_response(200, [raw])
+            scanner = module.PolymarketScanner(sessions=sessions, projection=projection)
+            markets = scanner.get_active_markets(limit=1)
+            capsys.readouterr()
+            scanner.display_market_info(markets[0])
+            stats = (
+                sum(float(m.get("volume_24hr", 0)) for m in markets),
+                sum(float(m.get("liquidity", 0)) for m in markets),
+            )
+            return capsys.readouterr().out, scanner.get_market_prices(markets[0]), stats
+
+        projected = scan(Projection(store=SideStore()))
+        assert projected == scan(None)
+        assert "Total Volume: $123,082,232.70" in projected[0] and "Category: Weather" in projected[0]
+        assert projected[1] == {"Yes": 0.4, "No": 0.6}
+        assert projected[2] == (4521.5, 800.25)
@@ -0,0 +1,101 @@
+"""Tests for per-host rate limiting."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import api
+from src.polymarket_api import PolymarketAPI
+from src.ratelimit import HostRateLimiter, default_limiter, parse_retry_after, set_default_limiter
+from src.transport import PooledAdapter, default_sessions, make_session
+from tests.helpers import FakeClock, http_response
+
+
+class TestHostRateLimiter:
+    """Test suite for HostRateLimiter."""
+
+    def test_buckets_are_per_host(self):
+        """Test each host is paced at its own rate and reservations queue up."""
+        clock = FakeClock()
+        limiter = HostRateLimiter(rates={"a.example": 2.0}, default_rate=1.0, clock=clock)
+        assert limiter.reserve("https://a.example/x") == 0.0
+        assert limiter.reserve("https://a.example/y") == 0.0
+        assert limiter.reserve("https://a.example/z") == 0.5
+        assert limiter.reserve("https://a.example/z") == 1.0
+        assert limiter.reserve("b.example") == 0.0
+        assert limiter.stats == {"requests": 5, "delayed": 2, "throttled": 0}
+
+    def test_retry_after_pauses_host(self):
+        """Test a 429 pauses only its host for the advertised time."""
+        clock = FakeClock()
+        limiter = HostRateLimiter(rates={"a.example": 100.0, "b.example": 100.0}, clock=clock)
+        assert limiter.observe("https://a.example/x", 200, {}) is None
+        assert limiter.observe("https://a.example/x", 503, {}) is None
+        assert limiter.observe("https://a.example/x", 429, {"Retry-After": "3"}) == 3.0
+        assert limiter.reserve("a.example") == 3.0
+        assert limiter.reserve("b.example") == 0.0
+        assert limiter.observe("b.example", 429, {}) == 1.0
+        assert limiter.stats["throttled"] == 2
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds and HTTP-date forms."""
+        now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("2.5") == 2.5
+        assert parse_retry_after("Wed, 01 Jan 2025 12:00:10 GMT", now=now) == 10.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRateLimitedTransport:
+    """Test suite for the rate-limited adapter and clients."""
+
+    def test_adapter_resends_after_429(self):
+        """Test a throttled request waits out Retry-After and is re-sent."""
+        clock = FakeClock()
+        limiter = HostRateLimiter(rates={"clob.polymarket.com": 100.0}, clock=clock, sleep=clock.sleep)
+        session = make_session(limiter=limiter)
+        replies = [http_response(429, headers={"Retry-After": "2"}), http_response(200)]
+        with patch.object(HTTPAdapter, "send", side_effect=lambda *a, **k: replies.pop(0)) as send:
+            response = session.get("https://clob.polymarket.com/book")
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert clock.now == 2.0
+
+    def test_adapter_gives_up_after_max_retries(self):
+        """Test persistent throttling returns the last 429 to the caller."""
+        limiter = HostRateLimiter(clock=FakeClock(), sleep=lambda s: None)
+        adapter = PooledAdapter(limiter=limiter, max_throttle_retries=1)
+        with patch.object(HTTPAdapter, "send", return_value=http_response(429)) as send:
+            response = adapter.send(requests.Request("GET", "https://gamma-api.polymarket.com/markets").prepare())
+        assert response.status_code == 429
+        assert send.call_count == 2
+
+    @patch('src.polymarket_api.requests.Session')
+    def test_client_mounts_limited_adapter(self, mock_session_class):
+        """Test PolymarketAPI routes its session through the given limiter."""
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        limiter = HostRateLimiter()
+        PolymarketAPI(limiter=limiter)
+        adapter = mock_session.mount.call_args_list[0][0][1]
+        assert isinstance(adapter, PooledAdapter)
+        assert adapter.limiter is limiter
+
+    def test_new_default_applies_to_existing_sessions(self):
+        """Test set_default_limiter takes effect after the shared sessions and a client exist."""
+        original = default_limiter()
+        replacement = Mock()
+        replacement.observe.return_value = None
+        client = PolymarketAPI()
+        try:
+            with patch.object(HTTPAdapter, "send", return_value=http_response(200, [])):
+                api.list_markets_gamma(conditional=False)
+                set_default_limiter(replacement)
+                api.list_markets_gamma(conditional=False)
+            replacement.acquire.assert_called_once()
+            assert default_sessions().limiter is replacement
+            assert client.session.get_adapter("https://gamma-api.polymarket.com").limiter is replacement
+        finally:
+            set_default_limiter(original)
@@ -0,0 +1,193 @@
+"""Tests for retries, backoff and circuit breakers."""
+
+import asyncio
+import random
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+import api
+
+from src.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    Resilience,
+    RetryPolicy,
+    cap_timeout,
+    default_resilience,
+    endpoint_key,
+    is_idempotent,
+    set_default_resilience,
+)
+from src.polymarket_api import PolymarketAPI
+from src.transport import PooledAdapter, default_sessions
+from tests.helpers import FakeClock, http_response
+
+
+def _resilience(clock=None, **policy):
+    clock = clock or FakeClock()
+    policy.setdefault("rng", random.Random(0))
+    return Resilience(RetryPolicy(**policy), failure_threshold=3, reset_timeout=10.0, clock=clock, sleep=clock.sleep)
+
+
+class TestRetryPolicy:
+    """Test suite for RetryPolicy and the request helpers."""
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test each delay lies in [0, min(max_delay, base * 2^(n-1))]."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=2.0, rng=random.Random(1))
+        for attempt, cap in ((1, 0.5), (2, 1.0), (3, 2.0), (6, 2.0)):
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0.0 <= d <= cap for d in delays)
+            assert len(set(delays)) > 1
+
+    def test_request_helpers(self):
+        """Test endpoint keys, idempotency and timeout capping."""
+        assert endpoint_key("https://clob.polymarket.com/book?token_id=1") == "clob.polymarket.com/book"
+        assert endpoint_key("https://gamma-api.polymarket.com/markets/123") == "gamma-api.polymarket.com/markets"
+        assert is_idempotent("GET", "https://clob.polymarket.com/book")
+        assert is_idempotent("POST", "https://clob.polymarket.com/prices")
+        assert not is_idempotent("POST", "https://clob.polymarket.com/order")
+        assert cap_timeout(20, 5.0) == 5.0
+        assert cap_timeout((3, 20), 5.0) == (3, 5.0)
+        assert cap_timeout(None, 5.0) == 5.0
+        assert cap_timeout(20, None) == 20
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker."""
+
+    def test_opens_probes_and_closes(self):
+        """Test the closed -> open -> half-open -> closed/open cycle."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        assert breaker.allow() and breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.allow()
+        clock.sleep(5.0)
+        assert breaker.allow() and breaker.state == HALF_OPEN
+        assert not breaker.allow()  # only one probe
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        clock.sleep(5.0)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.failures == 0
+
+    def test_released_probe_can_be_claimed_again(self):
+        """Test a probe given back without a verdict lets the next request probe."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        clock.sleep(5.0)
+        assert breaker.allow() and breaker.state == HALF_OPEN
+        breaker.release()
+        assert breaker.state == OPEN
+        assert breaker.allow() and breaker.state == HALF_OPEN
+
+
+class TestResilience:
+    """Test suite for Resilience."""
+
+    def test_retries_transient_failures(self):
+        """Test a timeout and a 503 are retried until a success."""
+        clock = FakeClock()
+        layer = _resilience(clock)
+        replies = [requests.Timeout("slow"), http_response(503), http_response(200)]
+
+        def send():
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        response = layer.call("https://clob.polymarket.com/prices", send)
+        assert response.status_code == 200
+        assert layer.stats["clob.polymarket.com/prices"] == {"retried": 2, "success": 1}
+        assert clock.now > 0.0
+
+    def test_gives_up_and_does_not_retry_non_idempotent(self):
+        """Test exhausted attempts surface the last error, and POSTs get one try."""
+        layer = _resilience(max_attempts=2)
+        calls = []
+
+        def send():
+            calls.append(1)
+            raise requests.ConnectionError("down")
+
+        with pytest.raises(requests.ConnectionError):
+            layer.call("https://clob.polymarket.com/book", send)
+        assert len(calls) == 2
+        assert layer.call("https://clob.polymarket.com/order", lambda: http_response(500), idempotent=False).status_code == 500
+        assert layer.stats["clob.polymarket.com/order"] == {"failed": 1}
+
+    def test_client_errors_do_not_trip_the_breaker(self):
+        """Test a 404 is returned at once and counts as a healthy response."""
+        layer = _resilience()
+        assert layer.call("https://gamma-api.polymarket.com/markets/x", lambda: http_response(404)).status_code == 404
+        assert layer.breaker("gamma-api.polymarket.com/markets").failures == 0
+
+    def test_open_circuit_fails_fast_per_endpoint(self):
+        """Test a degraded endpoint short-circuits while others keep working."""
+        clock = FakeClock()
+        layer = _resilience(clock, max_attempts=3)
+        assert layer.call("https://clob.polymarket.com/book", lambda: http_response(502)).status_code == 502
+        with pytest.raises(CircuitOpenError):
+            layer.call("https://clob.polymarket.com/book", lambda: http_response(200))
+        assert layer.call("https://clob.polymarket.com/prices", lambda: http_response(200)).status_code == 200
+        assert layer.stats["clob.polymarket.com/book"]["short_circuited"] == 1
+        clock.sleep(10.0)
+        assert layer.call("https://clob.polymarket.com/book", lambda: http_response(200)).status_code == 200
+
+    def test_call_async(self):
+        """Test the async path retries transient errors the same way."""
+        clock = FakeClock()
+        layer = _resilience(clock, base_delay=0.0)
+        replies = [asyncio.TimeoutError(), http_response(200)]
+
+        async def send():
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            reply.status = reply.status_code
+            return reply
+
+        result = asyncio.run(
+            layer.call_async("https://gamma-api.polymarket.com/markets", send, transient=(asyncio.TimeoutError,))
+        )
+        assert result.status == 200
+        assert layer.stats["gamma-api.polymarket.com/markets"] == {"retried": 1, "success": 1}
+
+    def test_adapter_caps_timeout_and_retries(self):
+        """Test the pooled adapter shortens each attempt's timeout and retries a 504."""
+        layer = _resilience(attempt_timeout=4.0)
+        adapter = PooledAdapter(resilience=layer)
+        replies = [http_response(504), http_response(200)]
+        with patch.object(HTTPAdapter, "send", side_effect=lambda *a, **k: replies.pop(0)) as send:
+            request = requests.Request("GET", "https://clob.polymarket.com/book").prepare()
+            response = adapter.send(request, timeout=20)
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert send.call_args.kwargs["timeout"] == 4.0
+
+    def test_new_default_applies_to_existing_sessions(self):
+        """Test set_default_resilience takes effect after the shared sessions and a client exist."""
+        original = default_resilience()
+        replacement = _resilience()
+        client = PolymarketAPI()
+        try:
+            with patch.object(HTTPAdapter, "send", return_value=http_response(200, [])):
+                api.list_markets_gamma(conditional=False)
+                set_default_resilience(replacement)
+                api.list_markets_gamma(conditional=False)
+            assert replacement.stats["gamma-api.polymarket.com/markets"]["success"] == 1
+            assert default_sessions().resilience is replacement
+            assert client.session.get_adapter("https://gamma-api.polymarket.com").resilience is replacement
+        finally:
+            set_default_resilience(original)
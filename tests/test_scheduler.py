@@ -0,0 +1,129 @@
+"""Tests for priority-scheduled re-pricing."""
+
+from src.ratelimit import TokenBucket
+from src.scheduler import RepricingScheduler, ScannerDaemon, interval_for, priority_score
+from tests.helpers import FakeClock, binary_market
+
+
+def _market(cond, volume=0.0, liquidity=0.0, move=0.0):
+    return binary_market(cond, volume24hr=volume, liquidityNum=liquidity, oneHourPriceChange=move)
+
+
+class TestScheduler:
+    """Test suite for the priority score and RepricingScheduler."""
+
+    def test_hot_markets_get_shorter_intervals(self):
+        """Test busier, moving markets score higher and refresh more often."""
+        hot = priority_score(_market("hot", volume=2e6, liquidity=5e5, move=0.04))
+        cold = priority_score(_market("cold", volume=10, liquidity=100))
+        assert 0.0 <= cold < hot <= 1.0
+        assert interval_for(hot) < interval_for(cold)
+        assert interval_for(1.0, 0.5, 300.0) == 0.5
+        assert interval_for(0.0, 0.5, 300.0) == 300.0
+
+    def test_pop_due_and_reschedule(self):
+        """Test markets pop most-overdue first and come back one interval later."""
+        sched = RepricingScheduler()
+        sched.schedule("a", 10.0, due=5.0)
+        sched.schedule("b", 1.0, due=2.0)
+        sched.schedule("c", 1.0, due=50.0)
+        sched.schedule("b", 1.0, due=3.0)  # replaces the earlier entry
+        assert sched.pop_due(now=6.0, limit=10) == ["b", "a"]
+        assert sched.next_due() == 50.0
+        sched.reschedule("a", now=6.0)
+        assert sched.due_of("a") == 16.0
+        sched.remove("c")
+        assert sched.pop_due(now=100.0, limit=10) == ["a"]
+        assert len(sched) == 0
+
+
+class TestScannerDaemon:
+    """Test suite for ScannerDaemon."""
+
+    def test_step_respects_budget_and_batch_size(self):
+        """Test one fetch per budget token, each holding at most batch_size tokens."""
+        clock = FakeClock()
+        calls = []
+
+        def fetch(ids):
+            calls.append(list(ids))
+            return {}
+
+        markets = [_market(f"m{i}") for i in range(5)]
+        daemon = ScannerDaemon(markets, fetch, requests_per_second=2.0, batch_size=4, clock=clock, sleep=clock.sleep)
+        daemon.step()
+        daemon.step()  # budget exhausted
+        assert len(calls) == 1 and len(calls[0]) == 4
+        clock.now += 0.5
+        daemon.step()
+        assert len(calls) == 2
+        assert daemon.stats["requests"] == 2
+        assert daemon.stats["markets_priced"] == 4
+
+    def test_run_emits_events(self):
+        """Test the run loop feeds prices into the detector and reports entries."""
+        clock = FakeClock()
+        events = []
+        prices = {"a-y": {"BUY": "0.40"}, "a-n": {"BUY": "0.50"}, "b-y": {"BUY": "0.60"}, "b-n": {"BUY": "0.45"}}
+        daemon = ScannerDaemon(
+            [_market("a"), _market("b")],
+            lambda ids: {tid: prices[tid] for tid in ids},
+            requests_per_second=1.0,
+            on_event=events.append,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        daemon.run(duration=5.0)
+        assert [(e.kind, e.condition_id) for e in events] == [("enter", "a")]
+        assert daemon.stats["errors"] == 0
+        assert clock.now >= 5.0
+
+    def test_fetch_errors_are_counted(self):
+        """Test a failing fetch is recorded and the markets are rescheduled."""
+        clock = FakeClock()
+
+        def fetch(ids):
+            raise ConnectionError("down")
+
+        daemon = ScannerDaemon([_market("a")], fetch, clock=clock, sleep=clock.sleep)
+        assert daemon.step() == []
+        assert daemon.stats["errors"] == 1
+        assert daemon.scheduler.due_of("a") is not None
+
+    def test_refresh_emits_exit_for_dropped_markets(self):
+        """Test an active opportunity whose market leaves the catalog exits once."""
+        clock = FakeClock()
+        events = []
+        prices = {"a-y": {"BUY": "0.40"}, "a-n": {"BUY": "0.50"}, "b-y": {"BUY": "0.30"}, "b-n": {"BUY": "0.60"}}
+        daemon = ScannerDaemon(
+            [_market("a"), _market("b")],
+            lambda ids: {tid: prices[tid] for tid in ids},
+            on_event=events.append,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        daemon.step()
+        assert sorted(e.condition_id for e in events if e.kind == "enter") == ["a", "b"]
+
+        exits = daemon.refresh_catalog([_market("a"), _market("c")])
+        assert [(e.kind, e.condition_id) for e in exits] == [("exit", "b")]
+        assert events[-1] == exits[0]
+        assert [e.condition_id for e in daemon.detector.opportunities()] == ["a"]
+        assert daemon.stats["events"] == 3
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_refill_and_wait_time(self):
+        """Test tokens refill at the configured rate up to the burst size."""
+        clock = FakeClock()
+        bucket = TokenBucket(4.0, burst=2.0, clock=clock)
+        assert bucket.try_acquire() and bucket.try_acquire()
+        assert not bucket.try_acquire()
+        assert bucket.wait_time() == 0.25
+        bucket.acquire(sleep=clock.sleep)
+        assert clock.now == 0.25
+        clock.now = 100.0
+        assert bucket.wait_time(2.0) == 0.0
+        assert not bucket.try_acquire(3.0)
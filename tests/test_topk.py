@@ -0,0 +1,42 @@
+"""Tests for streaming top-k selection."""
+
+import math
+import random
+
+from src.topk import TopK, TwoSidedTopK
+from src.vectorized import SetEdges
+
+
+class TestTopK:
+    """Test suite for TopK and TwoSidedTopK."""
+
+    def test_matches_full_sort(self):
+        """Test the heap keeps exactly the k largest scores."""
+        random.seed(7)
+        scores = [random.random() for _ in range(500)]
+        top = TopK(10)
+        for i, s in enumerate(scores):
+            top.push(s, i)
+        assert [s for s, _ in top.items()] == sorted(scores, reverse=True)[:10]
+        assert top.threshold() == sorted(scores, reverse=True)[9]
+
+    def test_ignores_nan_and_keeps_first_on_ties(self):
+        """Test NaN scores are skipped and earlier items win ties."""
+        top = TopK(2)
+        assert not top.push(math.nan, "nan")
+        assert top.threshold() == -math.inf
+        top.push(1.0, "first")
+        top.push(1.0, "second")
+        assert not top.push(1.0, "third")
+        assert [item for _, item in top.items()] == ["first", "second"]
+        assert len(top) == 2
+
+    def test_two_sided(self):
+        """Test buy and sell directions are ranked independently."""
+        top = TwoSidedTopK(1)
+        top.push(SetEdges("a", 2, 0.95, 0.90, 0.05, -0.10))
+        top.push(SetEdges("b", 2, 1.10, 1.02, -0.10, 0.02))
+        assert not top.push(SetEdges("c", 2, 0.99, 0.97, 0.01, -0.03))
+        buy, sell = top.snapshot()
+        assert [e.condition_id for e in buy] == ["a"]
+        assert [e.condition_id for e in sell] == ["b"]
@@ -0,0 +1,46 @@
+"""Tests for the pooled HTTP transport."""
+
+import socket
+
+from src import transport
+from src.transport import HostSessions, PooledAdapter, make_session
+
+
+class TestTransport:
+    """Test suite for pooled sessions."""
+
+    def test_adapter_pool_and_keep_alive(self):
+        """Test the adapter sizes its pool and enables TCP keep-alive."""
+        adapter = PooledAdapter(pool_size=32)
+        assert adapter._pool_maxsize == 32
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+        no_keep_alive = PooledAdapter(pool_size=4, keep_alive=False)
+        assert "socket_options" not in no_keep_alive.poolmanager.connection_pool_kw
+
+    def test_make_session_mounts_adapter(self):
+        """Test sessions get the pooled adapter for both schemes."""
+        session = make_session(pool_size=5)
+        assert isinstance(session.get_adapter("https://clob.polymarket.com/book"), PooledAdapter)
+        assert isinstance(session.get_adapter("http://localhost/"), PooledAdapter)
+        assert session.headers.get("Connection") != "close"
+
+    def test_host_sessions_routing(self):
+        """Test one session per host and URL-based lookup."""
+        with HostSessions(pool_size=4, pool_sizes={"clob": 16}) as sessions:
+            assert sessions.for_url("https://clob.polymarket.com/prices") is sessions.clob
+            assert sessions.for_url("https://data-api.polymarket.com/trades") is sessions.data
+            assert sessions.for_url("https://gamma-api.polymarket.com/markets") is sessions.gamma
+            assert sessions.gamma is not sessions.clob
+            assert sessions.clob.get_adapter("https://clob.polymarket.com")._pool_maxsize == 16
+
+    def test_default_sessions_shared(self):
+        """Test the process-wide default is created once and can be replaced."""
+        transport.set_default_sessions(None)
+        first = transport.default_sessions()
+        assert transport.default_sessions() is first
+
+        custom = HostSessions(pool_size=2)
+        transport.set_default_sessions(custom)
+        assert transport.default_sessions() is custom
+        transport.set_default_sessions(None)
@@ -0,0 +1,88 @@
+"""Tests for the array-backed per-market sums."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.models import Token
+from src.vectorized import TokenGroups, market_set_edges, rank, segment_sums, sum_by_market, two_sided_edges
+
+
+def _groups():
+    tokens = [
+        {"condition_id": "a", "token_id": "a1", "closed": False},
+        {"condition_id": "b", "token_id": "b1", "closed": False},
+        {"condition_id": "a", "token_id": "a2", "closed": False},
+        {"condition_id": "c", "token_id": "c1", "closed": False},
+        {"condition_id": "d", "token_id": "d1", "closed": True},
+        Token("b2", "b"),
+    ]
+    return TokenGroups.from_tokens(tokens)
+
+
+class TestVectorized:
+    """Test suite for TokenGroups and segmented sums."""
+
+    def test_grouping_is_contiguous(self):
+        """Test tokens are laid out per market with int32 codes."""
+        groups = _groups()
+        assert groups.condition_ids == ["a", "b", "c"]
+        assert groups.token_ids == ["a1", "a2", "b1", "b2", "c1"]
+        assert groups.codes.dtype == np.int32
+        assert groups.codes.tolist() == [0, 0, 1, 1, 2]
+        assert groups.offsets.tolist() == [0, 2, 4]
+
+    def test_segment_sums_nan_aware(self):
+        """Test sums skip missing prices and are NaN only when nothing is priced."""
+        groups = _groups()
+        price_map = {"a1": {"BUY": "0.4"}, "a2": {"BUY": "0.5"}, "b1": {"BUY": "0.7"}, "b2": {"BUY": None}}
+        prices = groups.prices_from_map(price_map)
+        sums, n_priced = segment_sums(groups, prices)
+        assert np.allclose(sums[:2], [0.9, 0.7])
+        assert math.isnan(sums[2])
+        assert n_priced.tolist() == [2, 1, 0]
+
+    def test_rank_and_top_k(self):
+        """Test ranking puts NaN last and k-selection matches the full sort."""
+        values = np.array([0.9, np.nan, 0.2, 1.3, 0.5])
+        assert rank(values).tolist() == [2, 4, 0, 3, 1]
+        assert rank(values, k=2).tolist() == [2, 4]
+        assert rank(values, k=2, descending=True).tolist() == [3, 0]
+
+    def test_sum_by_market_matches_tuple_shape(self):
+        """Test output mirrors api.sum_yes_by_market tuples, NaN for partly priced markets."""
+        groups = _groups()
+        prices = np.array([0.4, 0.5, 0.7, np.nan, np.nan])
+        result = sum_by_market(groups, prices)
+        assert [r[0] for r in result] == ["a", "b", "c"]
+        assert result[0][1] == 2
+        assert result[0][2] == pytest.approx(0.9)
+        assert math.isnan(result[1][2]) and math.isnan(result[2][2])
+
+    def test_two_sided_edges(self):
+        """Test buy-set and sell-set edges from one two-sided price map."""
+        groups = _groups()
+        price_map = {
+            "a1": {"BUY": "0.45", "SELL": "0.44"},
+            "a2": {"BUY": "0.50", "SELL": "0.49"},
+            "b1": {"BUY": "0.64", "SELL": "0.62"},
+            "b2": {"BUY": "0.47", "SELL": "0.45"},
+            "c1": {"BUY": "0.99"},
+        }
+        edges = two_sided_edges(groups, price_map)
+        assert [e.condition_id for e in edges] == ["b", "a", "c"]
+        assert edges[0].sell_edge == pytest.approx(0.07)
+        assert edges[1].buy_edge == pytest.approx(0.05)
+        assert math.isnan(edges[2].sell_edge)
+        assert edges[2].buy_edge == pytest.approx(0.01)
+
+    def test_market_set_edges_matches_batch(self):
+        """Test single-market edges agree with the array path."""
+        groups = _groups()
+        price_map = {"a1": {"BUY": "0.45", "SELL": "0.44"}, "a2": {"BUY": "0.50"}}
+        edges = market_set_edges(groups, 0, price_map)
+        assert edges.condition_id == "a"
+        assert edges.buy_edge == pytest.approx(0.05)
+        assert math.isnan(edges.sell_edge)
+        assert edges.sum_bid == pytest.approx(0.44)